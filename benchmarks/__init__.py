@@ -0,0 +1,13 @@
+"""
+Benchmarks für den Simulationskern.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.run                 # Messen und mit baseline.json vergleichen
+    python -m benchmarks.run --quick         # Kurzlauf
+    python -m benchmarks.run --update-baseline  # Baseline für diese Maschine neu schreiben
+    python -m benchmarks.run --check-engines    # zusätzlich Python- und NumPy-Engine vergleichen
+    python -m benchmarks.checks                 # Konsistenzprüfungen ohne Zeitmessung
+
+baseline.json ist maschinenabhängig (absolute Werte); Hinweise zum Neuanlegen
+in benchmarks/run.py.
+"""
@@ -0,0 +1,125 @@
+"""
+Konsistenzprüfungen für den Simulationskern (ohne Zeitmessung).
+
+Prüft Eigenschaften, die keine Laufzeit-Regression sind, aber von
+Optimierungen leicht unbemerkt gebrochen werden. Aufruf aus dem
+Projektverzeichnis:
+
+    python -m benchmarks.checks
+
+Endet mit Exit-Code 1, wenn eine Prüfung fehlschlägt.
+"""
+
+import pickle
+import sys
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from benchmarks.scenarios import SEED, make_field
+from headless import simulate_race
+from monte_carlo import run_monte_carlo
+from ranking import RankingTracker
+from strecken import get_all_tracks, get_track
+from telemetry import NoTelemetry
+
+
+def check_track_pickle() -> Optional[str]:
+    """Strecken müssen sich auch nach einem Rennen (kompilierter Segment-Index) picklen lassen."""
+    horses = make_field(4)
+    for track in get_all_tracks():
+        simulate_race(horses, track, seed=SEED, telemetry_policy=NoTelemetry())
+        try:
+            restored = pickle.loads(pickle.dumps(track))
+        except Exception as exc:
+            return f"{track.name}: {exc}"
+        position = track.length / 2
+        if restored.get_segment_info(position).modifiers != track.get_segment_info(position).modifiers:
+            return f"{track.name}: Segment-Index nach pickle verändert"
+    return None
+
+
+def check_monte_carlo_workers() -> Optional[str]:
+    """Mehrere Prozesse nach einem vorherigen Rennen liefern dasselbe wie ein Prozess."""
+    horses = make_field(5)
+    track = get_track('sandbahn')
+    simulate_race(horses, track, seed=SEED, telemetry_policy=NoTelemetry())
+
+    def odds(workers: int):
+        result = run_monte_carlo(horses, track, races=6, seed=SEED, workers=workers, chunk_size=2)
+        return [(o.name, o.position_histogram, o.mean_finish_time) for o in result.odds]
+
+    try:
+        parallel = odds(2)
+    except Exception as exc:
+        return f"workers=2: {exc!r}"
+    if parallel != odds(1):
+        return "workers=2 weicht von workers=1 ab"
+    return None
+
+
+def check_ranking(trials: int = 500, steps: int = 20) -> Optional[str]:
+    """
+    RankingTracker.update und update_running gegen eine stabile Vollsortierung.
+
+    Zufällige Felder mit vielen Gleichständen (ganzzahlige Positionen) und
+    Pferden, die unterwegs ins Ziel kommen.
+    """
+    rng = np.random.default_rng(SEED)
+    for trial in range(trials):
+        n = int(rng.integers(1, 40))
+        positions = rng.integers(0, 8, n).astype(np.float64)
+        finished = np.zeros(n, dtype=bool)
+        vectorized, incremental = RankingTracker(n), RankingTracker(n)
+        vectorized.reset(positions, finished)
+        incremental.reset(positions, finished)
+        expected = np.argsort(-positions, kind='stable')
+
+        for step in range(steps):
+            positions = positions + rng.integers(0, 3, n) * (rng.random(n) < 0.3)
+            newly_finished = (rng.random(n) < 0.05) & ~finished
+            finished |= newly_finished
+            # Referenz: Reihenfolge des letzten Schritts stabil nach neuer Position
+            expected = expected[~finished[expected]]
+            expected = expected[np.argsort(-positions[expected], kind='stable')]
+
+            vectorized.update(positions, finished)
+            incremental.update_running(positions.tolist(), np.flatnonzero(newly_finished).tolist())
+            for name, tracker in (('update', vectorized), ('update_running', incremental)):
+                if not np.array_equal(tracker.order, expected):
+                    return f"{name}: Reihenfolge weicht ab (Versuch {trial}, Schritt {step})"
+                if not np.array_equal(tracker.ranks[expected], np.arange(1, len(expected) + 1)):
+                    return f"{name}: Plätze weichen ab (Versuch {trial}, Schritt {step})"
+            if incremental.rank_list != incremental.ranks.tolist():
+                return f"rank_list veraltet (Versuch {trial}, Schritt {step})"
+    return None
+
+
+CHECKS: List[Tuple[str, Callable[[], Optional[str]]]] = [
+    ('ranking', check_ranking),
+    ('track_pickle', check_track_pickle),
+    ('monte_carlo_workers', check_monte_carlo_workers),
+]
+
+
+def run_checks(log: Callable[[str], None] = print) -> List[str]:
+    """Führt alle Prüfungen aus und gibt die Fehlschläge als Text zurück."""
+    failures = []
+    for name, check in CHECKS:
+        error = check()
+        log(f"  {name:<24}{'ok' if error is None else 'FEHLER'}")
+        if error is not None:
+            failures.append(f"{name}: {error}")
+    return failures
+
+
+def main() -> int:
+    print("Prüfungen laufen:")
+    failures = run_checks()
+    for line in failures:
+        print(f"  {line}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
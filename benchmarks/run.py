@@ -0,0 +1,178 @@
+"""
+Kommandozeile der Benchmark-Suite.
+
+Misst alle Szenarien, schreibt die Ergebnisse als JSON und vergleicht sie
+mit der gespeicherten Baseline. Verschlechtert sich ein Wert um mehr als
+die Toleranz, endet der Lauf mit Exit-Code 1.
+
+Mit --check-engines wird zusätzlich geprüft, ob die Python- und die
+NumPy-Engine statistisch dieselben Rennen liefern (headless.engine_agreement).
+
+Die Baseline enthält absolute Messwerte und gilt nur für die Maschine, auf
+der sie entstanden ist. Auf einem neuen Rechner (oder nach Wechsel von
+Python-/NumPy-Version bzw. nach gewollten Leistungsänderungen) zuerst auf
+dem unveränderten Stand
+
+    python -m benchmarks.run --update-baseline
+
+ausführen und erst danach die Änderung messen. Weicht die Umgebung im
+Bericht von der in der Baseline ab, weist der Vergleich darauf hin.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.scenarios import SEED, make_field, run_all
+from headless import engine_agreement
+from strecken import get_track
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_TOLERANCE = 0.25
+
+# Engine-Vergleich: Feldgröße und Rennen je Engine (Voll- / Kurzlauf)
+ENGINE_CHECK_FIELD_SIZE = 10
+ENGINE_CHECK_RACES = 40
+ENGINE_CHECK_RACES_QUICK = 15
+
+
+def build_report(results, quick: bool) -> Dict:
+    """Maschinenlesbarer Bericht mit Umgebungsangaben."""
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': {name: measurement.to_dict() for name, measurement in results.items()},
+    }
+
+
+# Umgebungsangaben, die zur Baseline passen müssen, damit der Vergleich aussagekräftig ist
+ENVIRONMENT_KEYS = ('platform', 'python', 'numpy')
+
+
+def relative_change(reference: float, current: float) -> Optional[float]:
+    """Relative Änderung gegenüber der Baseline (None, wenn die Baseline 0 ist)."""
+    if reference == 0:
+        return 0.0 if current == 0 else None
+    return current / reference - 1.0
+
+
+def environment_differences(report: Dict, baseline: Dict) -> List[str]:
+    """Umgebungsangaben, in denen sich Bericht und Baseline unterscheiden."""
+    current, reference = report['meta'], baseline.get('meta', {})
+    return [
+        f"{key}: {reference.get(key)} -> {current.get(key)}"
+        for key in ENVIRONMENT_KEYS if reference.get(key) != current.get(key)
+    ]
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Vergleicht einen Bericht mit der Baseline.
+
+    Returns:
+        Liste der Regressionen als Text (leer = keine)
+    """
+    regressions = []
+    print(f"\n{'Szenario':<24}{'Baseline':>16}{'Aktuell':>16}{'Änderung':>11}")
+    for name, current in report['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            print(f"{name:<24}{'-':>16}{current['value']:>16.4g}{'neu':>11}")
+            continue
+
+        change = relative_change(reference['value'], current['value'])
+        if change is None:
+            # Ohne Bezugswert keine relative Änderung; nur anzeigen
+            print(f"{name:<24}{reference['value']:>16.4g}{current['value']:>16.4g}{'Basis 0':>11}")
+            continue
+        worse = -change if current['higher_is_better'] else change
+        marker = ' !' if worse > tolerance else ''
+        print(f"{name:<24}{reference['value']:>16.4g}{current['value']:>16.4g}{change:>+10.1%}{marker}")
+        if worse > tolerance:
+            regressions.append(f"{name}: {reference['value']:.4g} -> {current['value']:.4g} {current['unit']}")
+
+        if reference['peak_memory_bytes'] and current['peak_memory_bytes'] > reference['peak_memory_bytes'] * (1 + tolerance):
+            regressions.append(
+                f"{name}: Spitzenspeicher {reference['peak_memory_bytes']} -> {current['peak_memory_bytes']} Bytes"
+            )
+    return regressions
+
+
+def check_engines(quick: bool) -> bool:
+    """Vergleicht die Engines auf der Rennbahn; True, wenn sie übereinstimmen."""
+    races = ENGINE_CHECK_RACES_QUICK if quick else ENGINE_CHECK_RACES
+    print(f"\nEngine-Vergleich ({ENGINE_CHECK_FIELD_SIZE} Pferde, {races} Rennen je Engine) ...")
+    agreement = engine_agreement(make_field(ENGINE_CHECK_FIELD_SIZE), get_track('rennbahn'),
+                                 races=races, seed=SEED)
+    for engine, mean in agreement.mean_finish_time.items():
+        print(f"  {engine:<8} Zielzeit Ø {mean:8.2f} s   Verletzungsquote {agreement.injury_rate[engine]:6.1%}")
+    print(f"  max. z Zielzeit {agreement.max_z_finish_time:.2f}, Platzierung {agreement.max_z_position:.2f}"
+          f" (Grenze {agreement.z_limit:.1f})")
+    if not agreement.agrees:
+        print("  Engines weichen voneinander ab!")
+    return agreement.agrees
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks für den Simulationskern")
+    parser.add_argument('--quick', action='store_true', help="Kurzlauf mit weniger Wiederholungen")
+    parser.add_argument('--output', help="Ergebnisse zusätzlich in diese JSON-Datei schreiben")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline-Datei zum Vergleich")
+    parser.add_argument('--update-baseline', action='store_true', help="Ergebnisse als neue Baseline speichern")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Erlaubte Verschlechterung als Anteil (Standard 0.25)")
+    parser.add_argument('--check-engines', action='store_true',
+                        help="Zusätzlich prüfen, ob beide Engines statistisch übereinstimmen")
+    args = parser.parse_args(argv)
+
+    engines_agree = check_engines(args.quick) if args.check_engines else True
+
+    print("Benchmarks laufen:")
+    report = build_report(run_all(quick=args.quick), args.quick)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline gespeichert: {args.baseline}")
+        return 0 if engines_agree else 1
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(report, indent=2))
+        print("Keine Baseline vorhanden (--update-baseline zum Anlegen)")
+        return 0 if engines_agree else 1
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    differences = environment_differences(report, baseline)
+    if differences:
+        print("\nHinweis: Die Baseline stammt aus einer anderen Umgebung, Werte sind nur bedingt vergleichbar:")
+        for line in differences:
+            print(f"  {line}")
+        print("  Baseline auf dieser Maschine mit --update-baseline neu anlegen.")
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print("\nRegressionen:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nKeine Regressionen.")
+    return 0 if engines_agree else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Messszenarien für den Simulationskern.
+
+Jedes Szenario liefert eine Messung (Wert, Einheit, Richtung). Zeitmessung
+und Speichermessung laufen getrennt, da tracemalloc die Laufzeit deutlich
+verfälscht: erst wird ohne Tracing gemessen, danach wird derselbe Lauf
+einmal mit tracemalloc wiederholt, um den Spitzenverbrauch zu bestimmen.
+"""
+
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from pferde.horse import Horse, create_random_horse
+from strecken import get_track, AVAILABLE_TRACKS
+from headless import create_simulation, run_to_completion
+from monte_carlo import run_monte_carlo
+
+# Feldgrößen für Durchsatz und Monte-Carlo
+TICK_FIELD_SIZES = (10, 100, 1000)
+MONTE_CARLO_FIELD_SIZES = (10, 100, 1000, 10000)
+
+# Simulierte Rennen je Feldgröße (Voll- / Kurzlauf)
+MONTE_CARLO_RACES = {10: 200, 100: 20, 1000: 4, 10000: 2}
+MONTE_CARLO_RACES_QUICK = {10: 20, 100: 4, 1000: 1, 10000: 1}
+
+TICKS = 600
+SEED = 1234
+
+
+@dataclass
+class Measurement:
+    """Ergebnis eines Szenarios."""
+    value: float
+    unit: str
+    higher_is_better: bool
+    peak_memory_bytes: int = 0
+    repeats: int = 1
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def make_field(size: int, seed: int = SEED) -> List[Horse]:
+    """Reproduzierbares Starterfeld mit eindeutigen Namen."""
+    rng = np.random.default_rng(seed)
+    return [create_random_horse(name=f"Pferd {i}", rng=rng) for i in range(size)]
+
+
+def _best_time(run: Callable[[], object], repeats: int, setup: Callable[[], object] = None) -> float:
+    """Kürzeste Laufzeit aus mehreren Wiederholungen in Sekunden (setup wird nicht gemessen)."""
+    best = float('inf')
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(run: Callable[[], object]) -> int:
+    """Spitzenverbrauch eines Laufs in Bytes (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def tick_throughput(size: int, engine: str, repeats: int) -> Measurement:
+    """Pferde-Ticks pro Sekunde für eine feste Zahl Simulationsschritte ab Start."""
+    horses = make_field(size)
+    track = get_track('rennbahn')
+    simulation = create_simulation(horses, track, engine, seed=SEED)
+
+    def run():
+        for _ in range(TICKS):
+            simulation.tick(simulation.time_step)
+
+    # Aufbau und Rennstart gehören nicht zum gemessenen Durchsatz
+    seconds = _best_time(run, repeats, setup=simulation.start)
+    simulation.start()
+    return Measurement(size * TICKS / seconds, 'horse_ticks/s', True, _peak_memory(run), repeats)
+
+
+def full_race(track_id: str, repeats: int, size: int = 10) -> Measurement:
+    """Laufzeit eines kompletten Rennens (Standardfeld, Python-Engine)."""
+    horses = make_field(size)
+    track = get_track(track_id)
+
+    def run():
+        run_to_completion(create_simulation(horses, track, 'python', seed=SEED))
+
+    seconds = _best_time(run, repeats)
+    return Measurement(seconds, 's', False, _peak_memory(run), repeats)
+
+
+def monte_carlo_rate(size: int, races: int) -> Measurement:
+    """Monte-Carlo-Rennen pro Sekunde (ein Prozess, Engine nach Feldgröße)."""
+    horses = make_field(size)
+    track = get_track('rennbahn')
+
+    def run(count=races):
+        run_monte_carlo(horses, track, races=count, seed=SEED, workers=1, engine='auto')
+
+    seconds = _best_time(run, 1)
+    # Speicher mit einem einzelnen Rennen messen, der Verlauf je Rennen ist gleich
+    return Measurement(races / seconds, 'races/s', True, _peak_memory(lambda: run(1)), 1)
+
+
+def run_all(quick: bool = False, log: Callable[[str], None] = print) -> Dict[str, Measurement]:
+    """Führt alle Szenarien aus und gibt die Messungen nach Namen zurück."""
+    repeats = 3 if quick else 5
+    results: Dict[str, Measurement] = {}
+
+    def measure(name: str, scenario: Callable[[], Measurement]):
+        log(f"  {name} ...")
+        results[name] = scenario()
+
+    for size in TICK_FIELD_SIZES:
+        for engine in ('python', 'numpy'):
+            measure(f"tick/{engine}/{size}", lambda: tick_throughput(size, engine, repeats))
+
+    for track_id in AVAILABLE_TRACKS:
+        measure(f"race/{track_id}", lambda: full_race(track_id, repeats))
+
+    races = MONTE_CARLO_RACES_QUICK if quick else MONTE_CARLO_RACES
+    for size in MONTE_CARLO_FIELD_SIZES:
+        measure(f"monte_carlo/{size}", lambda: monte_carlo_rate(size, races[size]))
+
+    return results
@@ -0,0 +1,67 @@
+"""
+Vorspulen einer laufenden Simulation im Hintergrund.
+
+Beim "Sofort beenden" wird das Rennen in einem eigenen Thread mit
+RaceSimulation.fast_forward() zu Ende gerechnet, während die Ereignisschleife
+weiterläuft und den Fortschritt anzeigt. Solange der Thread läuft, darf die
+Anzeige nicht auf die Simulation zugreifen.
+"""
+
+import threading
+from typing import List, Optional
+
+from simulation import RaceSimulation, RaceResult
+
+
+class FastForward:
+    """Rechnet eine Simulation in einem Hintergrund-Thread zu Ende."""
+
+    def __init__(self, simulation: RaceSimulation, record_telemetry: bool = True):
+        self.simulation = simulation
+        self.record_telemetry = record_telemetry
+        self.progress = simulation.get_race_progress()  # 0-1, vom Thread aktualisiert
+        self.results: Optional[List[RaceResult]] = None
+        self.error: Optional[BaseException] = None
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="fast-forward", daemon=True)
+
+    def start(self) -> 'FastForward':
+        """Startet das Vorspulen."""
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.results = self.simulation.fast_forward(
+                on_progress=self._set_progress,
+                record_telemetry=self.record_telemetry,
+                should_stop=self._cancel.is_set
+            )
+        except BaseException as exc:  # Fehler an den UI-Thread weiterreichen
+            self.error = exc
+
+    def _set_progress(self, progress: float):
+        self.progress = progress
+
+    @property
+    def done(self) -> bool:
+        """True sobald der Thread beendet ist (fertig, abgebrochen oder Fehler)."""
+        return not self._thread.is_alive()
+
+    @property
+    def finished(self) -> bool:
+        """True wenn das Rennen vollständig zu Ende gerechnet wurde."""
+        return self.done and self.results is not None
+
+    def cancel(self, wait: bool = True):
+        """Bricht das Vorspulen nach dem aktuellen Schritt ab."""
+        self._cancel.set()
+        if wait and self._thread.is_alive():
+            self._thread.join()
+
+    def join(self, timeout: Optional[float] = None) -> Optional[List[RaceResult]]:
+        """Wartet auf das Ende und gibt die Ergebnisse zurück (Fehler werden weitergeworfen)."""
+        self._thread.join(timeout)
+        if self.error is not None:
+            raise self.error
+        return self.results
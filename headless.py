@@ -0,0 +1,186 @@
+"""
+Headless-Schnittstelle für Batch-Simulationen.
+
+Führt Rennen ohne Pygame, Fenster oder Bildrate mit festen Zeitschritten
+bis zum Ende durch. Grundlage für Offline-Auswertungen auf Servern ohne
+Display. Importiert bewusst nichts aus dem ui-Paket.
+
+Beispiel:
+    from headless import simulate_race
+    from strecken import get_track
+    results = simulate_race(horses, get_track('rennbahn'), seed=42)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from pferde.horse import Horse
+from strecken.base_track import Track
+from simulation import RaceSimulation, RaceResult, FIXED_TIME_STEP
+from telemetry import NoTelemetry, SamplingPolicy
+from vector_simulation import VectorizedRaceSimulation
+
+# Derselbe feste Zeitschritt wie in der interaktiven Anwendung, damit
+# Batch-Ergebnisse mit den Rennen im Spiel vergleichbar sind
+DEFAULT_TIME_STEP = FIXED_TIME_STEP
+
+ENGINES = {
+    'python': RaceSimulation,
+    'numpy': VectorizedRaceSimulation,
+}
+
+# Ab dieser Feldgröße ist die vektorisierte Engine pro Schritt schneller;
+# darunter überwiegt der feste NumPy-Aufwand je Schritt. Der Wechsel ist
+# nur zulässig, solange engine_agreement() keine Abweichung findet
+NUMPY_MIN_FIELD_SIZE = 50
+
+# Größter erlaubter z-Wert, ab dem sich die Engines für ein Pferd
+# signifikant unterscheiden (Mittelwerte über viele Rennen)
+AGREEMENT_Z_LIMIT = 4.0
+
+
+def select_engine(field_size: int) -> str:
+    """Wählt die für die Feldgröße schnellste Engine."""
+    return 'numpy' if field_size >= NUMPY_MIN_FIELD_SIZE else 'python'
+
+
+def create_simulation(horses: List[Horse], track: Track, engine: str = 'python',
+                      seed: Optional[int] = None, time_step: float = DEFAULT_TIME_STEP,
+                      telemetry_policy: Optional[SamplingPolicy] = None) -> RaceSimulation:
+    """
+    Erstellt eine Simulation mit der gewünschten Engine.
+
+    Args:
+        engine: 'python' (Pferd für Pferd), 'numpy' (vektorisiert) oder
+                'auto' (nach Feldgröße)
+        seed: Startwert für den Zufallsgenerator des Rennens
+        time_step: Fester Zeitschritt pro Simulationsschritt
+        telemetry_policy: Wann Telemetrie aufgezeichnet wird (None = Standard der Simulation)
+    """
+    if engine == 'auto':
+        engine = select_engine(len(horses))
+    if engine not in ENGINES:
+        raise ValueError(f"Unbekannte Engine: {engine}")
+    return ENGINES[engine](horses, track, seed, time_step, telemetry_policy)
+
+
+def run_to_completion(simulation: RaceSimulation) -> List[RaceResult]:
+    """Startet die Simulation und rechnet sie mit festen Schritten bis zum Rennende."""
+    simulation.start()
+    while simulation.step():
+        pass
+    return simulation.results
+
+
+def simulate_race(horses: List[Horse], track: Track, seed: Optional[int] = None,
+                  time_step: float = DEFAULT_TIME_STEP, engine: str = 'python',
+                  telemetry_policy: Optional[SamplingPolicy] = None) -> List[RaceResult]:
+    """
+    Simuliert ein einzelnes Rennen ohne Anzeige.
+
+    Args:
+        horses: Startfeld (der Zustand der Pferde wird zurückgesetzt)
+        track: Strecke
+        seed: Startwert für den Zufallsgenerator (None = nicht reproduzierbar)
+        time_step: Fester Zeitschritt pro Tick in Sekunden
+        engine: 'python', 'numpy' oder 'auto'
+        telemetry_policy: Sampling der Telemetrie, z.B. NoTelemetry() wenn nur
+                          die Zielreihenfolge gebraucht wird
+
+    Returns:
+        Ergebnisliste in Zielreihenfolge
+    """
+    simulation = create_simulation(horses, track, engine, seed, time_step, telemetry_policy)
+    return run_to_completion(simulation)
+
+
+def simulate_many(horses: List[Horse], track: Track, races: int, seed: Optional[int] = None,
+                  time_step: float = DEFAULT_TIME_STEP, engine: str = 'python',
+                  telemetry_policy: Optional[SamplingPolicy] = None) -> List[List[RaceResult]]:
+    """
+    Simuliert mehrere Rennen mit demselben Startfeld nacheinander.
+
+    Jedes Rennen erhält einen eigenen, aus `seed` abgeleiteten Startwert.
+
+    Returns:
+        Eine Ergebnisliste pro Rennen
+    """
+    race_seeds = np.random.default_rng(seed).integers(0, 2 ** 63, size=races)
+    return [
+        simulate_race(horses, track, seed=int(race_seed), time_step=time_step, engine=engine,
+                      telemetry_policy=telemetry_policy)
+        for race_seed in race_seeds
+    ]
+
+
+@dataclass
+class EngineAgreement:
+    """Statistischer Vergleich der Engines über dieselben Rennen-Seeds."""
+    races: int
+    mean_finish_time: Dict[str, float]    # Mittlere Zielzeit des Feldes je Engine
+    injury_rate: Dict[str, float]         # Anteil verletzter Pferde je Engine
+    max_z_finish_time: float              # Größter z-Wert der mittleren Zielzeit eines Pferdes
+    max_z_position: float                 # Größter z-Wert der mittleren Platzierung eines Pferdes
+    z_limit: float = AGREEMENT_Z_LIMIT
+
+    @property
+    def agrees(self) -> bool:
+        return max(self.max_z_finish_time, self.max_z_position) <= self.z_limit
+
+
+def _max_z(first: np.ndarray, second: np.ndarray) -> float:
+    """Größter Welch-z-Wert der Spaltenmittelwerte zweier Stichproben (Rennen x Pferde)."""
+    difference = np.abs(first.mean(axis=0) - second.mean(axis=0))
+    error = np.sqrt(first.var(axis=0, ddof=1) / len(first) + second.var(axis=0, ddof=1) / len(second))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(error > 0, difference / error, np.where(difference > 0, np.inf, 0.0))
+    return float(z.max())
+
+
+def engine_agreement(horses: List[Horse], track: Track, races: int = 40, seed: Optional[int] = None,
+                     time_step: float = DEFAULT_TIME_STEP,
+                     z_limit: float = AGREEMENT_Z_LIMIT) -> EngineAgreement:
+    """
+    Prüft, ob 'python' und 'numpy' dieselben Verteilungen liefern.
+
+    Die Engines ziehen ihre Zufallszahlen in unterschiedlicher Reihenfolge und
+    stimmen daher nicht Lauf für Lauf überein. Verglichen werden deshalb die
+    mittlere Zielzeit und Platzierung jedes Pferdes über `races` Rennen mit
+    denselben abgeleiteten Seeds. Da select_engine() ab NUMPY_MIN_FIELD_SIZE
+    stillschweigend wechselt, gehört dieser Vergleich zu jeder Änderung an
+    einer der beiden Engines.
+
+    Returns:
+        EngineAgreement; agrees ist False, wenn ein Pferd um mehr als
+        z_limit Standardfehler abweicht
+    """
+    index = {id(horse): i for i, horse in enumerate(horses)}
+    finish_times: Dict[str, np.ndarray] = {}
+    positions: Dict[str, np.ndarray] = {}
+    injuries: Dict[str, float] = {}
+    for engine in ENGINES:
+        results = simulate_many(horses, track, races, seed=seed, time_step=time_step, engine=engine,
+                                telemetry_policy=NoTelemetry())
+        times = np.empty((races, len(horses)))
+        places = np.empty((races, len(horses)))
+        injured = 0
+        for race, race_results in enumerate(results):
+            for result in race_results:
+                column = index[id(result.horse)]
+                times[race, column] = result.finish_time
+                places[race, column] = result.position
+                injured += result.was_injured
+        finish_times[engine] = times
+        positions[engine] = places
+        injuries[engine] = injured / (races * len(horses))
+
+    return EngineAgreement(
+        races=races,
+        mean_finish_time={engine: float(times.mean()) for engine, times in finish_times.items()},
+        injury_rate=injuries,
+        max_z_finish_time=_max_z(finish_times['python'], finish_times['numpy']),
+        max_z_position=_max_z(positions['python'], positions['numpy']),
+        z_limit=z_limit,
+    )
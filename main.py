@@ -18,6 +18,7 @@ Autoren: Simulationsprojekt-Team
 Datum: Januar 2026
 """
 
+import logging
 import pygame
 import sys
 import time
@@ -27,7 +28,13 @@ from typing import Optional, List
 from pferde.horse import Horse, create_random_horse, create_custom_horse
 from strecken import get_all_tracks, get_track
 from simulation import RaceSimulation
+from headless import create_simulation
+from fast_forward import FastForward
+from telemetry import EveryInterval
 from ui import MainMenu, TrackSelectionMenu, HorseCreatorMenu, RaceUI, ResultsScreen, DetailedAnalysisScreen
+from ui.perf_overlay import FrameTimer, PerformanceOverlay
+
+logger = logging.getLogger(__name__)
 
 
 class HorseRaceApp:
@@ -38,6 +45,9 @@ class HorseRaceApp:
     SCREEN_HEIGHT = 700
     FPS = 60
     
+    # Rennanzeige: nur geänderte Bildschirmbereiche neu zeichnen und übertragen
+    DIRTY_RECTS = True
+    
     def __init__(self):
         """Initialisiert Pygame und die Anwendung."""
         pygame.init()
@@ -56,6 +66,7 @@ class HorseRaceApp:
         self.custom_horse: Optional[Horse] = None
         self.horses: List[Horse] = []
         self.simulation: Optional[RaceSimulation] = None
+        self.fast_forward: Optional[FastForward] = None
         self.results = None
         
         # UI-Komponenten
@@ -68,6 +79,10 @@ class HorseRaceApp:
         
         # Zeitmessung
         self.last_time = time.time()
+        
+        # Leistungsanzeige (F3)
+        self.frame_timer = FrameTimer()
+        self.perf_overlay = PerformanceOverlay(self.frame_timer)
     
     def run(self):
         """Hauptschleife der Anwendung."""
@@ -76,15 +91,35 @@ class HorseRaceApp:
             current_time = time.time()
             delta_time = current_time - self.last_time
             self.last_time = current_time
+            self.frame_timer.begin_frame()
             
             # Events verarbeiten
             self._handle_events()
+            self.frame_timer.lap('events')
             
             # Zustand aktualisieren und zeichnen
             self._update(delta_time)
+            self.frame_timer.lap('draw')
+            
+            # Während des Rennens nur die geänderten Bereiche übertragen
+            dirty = None
+            if self.state == 'racing' and self.race_ui and not self.fast_forward:
+                dirty = self.race_ui.take_dirty_rects()
+            
+            overlay_rect = self.perf_overlay.draw(self.screen)
+            if overlay_rect and dirty is not None:
+                # Die Anzeige liegt über dem Rennen und wird im nächsten Frame wieder abgetragen
+                dirty.append(overlay_rect)
+                self.race_ui.mark_dirty(overlay_rect)
+            self.frame_timer.lap('overlay')
             
             # Display aktualisieren
-            pygame.display.flip()
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            self.frame_timer.lap('flip')
+            self.frame_timer.end_frame()
             self.clock.tick(self.FPS)
         
         pygame.quit()
@@ -94,9 +129,14 @@ class HorseRaceApp:
         """Verarbeitet alle Pygame-Events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self._cancel_fast_forward()
                 self.running = False
                 return
             
+            # F3 blendet die Leistungsanzeige in jedem Zustand ein/aus
+            if self.perf_overlay.handle_event(event):
+                continue
+            
             if self.state == 'menu':
                 result = self.main_menu.handle_event(event)
                 if result == 'quit':
@@ -127,6 +167,13 @@ class HorseRaceApp:
                     self.state = 'track_select'
             
             elif self.state == 'racing':
+                if self.fast_forward:
+                    # Während des Vorspulens nur Abbrechen zulassen
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                        self._cancel_fast_forward()
+                        self.state = 'menu'
+                        self.custom_horse = None
+                    continue
                 result = self.race_ui.handle_event(event)
                 if result == 'quit':
                     self.state = 'menu'
@@ -172,29 +219,46 @@ class HorseRaceApp:
         elif self.state == 'racing':
             # Prüfen ob "Sofort beenden" geklickt wurde
             if self.race_ui and self.race_ui.skip_to_end:
-                # Simulation mit hoher Geschwindigkeit zu Ende bringen
-                while self.simulation.tick(0.1):  # Schnelle Ticks bis fertig
-                    pass
+                # Simulation mit denselben festen Schritten im Hintergrund zu Ende bringen
                 self.race_ui.skip_to_end = False
-                self.results = self.simulation.results
-                self.results_screen = ResultsScreen(
-                    self.screen, self.results, self.selected_track
-                )
-                self.state = 'results'
+                self.fast_forward = FastForward(self.simulation).start()
+            
+            if self.fast_forward:
+                if self.fast_forward.done:
+                    try:
+                        self.results = self.fast_forward.join()
+                    except Exception:
+                        # Fehler im Hintergrund-Thread: Rennen verwerfen statt die App zu beenden
+                        logger.exception("Vorspulen fehlgeschlagen, zurück zum Hauptmenü")
+                        self.fast_forward = None
+                        self.simulation = None
+                        self.state = 'menu'
+                        self.custom_horse = None
+                        return
+                    self.fast_forward = None
+                    self.results_screen = ResultsScreen(
+                        self.screen, self.results, self.selected_track
+                    )
+                    self.state = 'results'
+                else:
+                    # Die Simulation gehört bis zum Ende dem Hintergrund-Thread
+                    self.race_ui.draw_fast_forward(self.fast_forward.progress)
             else:
                 # Normale Simulation
                 if self.simulation:
-                    still_running = self.simulation.tick(delta_time)
+                    # Feste Simulationsschritte, unabhängig von der Bildrate
+                    still_running = self.simulation.advance(delta_time)
+                    self.frame_timer.lap('simulation_advance')
                     if not still_running:
                         self.results = self.simulation.results
                         self.results_screen = ResultsScreen(
                             self.screen, self.results, self.selected_track
                         )
                         self.state = 'results'
-            
-            # UI aktualisieren
-            if self.race_ui:
-                self.race_ui.update(delta_time)
+                
+                # UI aktualisieren
+                if self.race_ui:
+                    self.race_ui.update(delta_time)
         
         elif self.state == 'results':
             if self.results_screen:
@@ -204,6 +268,12 @@ class HorseRaceApp:
             if self.detailed_analysis_screen:
                 self.detailed_analysis_screen.draw(delta_time)
     
+    def _cancel_fast_forward(self):
+        """Bricht ein laufendes Vorspulen ab."""
+        if self.fast_forward:
+            self.fast_forward.cancel()
+            self.fast_forward = None
+    
     def _start_race(self):
         """Startet ein neues Rennen."""
         # 10 Pferde erstellen (1 custom falls vorhanden, rest zufällig)
@@ -226,12 +296,16 @@ class HorseRaceApp:
             used_names.add(horse.name)
             self.horses.append(horse)
         
-        # Simulation erstellen
-        self.simulation = RaceSimulation(self.horses, self.selected_track)
+        # Simulation erstellen (Telemetrie alle 0,1 s Rennzeit für die Analyse-Diagramme,
+        # Engine passend zur Feldgröße)
+        self.simulation = create_simulation(self.horses, self.selected_track, engine='auto',
+                                            telemetry_policy=EveryInterval(0.1))
         self.simulation.start()
         
         # UI erstellen
-        self.race_ui = RaceUI(self.screen, self.simulation, self.selected_track)
+        self.race_ui = RaceUI(self.screen, self.simulation, self.selected_track,
+                              dirty_rects=self.DIRTY_RECTS)
+        self.race_ui.frame_timer = self.frame_timer
         
         self.state = 'racing'
     
@@ -254,6 +328,8 @@ def main():
     print("  Pfeile   - Navigation in Menüs")
     print("  ENTER    - Bestätigen")
     print("  ESC      - Zurück/Beenden")
+    print("  F3       - Leistungsanzeige ein/aus")
+    print("  Bild ↑/↓ - Rangliste blättern (auch Mausrad)")
     print()
     
     app = HorseRaceApp()
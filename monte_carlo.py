@@ -0,0 +1,166 @@
+"""
+Monte-Carlo-Auswertung von Siegchancen.
+
+Simuliert dasselbe Startfeld sehr oft auf einer Strecke und verteilt die
+Rennen auf einen Prozesspool. Jeder Arbeitspaket-Block erhält einen eigenen,
+reproduzierbaren Zufallsstrom (numpy.random.SeedSequence.spawn). Die Blöcke
+liefern nur kompakte Aggregate pro Pferd zurück (Platzierungs-Histogramm und
+Zielzeiten als float32), keine vollständigen RaceResult-Objekte.
+
+Hinweis: Unter Windows muss der Aufruf hinter
+``if __name__ == "__main__":`` stehen, da der Prozesspool das Hauptmodul
+neu importiert.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from pferde.horse import Horse
+from strecken import get_track, get_track_id
+from strecken.base_track import Track
+from headless import DEFAULT_TIME_STEP, simulate_race
+from telemetry import NoTelemetry
+
+# Rennen pro Arbeitspaket; unabhängig von der Anzahl Prozesse, damit ein
+# Seed unabhängig von der Hardware dieselben Ergebnisse liefert
+DEFAULT_CHUNK_SIZE = 250
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Das Platzierungs-Histogramm wächst mit Pferde x Plätze; bei sehr großen
+# Feldern werden nur die vorderen Plätze gezählt
+MAX_HISTOGRAM_PLACES = 100
+
+
+@dataclass
+class ChunkAggregate:
+    """Kompaktes Teilergebnis eines Arbeitspakets."""
+    position_counts: np.ndarray  # (Pferde, Plätze bis MAX_HISTOGRAM_PLACES) Anzahl je Platz
+    finish_times: np.ndarray     # (Pferde, Rennen) Zielzeiten als float32
+
+
+@dataclass
+class HorseOdds:
+    """Aggregierte Monte-Carlo-Statistik eines Pferdes."""
+    name: str
+    win_probability: float
+    place_probability: float   # Platz 1-2
+    show_probability: float    # Platz 1-3
+    position_histogram: List[int]  # Anzahl je Platz (höchstens MAX_HISTOGRAM_PLACES Plätze)
+    mean_finish_time: float
+    finish_time_percentiles: Dict[int, float] = field(default_factory=dict)
+
+
+@dataclass
+class MonteCarloResult:
+    """Gesamtergebnis eines Monte-Carlo-Laufs."""
+    track_name: str
+    races: int
+    odds: List[HorseOdds]
+
+    def favorite(self) -> HorseOdds:
+        """Gibt das Pferd mit der höchsten Siegchance zurück."""
+        return max(self.odds, key=lambda o: o.win_probability)
+
+
+def _run_chunk(horses: List[Horse], track: Union[Track, str], races: int,
+               seed_sequence: np.random.SeedSequence, time_step: float, engine: str) -> ChunkAggregate:
+    """Simuliert ein Arbeitspaket im Worker-Prozess (Strecke als Objekt oder Schlüssel)."""
+    if isinstance(track, str):
+        track = get_track(track)
+    n = len(horses)
+    index = {id(h): i for i, h in enumerate(horses)}
+    places = min(n, MAX_HISTOGRAM_PLACES)
+    position_counts = np.zeros((n, places), dtype=np.int64)
+    finish_times = np.zeros((n, races), dtype=np.float32)
+
+    # Ausgewertet werden nur Platzierung und Zielzeit, Telemetrie bleibt aus
+    telemetry_policy = NoTelemetry()
+    race_seeds = np.random.default_rng(seed_sequence).integers(0, 2 ** 63, size=races)
+    for r, race_seed in enumerate(race_seeds):
+        results = simulate_race(horses, track, seed=int(race_seed), time_step=time_step, engine=engine,
+                                telemetry_policy=telemetry_policy)
+        for result in results:
+            i = index[id(result.horse)]
+            if result.position <= places:
+                position_counts[i, result.position - 1] += 1
+            finish_times[i, r] = result.finish_time
+
+    return ChunkAggregate(position_counts, finish_times)
+
+
+def _chunk_sizes(races: int, chunk_size: int) -> List[int]:
+    """Teilt die Gesamtzahl Rennen in Arbeitspakete auf."""
+    full, rest = divmod(races, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def run_monte_carlo(horses: List[Horse], track: Track, races: int = 10000, seed: Optional[int] = None,
+                    workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    time_step: float = DEFAULT_TIME_STEP, engine: str = 'python') -> MonteCarloResult:
+    """
+    Berechnet Sieg-, Platz- und Show-Wahrscheinlichkeiten per Monte-Carlo.
+
+    Args:
+        horses: Startfeld
+        track: Strecke
+        races: Anzahl simulierter Rennen
+        seed: Startwert; gleicher Seed ergibt unabhängig von `workers`
+              dasselbe Ergebnis
+        workers: Anzahl Prozesse (None = alle Kerne, 1 = im eigenen Prozess)
+        chunk_size: Rennen pro Arbeitspaket
+        time_step: Fester Zeitschritt pro Tick
+        engine: 'python' oder 'numpy'
+
+    Returns:
+        MonteCarloResult mit einer HorseOdds-Zeile pro Pferd
+    """
+    if races <= 0:
+        raise ValueError("Anzahl Rennen muss positiv sein")
+
+    sizes = _chunk_sizes(races, chunk_size)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        chunks = [_run_chunk(horses, track, size, stream, time_step, engine)
+                  for size, stream in zip(sizes, streams)]
+    else:
+        n_chunks = len(sizes)
+        # Mitgelieferte Strecken baut jeder Prozess über ihren Schlüssel neu
+        # auf; eigene Strecken werden gepickelt (ohne Segment-Index)
+        worker_track = get_track_id(track) or track
+        with ProcessPoolExecutor(max_workers=min(workers, n_chunks)) as executor:
+            chunks = list(executor.map(
+                _run_chunk,
+                [horses] * n_chunks, [worker_track] * n_chunks, sizes, streams,
+                [time_step] * n_chunks, [engine] * n_chunks
+            ))
+
+    return _aggregate(horses, track, chunks, races)
+
+
+def _aggregate(horses: List[Horse], track: Track, chunks: List[ChunkAggregate], races: int) -> MonteCarloResult:
+    """Fasst die Teilergebnisse aller Arbeitspakete zusammen."""
+    position_counts = sum(chunk.position_counts for chunk in chunks)
+    finish_times = np.concatenate([chunk.finish_times for chunk in chunks], axis=1)
+    percentiles = np.percentile(finish_times, PERCENTILES, axis=1)
+
+    odds = []
+    for i, horse in enumerate(horses):
+        counts = position_counts[i]
+        odds.append(HorseOdds(
+            name=horse.name,
+            win_probability=float(counts[0] / races),
+            place_probability=float(counts[:2].sum() / races),
+            show_probability=float(counts[:3].sum() / races),
+            position_histogram=counts.tolist(),
+            mean_finish_time=float(finish_times[i].mean()),
+            finish_time_percentiles={p: float(percentiles[k, i]) for k, p in enumerate(PERCENTILES)}
+        ))
+
+    return MonteCarloResult(track_name=track.name, races=races, odds=odds)
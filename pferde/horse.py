@@ -23,7 +23,7 @@ Jedes Pferd hat:
 import numpy as np
 import random
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 # Farbpalette für Pferde
 HORSE_COLORS = [
@@ -47,6 +47,19 @@ HORSE_NAMES = [
 ]
 
 
+@dataclass
+class RaceProfile:
+    """Rennkonstante Terme eines Pferdes auf einer Strecke (siehe Horse.build_race_profile)."""
+    base_speed: float             # Grundtempo inkl. Diminishing Returns
+    fatigue_step: float           # Ermüdungszuwachs pro Tick
+    acceleration_factor: float    # Faktor in der Beschleunigungsphase
+    endurance_loss: float         # Tempoverlust über die Strecke
+    sprint_boost: float           # Faktor im Endspurt
+    motivation_recovery: float    # Erholung im Endspurt
+    variability: float            # Schwankungsbreite durch Erfahrung
+    segment_factors: List[float] = field(default_factory=list)  # Streckenfaktor je Segment
+
+
 @dataclass
 class Horse:
     """Repräsentiert ein Pferd im Rennen."""
@@ -97,7 +110,7 @@ class Horse:
         self.momentum = 0.0
     
     def get_effective_speed(self, track_modifiers: dict, distance_covered: float, 
-                            total_distance: float, race_context: dict = None) -> float:
+                            total_distance: float, race_context: dict = None, rng=None) -> float:
         """
         Berechnet die effektive Geschwindigkeit basierend auf 
         Streckeneigenschaften und Pferdeparametern.
@@ -106,7 +119,14 @@ class Horse:
         - 'leader_position': Position des führenden Pferdes
         - 'average_position': Durchschnittsposition aller Pferde
         - 'my_rank': Aktuelle Platzierung (1 = Erster)
+        
+        rng ist der Zufallsgenerator des Rennens (Schnittstelle wie das
+        random-Modul, z.B. simulation.RaceRandom). Ohne rng wird das globale
+        random-Modul verwendet.
         """
+        if rng is None:
+            rng = random
+        
         # Basisgeschwindigkeit
         base_speed = self.grundgeschwindigkeit / 10  # Skalierung auf 0-10
         
@@ -151,7 +171,7 @@ class Horse:
         
         # === NEUE MECHANIK: Zufällige Leistungsschwankungen ===
         # Größere Schwankungen für spannendere Rennen
-        random_factor = random.gauss(1.0, 0.08)  # 8% Standardabweichung
+        random_factor = rng.gauss(1.0, 0.08)  # 8% Standardabweichung
         base_speed *= max(0.8, min(1.2, random_factor))
         
         # Beschleunigungsphase (erste 10% der Strecke)
@@ -173,29 +193,120 @@ class Horse:
             self.fatigue = max(0, self.fatigue - motivation_recovery)
         
         # Streckenspezifische Modifikatoren anwenden
+        base_speed *= self.track_modifier_factor(track_modifiers)
+        
+        # Erfahrung reduziert Variabilität
+        variability = (1.0 - self.erfahrung / 100) * 0.1
+        base_speed *= (1.0 + rng.uniform(-variability, variability))
+        
+        # Verletzungseffekt
+        if self.is_injured:
+            base_speed *= (1.0 - self.injury_slowdown * self.res_faktor_slowdown)
+        
+        return max(0.1, base_speed)
+    
+    def track_modifier_factor(self, track_modifiers: dict) -> float:
+        """
+        Berechnet den Streckenfaktor eines Abschnitts aus dessen Modifikatoren
+        und den passenden Pferdeparametern.
+        """
+        factor = 1.0
+        
         if 'kurven_faktor' in track_modifiers:
-            base_speed *= (0.7 + 0.3 * (self.wendigkeit / 100)) * track_modifiers['kurven_faktor']
+            factor *= (0.7 + 0.3 * (self.wendigkeit / 100)) * track_modifiers['kurven_faktor']
         
         if 'wald_faktor' in track_modifiers:
-            base_speed *= (0.6 + 0.4 * (self.wald_affinitaet / 100)) * track_modifiers['wald_faktor']
+            factor *= (0.6 + 0.4 * (self.wald_affinitaet / 100)) * track_modifiers['wald_faktor']
         
         if 'sand_faktor' in track_modifiers:
-            base_speed *= (0.6 + 0.4 * (self.sand_tauglichkeit / 100)) * track_modifiers['sand_faktor']
+            factor *= (0.6 + 0.4 * (self.sand_tauglichkeit / 100)) * track_modifiers['sand_faktor']
         
         if 'sprint_faktor' in track_modifiers:
-            base_speed *= (0.7 + 0.3 * (self.sprint_faehigkeit / 100)) * track_modifiers['sprint_faktor']
+            factor *= (0.7 + 0.3 * (self.sprint_faehigkeit / 100)) * track_modifiers['sprint_faktor']
         
         if 'berg_faktor' in track_modifiers:
             # Beschleunigung hilft bei Bergen
             berg_bonus = (self.bergsteiger / 100) * 0.5 + (self.beschleunigung / 100) * 0.3
-            base_speed *= (0.5 + 0.5 * berg_bonus) * track_modifiers['berg_faktor']
+            factor *= (0.5 + 0.5 * berg_bonus) * track_modifiers['berg_faktor']
         
         if 'urban_faktor' in track_modifiers:
-            base_speed *= (0.6 + 0.4 * (self.nervenstaerke / 100)) * track_modifiers['urban_faktor']
+            factor *= (0.6 + 0.4 * (self.nervenstaerke / 100)) * track_modifiers['urban_faktor']
+        
+        return factor
+    
+    def build_race_profile(self, track) -> 'RaceProfile':
+        """
+        Kompiliert die rennkonstanten Teile von get_effective_speed für eine
+        Strecke vor (einmal pro Rennen beim Start).
+        """
+        speed_penalty = (self.grundgeschwindigkeit / 100) ** 1.5 * 0.15
+        fatigue_rate = (self.grundgeschwindigkeit / 100) * 0.3 - (self.ausdauer / 100) * 0.2
+        acceleration_factor = (self.beschleunigung / 100) * (1 - self.gewicht / 150)
+        
+        return RaceProfile(
+            base_speed=self.grundgeschwindigkeit / 10 * (1.0 - speed_penalty),
+            fatigue_step=max(0.01, fatigue_rate) * 0.5,
+            acceleration_factor=0.8 + 0.4 * acceleration_factor,
+            endurance_loss=(1.0 - self.ausdauer / 100) * 0.3,
+            sprint_boost=1.0 + (self.motivation / 100) * 0.2,
+            motivation_recovery=(self.motivation / 100) * 0.1,
+            variability=(1.0 - self.erfahrung / 100) * 0.1,
+            segment_factors=[
+                self.track_modifier_factor(info.modifiers)
+                for info in track.get_segment_infos()
+            ]
+        )
+    
+    def get_profiled_speed(self, profile: 'RaceProfile', segment_index: int, total_distance: float,
+                           leader_position: float, my_rank: int, rng=None) -> float:
+        """
+        Schnelle Variante von get_effective_speed mit vorkompiliertem Profil.
+        
+        Pro Tick werden nur noch die dynamischen Anteile berechnet:
+        Ermüdung, Momentum, Windschatten, Zufall, Streckenphase und Verletzung.
+        """
+        if rng is None:
+            rng = random
+        
+        distance_covered = self.position
+        
+        # Ermüdung
+        base_speed = profile.base_speed * (1.0 - (self.fatigue / 100) * 0.4)
+        self.fatigue = min(100, self.fatigue + profile.fatigue_step)
+        
+        # Windschatten für Verfolger
+        if my_rank > 1 and leader_position > distance_covered:
+            distance_behind = leader_position - distance_covered
+            base_speed *= (1.0 + min(0.15, distance_behind / total_distance * 0.5))
+            self.fatigue = max(0, self.fatigue - 0.1)
+        
+        # Führendes Pferd: mehr Druck, aber Momentum
+        if my_rank == 1:
+            self.fatigue = min(100, self.fatigue + 0.15)
+            self.momentum = min(20, self.momentum + 0.1)
+        
+        base_speed *= (1.0 + self.momentum / 100)
+        
+        # Zufällige Leistungsschwankungen
+        base_speed *= max(0.8, min(1.2, rng.gauss(1.0, 0.08)))
+        
+        # Beschleunigungsphase (erste 10% der Strecke)
+        if distance_covered < total_distance * 0.1:
+            base_speed *= (0.5 + 0.5 * (distance_covered / (total_distance * 0.1))) * profile.acceleration_factor
+        
+        # Ausdauer-Effekt
+        base_speed *= 1.0 - profile.endurance_loss * (distance_covered / total_distance)
+        
+        # Endspurt (letzte 20%)
+        if distance_covered > total_distance * 0.8:
+            base_speed *= profile.sprint_boost
+            self.fatigue = max(0, self.fatigue - profile.motivation_recovery)
+        
+        # Vorkompilierter Streckenfaktor
+        base_speed *= profile.segment_factors[segment_index]
         
         # Erfahrung reduziert Variabilität
-        variability = (1.0 - self.erfahrung / 100) * 0.1
-        base_speed *= (1.0 + random.uniform(-variability, variability))
+        base_speed *= (1.0 + rng.uniform(-profile.variability, profile.variability))
         
         # Verletzungseffekt
         if self.is_injured:
@@ -203,20 +314,23 @@ class Horse:
         
         return max(0.1, base_speed)
     
-    def check_injury(self, injury_chance: float):
-        """Prüft ob das Pferd eine Verletzung erleidet."""
+    def check_injury(self, injury_chance: float, rng=None):
+        """Prüft ob das Pferd eine Verletzung erleidet (rng wie bei get_effective_speed)."""
         if self.is_injured:
             return
         
+        if rng is None:
+            rng = random
+        
         # Resilienz reduziert Verletzungschance
         actual_chance = injury_chance * (1.0 - self.resilienz / 150)
         
-        if random.random() < actual_chance:
+        if rng.random() < actual_chance:
             self.is_injured = True
             # Verlangsamung basierend auf Resilienz
             self.injury_slowdown = 0.1 + (1.0 - self.resilienz / 100) * 0.2
             # Resilienzfaktor: 1 bei hoher Resilienz, 3 bei niedriger, mit Zufall
-            self.res_faktor_slowdown = 1 + (1.0 - self.resilienz / 100) * 2 + random.uniform(-0.2, 0.2)
+            self.res_faktor_slowdown = 1 + (1.0 - self.resilienz / 100) * 2 + rng.uniform(-0.2, 0.2)
     
     def to_dict(self) -> dict:
         """Konvertiert das Pferd zu einem Dictionary."""
@@ -239,38 +353,59 @@ class Horse:
         }
 
 
-def generate_random_stats() -> Tuple[float, float, float]:
+def generate_random_stats(rng: Optional[np.random.Generator] = None) -> Tuple[float, float, float]:
     """
     Generiert die 3 zufälligen Parameter mit den geforderten Verteilungen.
     
+    Args:
+        rng: Zufallsgenerator (None = globaler Generator np.random wie bisher,
+             reproduzierbar über np.random.seed)
+    
     Returns:
         Tuple (ausdauer, resilienz, beschleunigung)
     """
+    if rng is None:
+        rng = np.random
+    
     # Ausdauer: Normalverteilung (Mittelwert 50, Standardabweichung 15)
-    ausdauer = np.clip(np.random.normal(50, 15), 0, 100)
+    ausdauer = np.clip(rng.normal(50, 15), 0, 100)
     
     # Resilienz/Alter: Exponentialverteilung (skaliert auf 0-100)
     # Jüngere Pferde haben höhere Resilienz
-    raw_exp = np.random.exponential(scale=30)
+    raw_exp = rng.exponential(scale=30)
     resilienz = np.clip(100 - raw_exp, 0, 100)
     
     # Beschleunigung: Gleichverteilung (0-100)
-    beschleunigung = np.random.uniform(0, 100)
+    beschleunigung = rng.uniform(0, 100)
     
     return float(ausdauer), float(resilienz), float(beschleunigung)
 
 
-def create_random_horse(name: str = None, color: Tuple[int, int, int] = None) -> Horse:
+def create_random_horse(name: str = None, color: Tuple[int, int, int] = None,
+                        rng: Optional[np.random.Generator] = None) -> Horse:
     """
     Erstellt ein komplett zufälliges Pferd.
+    
+    Mit einem geseedeten rng ist das Pferd reproduzierbar. Ohne rng werden
+    wie bisher die globalen Generatoren (random und np.random) verwendet,
+    sodass Aufrufer, die diese seeden, dieselben Pferde erhalten.
     """
+    if rng is None:
+        choice = random.choice
+        number = lambda: random.randint(1, 99)
+        uniform = random.uniform
+    else:
+        choice = lambda options: options[rng.integers(len(options))]
+        number = lambda: int(rng.integers(1, 100))
+        uniform = lambda low, high: float(rng.uniform(low, high))
+    
     if name is None:
-        name = random.choice(HORSE_NAMES) + " " + str(random.randint(1, 99))
+        name = choice(HORSE_NAMES) + " " + str(number())
     
     if color is None:
-        color = random.choice(HORSE_COLORS)
+        color = choice(HORSE_COLORS)
     
-    ausdauer, resilienz, beschleunigung = generate_random_stats()
+    ausdauer, resilienz, beschleunigung = generate_random_stats(rng)
     
     return Horse(
         name=name,
@@ -278,16 +413,16 @@ def create_random_horse(name: str = None, color: Tuple[int, int, int] = None) ->
         ausdauer=ausdauer,
         resilienz=resilienz,
         beschleunigung=beschleunigung,
-        grundgeschwindigkeit=random.uniform(30, 80),
-        wendigkeit=random.uniform(20, 90),
-        wald_affinitaet=random.uniform(20, 90),
-        sand_tauglichkeit=random.uniform(20, 90),
-        sprint_faehigkeit=random.uniform(20, 90),
-        bergsteiger=random.uniform(20, 90),
-        nervenstaerke=random.uniform(20, 90),
-        gewicht=random.uniform(30, 80),
-        erfahrung=random.uniform(10, 90),
-        motivation=random.uniform(30, 90)
+        grundgeschwindigkeit=uniform(30, 80),
+        wendigkeit=uniform(20, 90),
+        wald_affinitaet=uniform(20, 90),
+        sand_tauglichkeit=uniform(20, 90),
+        sprint_faehigkeit=uniform(20, 90),
+        bergsteiger=uniform(20, 90),
+        nervenstaerke=uniform(20, 90),
+        gewicht=uniform(30, 80),
+        erfahrung=uniform(10, 90),
+        motivation=uniform(30, 90)
     )
 
 
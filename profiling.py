@@ -0,0 +1,149 @@
+"""
+Zeitmessung der einzelnen Phasen eines Simulationsschritts.
+
+Ein PhaseProfiler wird als ``simulation.profiler`` gesetzt. Die Simulation
+misst dann pro Schritt, wie viel Zeit auf Rangfolge, Segmentabfrage,
+Verletzungsprüfung, Tempoberechnung, Statistik, Bewegung, Telemetrie,
+on_update-Callback und Rennabschluss entfällt. Ohne Profiler kostet die
+Instrumentierung nur eine None-Prüfung je Messpunkt.
+
+Beispiel:
+    profiler = simulation.enable_profiling()
+    ...
+    print(profiler.summary())
+    profiler.dump_chrome_trace('rennen.trace.json')   # chrome://tracing / Perfetto
+"""
+
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+PHASES = (
+    'ranking', 'lookup', 'injury', 'speed', 'stats',
+    'movement', 'telemetry', 'callback', 'finalize',
+)
+
+
+class PhaseProfiler:
+    """Kumulierte und pro Schritt erfasste Laufzeiten je Phase."""
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, history: int = 10000):
+        """
+        Args:
+            history: Anzahl der letzten Schritte, die einzeln aufbewahrt werden
+        """
+        self.totals: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self.tick_total = 0.0
+        self.tick_count = 0
+        # (Schritt, Simulationszeit, Start, Dauer, Phasen) der letzten Schritte
+        self.ticks: Deque[Tuple[int, float, float, float, Dict[str, float]]] = deque(maxlen=history)
+        self._current: Optional[Dict[str, float]] = None
+        self._tick_start = 0.0
+        self._tick_info = (0, 0.0)
+        self._origin = self.clock()
+
+    def reset(self):
+        """Verwirft alle bisherigen Messungen."""
+        self.__init__(self.ticks.maxlen)
+
+    def begin_tick(self, tick: int, sim_time: float):
+        """Beginnt die Messung eines Simulationsschritts."""
+        self._current = {}
+        self._tick_info = (tick, sim_time)
+        self._tick_start = self.clock()
+
+    def lap(self, phase: str, since: float) -> float:
+        """Rechnet die Zeit seit `since` der Phase zu und gibt den aktuellen Zeitpunkt zurück."""
+        now = self.clock()
+        elapsed = now - since
+        self.totals[phase] += elapsed
+        if self._current is not None:
+            self._current[phase] = self._current.get(phase, 0.0) + elapsed
+        return now
+
+    def end_tick(self):
+        """Schließt die Messung des aktuellen Schritts ab."""
+        if self._current is None:
+            return
+        duration = self.clock() - self._tick_start
+        self.tick_total += duration
+        self.tick_count += 1
+        tick, sim_time = self._tick_info
+        self.ticks.append((tick, sim_time, self._tick_start - self._origin, duration, self._current))
+        self._current = None
+
+    @property
+    def last_tick(self) -> Dict[str, float]:
+        """Phasenzeiten des letzten Schritts in Sekunden."""
+        return dict(self.ticks[-1][4]) if self.ticks else {}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Gesamt- und Durchschnittszeit sowie Anteil je Phase."""
+        ticks = max(1, self.tick_count)
+        total = self.tick_total or 1.0
+        result = {
+            phase: {
+                'total_s': seconds,
+                'mean_per_tick_us': seconds / ticks * 1e6,
+                'share': seconds / total,
+            }
+            for phase, seconds in self.totals.items()
+        }
+        measured = sum(self.totals.values())
+        result['other'] = {
+            'total_s': max(0.0, self.tick_total - measured),
+            'mean_per_tick_us': max(0.0, self.tick_total - measured) / ticks * 1e6,
+            'share': max(0.0, self.tick_total - measured) / total,
+        }
+        return result
+
+    def to_dict(self) -> Dict:
+        """Alle Messwerte als JSON-fähiges Dictionary."""
+        return {
+            'ticks': self.tick_count,
+            'tick_total_s': self.tick_total,
+            'mean_tick_us': self.tick_total / max(1, self.tick_count) * 1e6,
+            'phases': self.summary(),
+            'history': [
+                {'tick': tick, 'sim_time': sim_time, 'duration_s': duration, 'phases': phases}
+                for tick, sim_time, _, duration, phases in self.ticks
+            ],
+        }
+
+    def dump_json(self, path: str):
+        """Schreibt to_dict() als JSON-Datei."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def chrome_trace_events(self) -> List[Dict]:
+        """
+        Ereignisse im Chrome-Trace-Format (Mikrosekunden).
+
+        Phasen, die pro Pferd mehrfach vorkommen, sind innerhalb eines
+        Schritts aufsummiert und werden hintereinander dargestellt.
+        """
+        events = []
+        for tick, sim_time, start, duration, phases in self.ticks:
+            ts = start * 1e6
+            events.append({
+                'name': 'tick', 'ph': 'X', 'pid': 1, 'tid': 1,
+                'ts': ts, 'dur': duration * 1e6,
+                'args': {'tick': tick, 'sim_time': sim_time},
+            })
+            offset = ts
+            for phase in PHASES:
+                if phase in phases:
+                    events.append({
+                        'name': phase, 'ph': 'X', 'pid': 1, 'tid': 1,
+                        'ts': offset, 'dur': phases[phase] * 1e6,
+                    })
+                    offset += phases[phase] * 1e6
+        return events
+
+    def dump_chrome_trace(self, path: str):
+        """Schreibt die letzten Schritte als Chrome-Trace (chrome://tracing, Perfetto)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.chrome_trace_events(), 'displayTimeUnit': 'ms'}, f)
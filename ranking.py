@@ -0,0 +1,162 @@
+"""
+Inkrementell gepflegte Rangfolge des Feldes.
+
+Zwischen zwei Simulationsschritten ändert sich die Reihenfolge nur durch
+wenige lokale Überholvorgänge. Statt das Feld jeden Tick neu zu sortieren,
+wird die Permutation des letzten Schritts weitergeführt:
+
+- update_running (Python-Engine): ein Insertion-Durchlauf über die fast
+  sortierte Reihenfolge, O(n + Anzahl Überholvorgänge), direkt auf den
+  Positionslisten der Simulation.
+- update (NumPy-Engine): vektorisierte O(n)-Prüfung; bei Überholvorgängen
+  wird nur das betroffene Fenster stabil nachsortiert.
+
+Physik (Platzierung, Führender) und Anzeige (Zwischenstand) lesen dieselbe
+Struktur.
+"""
+
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+class RankingTracker:
+    """Rangfolge der laufenden Pferde als Permutation der Zeilenindizes."""
+
+    def __init__(self, count: int):
+        self.order = np.arange(count)              # Laufende Pferde, Führender zuerst
+        self.ranks = np.arange(1, count + 1)       # Platz je Zeile (nur für laufende gültig)
+        self.version = 0                           # Wird bei jeder Änderung der Reihenfolge erhöht
+        # Listen-Spiegel für die Python-Engine (None = bei Bedarf neu erzeugen)
+        self._order_list: Optional[List[int]] = None
+        self._rank_list: Optional[List[int]] = None
+
+    def _changed(self):
+        self._order_list = None
+        self._rank_list = None
+        self.version += 1
+
+    def reset(self, positions: np.ndarray, finished: np.ndarray):
+        """Baut die Rangfolge für einen neuen Rennstart komplett neu auf."""
+        self.order = np.arange(len(positions))
+        self.ranks = np.arange(1, len(positions) + 1)
+        self._changed()
+        self.update(positions, finished)
+
+    def restore(self, order: np.ndarray, ranks: np.ndarray):
+        """Übernimmt eine gesicherte Rangfolge (zählt als Änderung)."""
+        self.order = order.copy()
+        self.ranks = ranks.copy()
+        self._changed()
+
+    @property
+    def rank_list(self) -> List[int]:
+        """Plätze je Zeile als Liste (nur nach Änderungen neu erzeugt)."""
+        if self._rank_list is None:
+            self._rank_list = self.ranks.tolist()
+        return self._rank_list
+
+    def update_running(self, positions: Sequence[float], finished_rows: Iterable[int] = ()) -> bool:
+        """
+        Führt die Rangfolge mit einem Insertion-Durchlauf nach (Python-Engine).
+
+        Die Reihenfolge des letzten Schritts ist fast sortiert; jedes Pferd
+        rückt nur so weit nach vorn, wie es überholt hat. Gleichstände
+        behalten ihre bisherige Reihenfolge (wie beim stabilen Sortieren).
+
+        Args:
+            positions: Positionen nach Zeilen (nur laufende Zeilen müssen aktuell sein)
+            finished_rows: Zeilen, die in diesem Schritt ins Ziel gekommen sind
+
+        Returns:
+            True wenn sich die Reihenfolge geändert hat
+        """
+        order = self._order_list
+        if order is None:
+            order = self._order_list = self.order.tolist()
+        changed = False
+
+        # Angekommene Pferde scheiden aus (Reihenfolge der übrigen bleibt)
+        gone = set(finished_rows)
+        if gone:
+            order = [row for row in order if row not in gone]
+            changed = True
+
+        for i in range(1, len(order)):
+            row = order[i]
+            position = positions[row]
+            j = i
+            while j and positions[order[j - 1]] < position:
+                order[j] = order[j - 1]
+                j -= 1
+            if j != i:
+                order[j] = row
+                changed = True
+
+        if changed:
+            self.order = np.array(order, dtype=np.intp)
+            self.ranks[self.order] = np.arange(1, len(order) + 1)
+            self._changed()
+            self._order_list = order
+        return changed
+
+    def update(self, positions: np.ndarray, finished: np.ndarray) -> bool:
+        """
+        Führt die Rangfolge nach einem Simulationsschritt nach.
+
+        Args:
+            positions: Positionen aller Pferde (nach Zeilen)
+            finished: Ziel-Flags aller Pferde (nach Zeilen)
+
+        Returns:
+            True wenn sich die Reihenfolge geändert hat
+        """
+        order = self.order
+        changed = False
+
+        # Angekommene Pferde scheiden aus (Reihenfolge der übrigen bleibt)
+        done = finished[order]
+        if done.any():
+            order = order[~done]
+            changed = True
+
+        # Nur nachsortieren, wenn ein Pferd ein vorderes überholt hat
+        current = positions[order]
+        if current.size > 1:
+            overtakes = np.flatnonzero(current[1:] > current[:-1])
+            if overtakes.size:
+                order = self._resort_window(order, current, int(overtakes[0]), int(overtakes[-1]) + 2)
+                changed = True
+
+        if changed:
+            self.order = order
+            self.ranks[order] = np.arange(1, order.size + 1)
+            self._changed()
+        return changed
+
+    @staticmethod
+    def _resort_window(order: np.ndarray, current: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """
+        Sortiert nur den Bereich um die Überholvorgänge stabil nach.
+
+        [start, stop) umfasst alle Stellen, an denen die Reihenfolge verletzt
+        ist; außerhalb ist sie absteigend sortiert. Das Fenster wird so weit
+        erweitert, wie sein schnellstes Pferd nach vorn und sein langsamstes
+        nach hinten wandern muss.
+        """
+        window = current[start:stop]
+        # Vorne: alle mit Position >= Fenstermaximum bleiben davor (stabil)
+        start = int(np.searchsorted(-current[:start], -window.max(), side='right'))
+        # Hinten: alle mit Position > Fensterminimum müssen davor einsortiert werden
+        stop += int(np.searchsorted(-current[stop:], -window.min(), side='left'))
+        order = order.copy()
+        order[start:stop] = order[start:stop][np.argsort(-current[start:stop], kind='stable')]
+        return order
+
+    @property
+    def leader(self) -> int:
+        """Zeile des führenden laufenden Pferdes (-1 wenn keines mehr läuft)."""
+        return int(self.order[0]) if self.order.size else -1
+
+    def __len__(self) -> int:
+        return int(self.order.size)
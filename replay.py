@@ -0,0 +1,428 @@
+"""
+Binäres Wiederholungsformat für Rennen.
+
+Ein ReplayRecorder hängt sich an eine RaceSimulation (``simulation.recorder``)
+und schreibt nach jedem Simulationsschritt den Zustand aller Pferde als
+Datensatz fester Breite in eine Datei. Der ReplayReader bildet die Datei per
+Memory-Map ab; da die Schritte eine feste Länge haben, ergibt sich der
+Datensatz zu einem Zeitpunkt direkt aus Zeit / Zeitschritt (O(1)).
+
+Dateiaufbau:
+    Kopf       HEADER (feste Größe, Little Endian)
+    Metadaten  JSON: Pferde-Parameter, Strecke, Kanäle
+    Daten      frame_count Datensätze (frame_dtype), ab data_offset:
+               Simulationszeit (float32), je Pferd Position und Tempo
+               (float32) sowie ein Statusbyte (Bits STATUS_BITS), aufgefüllt
+               auf ein Vielfaches von 4 Bytes
+    Anhang     JSON: Ergebnisse (nach Rennende)
+
+Die Wahrheitswerte als Bits statt als float32 zu speichern, spart je Pferd
+und Schritt 7 von 16 Bytes. Dafür liefert ReplayReader.channel() für
+'is_injured' und 'finished' ein entpacktes Array statt einer View.
+
+Beispiel:
+    simulation.recorder = ReplayRecorder('rennen.hrr')
+    simulation.start()
+    ...
+    replay = ReplayReader('rennen.hrr')
+    positions = replay.positions_at(12.5)
+"""
+
+import json
+import os
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from pferde.horse import Horse
+from simulation import RaceSimulation, RaceResult, SimulationState
+from strecken import get_track, get_track_id
+from strecken.base_track import Track
+
+MAGIC = b'HRREPLAY'
+VERSION = 2
+
+# Magic, Version, Pferde, Kanäle, Flags, Länge der Metadaten, Zeitschritt,
+# Seed (ohne Vorzeichen), Anzahl Datensätze, Offset des Anhangs
+HEADER = struct.Struct('<8sIIIIIdQQQ')
+
+# Flags im Kopf: Seed-Feld ist gültig (Rennen ohne Seed speichern dort 0)
+FLAG_HAS_SEED = 1
+
+# Die beiden letzten Felder werden erst am Rennende eingetragen
+COUNTS = struct.Struct('<QQ')
+COUNT_OFFSET = HEADER.size - COUNTS.size
+
+# Aufgezeichnete Zustandsfelder je Pferd
+CHANNELS = ('position', 'current_speed', 'is_injured', 'finished')
+
+# Kanäle als float32 und Wahrheitswerte als Bits im Statusbyte
+FLOAT_CHANNELS = ('position', 'current_speed')
+STATUS_BITS = {'is_injured': 1, 'finished': 2}
+
+# Ausrichtung des Datenblocks in Bytes
+DATA_ALIGNMENT = 16
+
+
+def _align(offset: int) -> int:
+    return (offset + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+
+def frame_dtype(horse_count: int) -> np.dtype:
+    """Aufbau eines Datensatzes für `horse_count` Pferde."""
+    fields = [('time', '<f4')]
+    fields += [(name, '<f4', (horse_count,)) for name in FLOAT_CHANNELS]
+    fields.append(('status', 'u1', (horse_count,)))
+    padding = -horse_count % 4
+    if padding:
+        fields.append(('padding', 'u1', (padding,)))
+    return np.dtype(fields)
+
+
+class ReplayRecorder:
+    """Schreibt den Zustand jedes Simulationsschritts in eine Replay-Datei."""
+
+    def __init__(self, path: str, block_frames: int = 256):
+        self.path = path
+        self.block_frames = block_frames
+        self.frame_count = 0
+        self._file = None
+        self._block: Optional[np.ndarray] = None
+        self._filled = 0
+        self._horse_count = 0
+
+    def start(self, simulation: RaceSimulation):
+        """Legt die Datei an und schreibt Kopf, Metadaten und den Startzustand."""
+        self.close()
+        track = simulation.track
+        meta = {
+            'horses': [horse.to_dict() for horse in simulation.horses],
+            'track_id': get_track_id(track),
+            'track_name': track.name,
+            'track_length': track.length,
+            'channels': list(CHANNELS),
+        }
+        meta_bytes = json.dumps(meta).encode('utf-8')
+
+        self._horse_count = len(simulation.horses)
+        self._block = np.zeros(self.block_frames, dtype=frame_dtype(self._horse_count))
+        self._filled = 0
+        self.frame_count = 0
+
+        flags = FLAG_HAS_SEED if simulation.seed is not None else 0
+        seed = simulation.seed if simulation.seed is not None else 0
+        header = HEADER.pack(MAGIC, VERSION, self._horse_count, len(CHANNELS), flags,
+                             len(meta_bytes), simulation.time_step, seed, 0, 0)
+        self._file = open(self.path, 'wb')
+        self._file.write(header)
+        self._file.write(meta_bytes)
+        self._file.write(b'\0' * (_align(HEADER.size + len(meta_bytes)) - HEADER.size - len(meta_bytes)))
+        self.record(simulation)
+
+    def record(self, simulation: RaceSimulation):
+        """Hängt den aktuellen Zustand als Datensatz an."""
+        frame = self._block[self._filled]
+        frame['time'] = simulation.state.elapsed_time
+        status = frame['status']
+        status[:] = 0
+        for name, column in zip(CHANNELS, simulation.get_horse_columns(CHANNELS)):
+            bit = STATUS_BITS.get(name)
+            if bit is None:
+                frame[name] = column
+            else:
+                status[np.asarray(column, dtype=bool)] |= bit
+        self._filled += 1
+        self.frame_count += 1
+        if self._filled == self.block_frames:
+            self._flush()
+
+    def _flush(self):
+        if self._filled:
+            self._file.write(self._block[:self._filled].tobytes())
+            self._filled = 0
+
+    def finish(self, simulation: RaceSimulation):
+        """Schreibt die Ergebnisse als Anhang, trägt die Zahl der Datensätze ein und schließt."""
+        self._flush()
+        rows = {id(horse): row for row, horse in enumerate(simulation.horses)}
+        trailer = [
+            {
+                'row': rows[id(result.horse)],
+                'position': result.position,
+                'finish_time': result.finish_time,
+                'was_injured': result.was_injured,
+                'max_speed': result.max_speed,
+                'avg_speed': result.avg_speed,
+                'injury_times': result.injury_times,
+                'segment_performance': result.segment_performance,
+            }
+            for result in simulation.results
+        ]
+        trailer_offset = self._file.tell()
+        self._file.write(json.dumps(trailer).encode('utf-8'))
+        self._file.seek(COUNT_OFFSET)
+        self._file.write(COUNTS.pack(self.frame_count, trailer_offset))
+        self.close()
+
+    def close(self):
+        """Schließt die Datei (ohne Anhang, falls das Rennen nicht beendet wurde)."""
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
+
+
+class ReplayReader:
+    """Liest eine Replay-Datei per Memory-Map."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            (magic, version, horse_count, channel_count, flags, meta_length,
+             self.time_step, seed, frame_count, trailer_offset) = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Keine Replay-Datei: {path}")
+            if version != VERSION:
+                raise ValueError(f"Nicht unterstützte Replay-Version: {version}")
+            self.meta = json.loads(f.read(meta_length).decode('utf-8'))
+            trailer = b''
+            if trailer_offset:
+                f.seek(trailer_offset)
+                trailer = f.read()
+
+        self.horse_count = horse_count
+        self.seed: Optional[int] = seed if flags & FLAG_HAS_SEED else None
+        self.channels: List[str] = self.meta['channels']
+        self.dtype = frame_dtype(horse_count)
+        self.data_offset = _align(HEADER.size + meta_length)
+
+        # Nicht abgeschlossene Aufnahme: Anzahl Datensätze aus der Dateigröße
+        if not trailer_offset:
+            frame_count = (os.path.getsize(path) - self.data_offset) // self.dtype.itemsize
+        self.frame_count = int(frame_count)
+        self.results_data: List[Dict] = json.loads(trailer.decode('utf-8')) if trailer else []
+
+        if self.frame_count:
+            self.frames = np.memmap(path, dtype=self.dtype, mode='r', offset=self.data_offset,
+                                    shape=(self.frame_count,))
+        else:
+            self.frames = np.empty(0, dtype=self.dtype)
+        self.times = self.frames['time']
+
+        # Feste Schritte: Datensatz k liegt bei k * time_step
+        self._uniform = self.frame_count < 2 or abs(
+            float(self.times[-1]) - (self.frame_count - 1) * self.time_step) < self.time_step * 0.5
+
+    @property
+    def track_id(self) -> Optional[str]:
+        return self.meta['track_id']
+
+    @property
+    def duration(self) -> float:
+        """Dauer der Aufnahme in Sekunden Simulationszeit."""
+        return float(self.times[-1]) if self.frame_count else 0.0
+
+    def create_horses(self) -> List[Horse]:
+        """Erstellt die Pferde der Aufnahme aus den gespeicherten Parametern."""
+        horses = []
+        for data in self.meta['horses']:
+            data = dict(data, color=tuple(data['color']))
+            horses.append(Horse(**data))
+        return horses
+
+    def create_track(self) -> Optional[Track]:
+        """Erstellt die Strecke der Aufnahme (None bei unbekannter Strecke)."""
+        return get_track(self.track_id) if self.track_id else None
+
+    def frame_index(self, time: float) -> int:
+        """Index des letzten Datensatzes bis `time` (O(1) bei festen Schritten)."""
+        if self._uniform:
+            index = int(time / self.time_step + 1e-6)
+        else:
+            index = int(np.searchsorted(self.times, time, side='right')) - 1
+        return max(0, min(self.frame_count - 1, index))
+
+    def channel(self, name: str, index: int) -> np.ndarray:
+        """Werte eines Kanals für alle Pferde in Datensatz `index` (View, Statusbits entpackt)."""
+        bit = STATUS_BITS.get(name)
+        if bit is not None:
+            return (self.frames['status'][index] & bit) != 0
+        return self.frames[name][index]
+
+    def horse_channel(self, name: str, row: int) -> np.ndarray:
+        """Verlauf eines Kanals für ein Pferd über alle Datensätze (View, Statusbits entpackt)."""
+        bit = STATUS_BITS.get(name)
+        if bit is not None:
+            return (self.frames['status'][:, row] & bit) != 0
+        return self.frames[name][:, row]
+
+    def positions_at(self, time: float) -> np.ndarray:
+        """Zwischen zwei Datensätzen linear interpolierte Positionen."""
+        index = self.frame_index(time)
+        current = self.channel('position', index).astype(np.float64)
+        if index + 1 >= self.frame_count:
+            return current
+        t0 = float(self.times[index])
+        t1 = float(self.times[index + 1])
+        alpha = min(1.0, max(0.0, (time - t0) / (t1 - t0))) if t1 > t0 else 0.0
+        return current + (self.channel('position', index + 1) - current) * alpha
+
+    def close(self):
+        """Gibt die Memory-Map frei."""
+        self.times = None
+        self.frames = None
+
+
+class ReplayPlayback:
+    """
+    Spielt eine Aufnahme über dieselbe Schnittstelle wie RaceSimulation ab.
+
+    Kann anstelle der Simulation an RaceUI übergeben werden; seek() springt
+    zu einem beliebigen Zeitpunkt, ohne das Rennen neu zu rechnen.
+    """
+
+    def __init__(self, reader: ReplayReader, track: Optional[Track] = None):
+        """
+        Args:
+            reader: Geöffnete Aufnahme
+            track: Strecke für Aufnahmen auf eigenen Strecken (nicht in
+                   AVAILABLE_TRACKS); mitgelieferte Strecken werden aus der
+                   Aufnahme erzeugt
+
+        Raises:
+            ValueError: Wenn die Strecke weder aus der Aufnahme erzeugt werden
+                        kann noch übergeben wurde oder nicht zur Aufnahme passt
+        """
+        self.reader = reader
+        self.horses = reader.create_horses()
+        self.track = track if track is not None else reader.create_track()
+        if self.track is None:
+            raise ValueError(
+                f"Aufnahme auf eigener Strecke '{reader.meta['track_name']}': "
+                f"Strecke muss an ReplayPlayback übergeben werden"
+            )
+        if abs(self.track.length - reader.meta['track_length']) > 1e-6:
+            raise ValueError(
+                f"Strecke '{self.track.name}' ({self.track.length} m) passt nicht zur Aufnahme "
+                f"({reader.meta['track_length']} m)"
+            )
+        self.track_length = reader.meta['track_length']
+        self.state = SimulationState()
+        self.results: List[RaceResult] = []
+        self.on_update = None
+        self.on_finish = None
+        self._index = 0
+
+    def start(self):
+        """Startet die Wiedergabe von vorne."""
+        self.state = SimulationState(is_running=True, speed_multiplier=self.state.speed_multiplier)
+        self.results = []
+        self.seek(0.0)
+
+    def set_speed_multiplier(self, multiplier: float):
+        """Setzt den Wiedergabe-Multiplikator (0.1 - 5.0)."""
+        self.state.speed_multiplier = max(0.1, min(5.0, multiplier))
+
+    def increase_speed(self):
+        self.set_speed_multiplier(self.state.speed_multiplier + 0.25)
+
+    def decrease_speed(self):
+        self.set_speed_multiplier(self.state.speed_multiplier - 0.25)
+
+    def pause(self):
+        self.state.is_paused = True
+
+    def resume(self):
+        self.state.is_paused = False
+
+    def toggle_pause(self):
+        self.state.is_paused = not self.state.is_paused
+
+    def advance(self, frame_time: float) -> bool:
+        """
+        Spielt die Echtzeit eines Frames ab.
+
+        Returns:
+            True solange die Aufnahme läuft, False am Ende
+        """
+        if not self.state.is_running or self.state.is_paused:
+            return not self.state.is_finished
+        self.seek(self.state.elapsed_time + frame_time * self.state.speed_multiplier)
+        if self.state.elapsed_time >= self.reader.duration:
+            self._finish()
+            return False
+        return True
+
+    def step(self) -> bool:
+        """Springt genau einen aufgezeichneten Schritt weiter."""
+        return self.advance(self.reader.time_step / self.state.speed_multiplier)
+
+    def seek(self, time: float):
+        """Springt zu einem Zeitpunkt der Aufnahme (O(1))."""
+        time = max(0.0, min(self.reader.duration, time))
+        self.state.elapsed_time = time
+        self._index = self.reader.frame_index(time)
+        self.state.tick_count = self._index
+        columns = [self.reader.channel(name, self._index).tolist() for name in CHANNELS]
+        for row, horse in enumerate(self.horses):
+            horse.position = columns[0][row]
+            horse.current_speed = columns[1][row]
+            horse.is_injured = bool(columns[2][row])
+            horse.finished = bool(columns[3][row])
+
+    def _finish(self):
+        self.state.is_running = False
+        self.state.is_finished = True
+        self.results = self.build_results()
+        if self.on_finish:
+            self.on_finish(self.results)
+
+    def build_results(self) -> List[RaceResult]:
+        """Erstellt die Ergebnisliste aus dem Anhang und den aufgezeichneten Verläufen."""
+        times = self.reader.times
+        results = []
+        for data in self.reader.results_data:
+            row = data['row']
+            horse = self.horses[row]
+            horse.finish_time = data['finish_time']
+            end = int(np.searchsorted(times, data['finish_time'], side='left')) + 1
+            results.append(RaceResult(
+                horse=horse,
+                position=data['position'],
+                finish_time=data['finish_time'],
+                was_injured=data['was_injured'],
+                max_speed=data['max_speed'],
+                avg_speed=data['avg_speed'],
+                sample_times=times[:end],
+                speed_samples=self.reader.horse_channel('current_speed', row)[:end],
+                position_samples=self.reader.horse_channel('position', row)[:end],
+                injury_times=list(data['injury_times']),
+                segment_performance=data['segment_performance']
+            ))
+        return results
+
+    def get_interpolated_progress(self) -> Dict[str, float]:
+        """Fortschritt aller Pferde in Prozent, zwischen den Datensätzen interpoliert."""
+        positions = self.reader.positions_at(self.state.elapsed_time)
+        percent = np.minimum(100, positions / self.track_length * 100).tolist()
+        return {horse.name: p for horse, p in zip(self.horses, percent)}
+
+    def get_progress(self) -> Dict[str, float]:
+        return {
+            horse.name: min(100, horse.position / self.track_length * 100)
+            for horse in self.horses
+        }
+
+    def get_current_standings(self) -> List[tuple]:
+        """Zwischenstand: Angekommene nach Zielzeit, danach Laufende nach Position."""
+        finish_times = {data['row']: data['finish_time'] for data in self.reader.results_data}
+        arrived = sorted(
+            (row for row, horse in enumerate(self.horses) if horse.finished),
+            key=lambda row: finish_times.get(row, 0.0)
+        )
+        running = sorted(
+            (row for row, horse in enumerate(self.horses) if not horse.finished),
+            key=lambda row: -self.horses[row].position
+        )
+        return [(i + 1, self.horses[row]) for i, row in enumerate(arrived + running)]
@@ -4,11 +4,28 @@ Simulations-Engine für das Pferderennen.
 Verwaltet die Simulation, Geschwindigkeitssteuerung und Ergebnisberechnung.
 """
 
+import copy
 import time
-from typing import List, Dict, Callable, Optional, Tuple
-from dataclasses import dataclass, field
-from pferde.horse import Horse
+from typing import List, Dict, Callable, Optional, Tuple, Any
+from dataclasses import dataclass, field, replace
+import numpy as np
+from pferde.horse import Horse, RaceProfile
 from strecken.base_track import Track
+from telemetry import TelemetryBuffer, SamplingPolicy, EveryNTicks, NoTelemetry
+from ranking import RankingTracker
+from snapshot import RaceSnapshot, HORSE_STATE_FIELDS
+from profiling import PhaseProfiler
+
+
+# Fester Simulationsschritt in Sekunden Simulationszeit (entspricht 60 FPS)
+FIXED_TIME_STEP = 1 / 60
+
+# Obergrenze an Simulationsschritten pro Frame, damit ein hängender Frame
+# keine Aufholspirale auslöst
+MAX_STEPS_PER_FRAME = 240
+
+# Schritte zwischen zwei Fortschrittsmeldungen beim Vorspulen
+FAST_FORWARD_PROGRESS_INTERVAL = 120
 
 
 @dataclass
@@ -21,10 +38,126 @@ class RaceResult:
     max_speed: float
     avg_speed: float
     injury_at_position: Optional[float] = None
-    speed_over_time: List[Tuple[float, float]] = field(default_factory=list)  # (time, speed)
-    position_over_time: List[Tuple[float, float]] = field(default_factory=list)  # (time, position)
+    # Telemetrie als Views in den TelemetryBuffer der Simulation (keine Kopie)
+    sample_times: np.ndarray = field(default_factory=lambda: np.empty(0))
+    speed_samples: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    position_samples: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
     injury_times: List[float] = field(default_factory=list)  # Zeitpunkte von Verletzungen
     segment_performance: Dict[str, Dict] = field(default_factory=dict)  # Performance pro Segment
+    
+    @property
+    def speed_over_time(self) -> List[Tuple[float, float]]:
+        """Geschwindigkeitsverlauf als Liste von (Zeit, Geschwindigkeit)."""
+        return list(zip(self.sample_times.tolist(), self.speed_samples.tolist()))
+    
+    @property
+    def position_over_time(self) -> List[Tuple[float, float]]:
+        """Streckenverlauf als Liste von (Zeit, Position)."""
+        return list(zip(self.sample_times.tolist(), self.position_samples.tolist()))
+
+
+class RaceRandom:
+    """
+    Seedbarer Zufallsgenerator eines Rennens.
+    
+    Kapselt einen numpy.random.Generator und bietet für die Pferd-für-Pferd-
+    Berechnung dieselbe Schnittstelle wie das random-Modul (gauss, uniform,
+    random). Die Zufallszahlen werden blockweise vorab gezogen statt einzeln
+    pro Aufruf. Die vektorisierte Engine nutzt `generator` direkt.
+    """
+    
+    BLOCK_SIZE = 4096
+    
+    def __init__(self, seed: Optional[int] = None):
+        self.generator = np.random.default_rng(seed)
+        self._normals: List[float] = []
+        self._uniforms: List[float] = []
+    
+    def random(self) -> float:
+        """Gleichverteilte Zahl in [0, 1)."""
+        if not self._uniforms:
+            self._uniforms = self.generator.random(self.BLOCK_SIZE).tolist()
+        return self._uniforms.pop()
+    
+    def uniform(self, a: float, b: float) -> float:
+        """Gleichverteilte Zahl zwischen a und b."""
+        return a + (b - a) * self.random()
+    
+    def gauss(self, mu: float, sigma: float) -> float:
+        """Normalverteilte Zahl."""
+        if not self._normals:
+            self._normals = self.generator.standard_normal(self.BLOCK_SIZE).tolist()
+        return mu + sigma * self._normals.pop()
+    
+    def get_state(self) -> Tuple[Dict, List[float], List[float]]:
+        """Zustand inklusive der vorab gezogenen, noch nicht verbrauchten Zahlen."""
+        return self.generator.bit_generator.state, list(self._normals), list(self._uniforms)
+    
+    def set_state(self, state: Tuple[Dict, List[float], List[float]]):
+        """Setzt einen mit get_state() gesicherten Zustand wieder ein."""
+        generator_state, normals, uniforms = state
+        self.generator.bit_generator.state = copy.deepcopy(generator_state)
+        self._normals = list(normals)
+        self._uniforms = list(uniforms)
+
+
+class RunningStats:
+    """
+    Laufende Statistik über eine Wertefolge.
+    
+    Anzahl, Summe, Minimum, Maximum und Varianz (nach Welford) werden pro
+    Wert in O(1) nachgeführt; der Speicherbedarf bleibt konstant.
+    """
+    
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'mean', '_m2')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = float('-inf')
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value: float):
+        """Rechnet einen Wert ein."""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    def copy(self) -> 'RunningStats':
+        """Unabhängige Kopie des aktuellen Stands."""
+        other = RunningStats.__new__(RunningStats)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+    
+    @property
+    def variance(self) -> float:
+        """Stichprobenvarianz (0 bei weniger als zwei Werten)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def std(self) -> float:
+        """Standardabweichung."""
+        return self.variance ** 0.5
+
+
+def speed_summary(count: int, mean: float, minimum: float, maximum: float, std: float) -> Dict:
+    """Formatiert eine Geschwindigkeitsstatistik für RaceResult.segment_performance."""
+    return {
+        'avg_speed': mean,
+        'max_speed': maximum,
+        'min_speed': minimum,
+        'std_speed': std,
+        'samples': count
+    }
 
 
 @dataclass
@@ -41,23 +174,51 @@ class SimulationState:
 class RaceSimulation:
     """Hauptklasse für die Renn-Simulation."""
     
-    def __init__(self, horses: List[Horse], track: Track):
+    def __init__(self, horses: List[Horse], track: Track, seed: Optional[int] = None,
+                 time_step: float = FIXED_TIME_STEP, telemetry_policy: Optional[SamplingPolicy] = None):
         self.horses = horses
         self.track = track
         self.state = SimulationState()
+        
+        # Fester Zeitschritt: Ergebnis unabhängig von Bildrate und Multiplikator
+        self.time_step = time_step
+        self._accumulator = 0.0
+        self._previous_positions: Dict[str, float] = {h.name: 0.0 for h in horses}
+        
+        # Vorkompilierte Rennprofile (werden in start() erstellt)
+        self._profiles: List[RaceProfile] = []
+        
+        # Eigener Zufallsgenerator: gleicher Seed ergibt dasselbe Rennen
+        self.seed = seed
+        self.rng = RaceRandom(seed)
         self.results: List[RaceResult] = []
         self.finish_order: List[Horse] = []
         
         # Statistiken während des Rennens
-        self.speed_history: Dict[str, List[Tuple[float, float]]] = {h.name: [] for h in horses}  # (time, speed)
-        self.position_history: Dict[str, List[Tuple[float, float]]] = {h.name: [] for h in horses}  # (time, position)
+        # Telemetrie: Wann aufgezeichnet wird, bestimmt die Sampling-Policy
+        self.telemetry_policy = telemetry_policy if telemetry_policy is not None else EveryNTicks(5)
+        self.telemetry = self._create_telemetry()  # Geschwindigkeit und Position (Pferde x Samples)
         self.injury_history: Dict[str, List[float]] = {h.name: [] for h in horses}  # Zeitpunkte der Verletzungen
-        self.segment_stats: Dict[str, Dict[str, List[float]]] = {h.name: {} for h in horses}  # Performance pro Segment
+        self.segment_stats: Dict[str, Dict[str, RunningStats]] = {h.name: {} for h in horses}  # Performance pro Segment
+        self.speed_stats: Dict[str, RunningStats] = {h.name: RunningStats() for h in horses}  # Gesamttempo
+        self._segment_accumulators: List[List[RunningStats]] = []  # Pro Pferd nach Segmentindex
+        
+        # Rangfolge wird nach jedem Schritt inkrementell nachgeführt und von
+        # Physik und Zwischenstand gemeinsam genutzt
+        self.ranking = RankingTracker(len(horses))
+        self._positions: List[float] = [0.0] * len(horses)   # Positionen nach Zeilen für die Rangfolge
+        self._standings_cache: Optional[Tuple[int, List[tuple]]] = None
         
         # Callbacks für UI-Updates
         self.on_update: Optional[Callable] = None
         self.on_finish: Optional[Callable] = None
         
+        # Optionale Aufzeichnung jedes Schritts (z.B. replay.ReplayRecorder)
+        self.recorder = None
+        
+        # Optionale Zeitmessung je Phase (None = keine Messung)
+        self.profiler: Optional[PhaseProfiler] = None
+        
         # Reset all horses
         for horse in self.horses:
             horse.reset()
@@ -88,6 +249,16 @@ class RaceSimulation:
     
     def start(self):
         """Startet die Simulation."""
+        self._reset_race_state()
+        self._prepare_engine()
+        self._standings_cache = None
+        self._update_ranking(reset=True)
+        
+        if self.recorder is not None:
+            self.recorder.start(self)
+    
+    def _reset_race_state(self):
+        """Setzt den von der Engine unabhängigen Rennzustand zurück."""
         self.state.is_running = True
         self.state.is_paused = False
         self.state.is_finished = False
@@ -95,20 +266,105 @@ class RaceSimulation:
         self.state.tick_count = 0
         self.results = []
         self.finish_order = []
+        self.rng = RaceRandom(self.seed)
+        self._accumulator = 0.0
+        
+        # Neuer Telemetrie-Speicher, damit Views früherer Ergebnisse gültig bleiben
+        self.telemetry = self._create_telemetry()
+        self.telemetry_policy.reset()
+        
+        # Segment-Index der Strecke mit dem aktuellen Stand aufbauen
+        self.track.compile_segments()
         
         for horse in self.horses:
             horse.reset()
-            self.speed_history[horse.name] = []
-            self.position_history[horse.name] = []
             self.injury_history[horse.name] = []
-            # Initialisiere Segment-Performance-Tracking
+    
+    def _prepare_engine(self):
+        """
+        Bereitet den Engine-spezifischen Zustand für einen Rennstart vor.
+        
+        Pferd-für-Pferd-Engine: rennkonstante Anteile jedes Pferdes
+        vorkompilieren und die laufende Statistik je Pferd anlegen.
+        """
+        self._profiles = [horse.build_race_profile(self.track) for horse in self.horses]
+        
+        for horse in self.horses:
+            self._previous_positions[horse.name] = 0.0
+            # Initialisiere Segment-Performance-Tracking (laufende Statistik)
+            self.speed_stats[horse.name] = RunningStats()
             self.segment_stats[horse.name] = {}
             for segment in self.track.segments:
-                self.segment_stats[horse.name][segment.segment_type] = []
+                self.segment_stats[horse.name][segment.segment_type] = RunningStats()
+        
+        self._link_segment_accumulators()
+    
+    def _link_segment_accumulators(self):
+        """Direkter Zugriff auf die Segment-Statistik über den Segmentindex."""
+        self._segment_accumulators = [
+            [self.segment_stats[horse.name][segment.segment_type] for segment in self.track.segments]
+            for horse in self.horses
+        ]
+    
+    def _create_telemetry(self) -> TelemetryBuffer:
+        """Legt den Telemetrie-Speicher an (ohne Vorallokation, wenn abgeschaltet)."""
+        capacity = 256 if self.telemetry_policy.enabled else 0
+        return TelemetryBuffer(len(self.horses), capacity=capacity)
+    
+    def advance(self, frame_time: float) -> bool:
+        """
+        Lässt die Simulation um die Echtzeit eines Frames weiterlaufen.
+        
+        Die Frame-Zeit (skaliert mit dem Multiplikator) wird gesammelt und in
+        festen Schritten von `time_step` abgearbeitet. Bei hohem Multiplikator
+        laufen so mehrere kleine Schritte pro Frame statt eines großen. Der
+        Rest bleibt für den nächsten Frame erhalten und dient der
+        Interpolation beim Zeichnen.
+        
+        Args:
+            frame_time: Echtzeit seit dem letzten Frame in Sekunden
+            
+        Returns:
+            True wenn die Simulation noch läuft, False wenn beendet
+        """
+        if not self.state.is_running or self.state.is_paused:
+            return not self.state.is_finished
+        
+        self._accumulator += frame_time * self.state.speed_multiplier
+        steps = min(int(self._accumulator / self.time_step), MAX_STEPS_PER_FRAME)
+        
+        for i in range(steps):
+            # Nur der Zustand vor dem letzten Schritt wird zum Interpolieren gebraucht
+            if i == steps - 1:
+                self._remember_positions()
+            self._accumulator -= self.time_step
+            if not self._step(self.time_step):
+                self._accumulator = 0.0
+                return False
+        
+        # Zeit jenseits der Obergrenze verwerfen statt sie nachzuholen
+        if steps == MAX_STEPS_PER_FRAME:
+            self._accumulator = min(self._accumulator, self.time_step)
+        
+        return True
+    
+    def step(self) -> bool:
+        """
+        Führt genau einen festen Simulationsschritt aus.
+        
+        Returns:
+            True wenn die Simulation noch läuft, False wenn beendet
+        """
+        if not self.state.is_running or self.state.is_paused:
+            return not self.state.is_finished
+        return self._step(self.time_step)
     
     def tick(self, delta_time: float) -> bool:
         """
-        Führt einen Simulations-Tick aus.
+        Führt einen Simulations-Tick mit variabler Schrittweite aus.
+        
+        Für die Anzeige ist advance() vorzuziehen, da dort das Ergebnis nicht
+        von der Bildrate abhängt.
         
         Args:
             delta_time: Zeit seit dem letzten Tick in Sekunden
@@ -120,97 +376,262 @@ class RaceSimulation:
             return not self.state.is_finished
         
         # Angepasste Zeit basierend auf Geschwindigkeitsmultiplikator
-        adjusted_delta = delta_time * self.state.speed_multiplier
+        return self._step(delta_time * self.state.speed_multiplier)
+    
+    def fast_forward(self, on_progress: Optional[Callable[[float], None]] = None,
+                     record_telemetry: bool = True,
+                     should_stop: Optional[Callable[[], bool]] = None) -> Optional[List[RaceResult]]:
+        """
+        Rechnet das laufende Rennen ohne Anzeige so schnell wie möglich zu Ende.
+        
+        Es werden dieselben festen Schritte wie bei advance() verwendet, das
+        Ergebnis entspricht also dem zu Ende geschauten Rennen. on_update wird
+        dabei nicht aufgerufen, on_finish wie gewohnt am Rennende. Ein
+        pausiertes Rennen wird fortgesetzt.
+        
+        Args:
+            on_progress: Wird regelmäßig mit dem Rennfortschritt (0-1) aufgerufen
+            record_telemetry: False = für den Rest des Rennens keine Telemetrie
+            should_stop: Abbruchbedingung, wird zwischen den Schritten geprüft
+            
+        Returns:
+            Ergebnisliste, oder None wenn vorzeitig abgebrochen
+            
+        Raises:
+            RuntimeError: Wenn das Rennen noch nicht mit start() gestartet wurde
+        """
+        if self.state.is_finished:
+            return self.results
+        if not self.state.is_running:
+            raise RuntimeError("Rennen wurde noch nicht gestartet (start() aufrufen)")
+        
+        on_update = self.on_update
+        policy = self.telemetry_policy
+        self.on_update = None
+        if not record_telemetry:
+            self.telemetry_policy = NoTelemetry()
+        self.state.is_paused = False
+        self._accumulator = 0.0
+        
+        try:
+            steps = 0
+            while self._step(self.time_step):
+                steps += 1
+                if steps % FAST_FORWARD_PROGRESS_INTERVAL == 0:
+                    if should_stop and should_stop():
+                        return None
+                    if on_progress:
+                        on_progress(self.get_race_progress())
+        finally:
+            self.on_update = on_update
+            self.telemetry_policy = policy
+        
+        if on_progress:
+            on_progress(1.0)
+        return self.results
+    
+    def enable_profiling(self, history: int = 10000) -> PhaseProfiler:
+        """Schaltet die Zeitmessung je Phase ein und gibt den Profiler zurück."""
+        self.profiler = PhaseProfiler(history)
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Schaltet die Zeitmessung wieder aus."""
+        self.profiler = None
+    
+    def _step(self, adjusted_delta: float) -> bool:
+        """Rückt die Simulation um `adjusted_delta` Sekunden Simulationszeit vor."""
         self.state.elapsed_time += adjusted_delta
         self.state.tick_count += 1
         
-        # Race Context berechnen für Spannungs-Mechanik
-        active_horses = [h for h in self.horses if not h.finished]
-        if active_horses:
-            positions = [h.position for h in active_horses]
-            leader_position = max(positions)
-            average_position = sum(positions) / len(positions)
+        prof = self.profiler
+        if prof is not None:
+            prof.begin_tick(self.state.tick_count, self.state.elapsed_time)
+        
+        all_finished = self._advance_horses(adjusted_delta)
+        
+        if prof is not None:
+            t = prof.clock()
+        if self.recorder is not None and not all_finished:
+            self.recorder.record(self)
+        if prof is not None:
+            t = prof.lap('telemetry', t)
+        
+        # Callback für UI-Update
+        if self.on_update:
+            self.on_update(self)
+        if prof is not None:
+            t = prof.lap('callback', t)
+        
+        # Prüfen ob alle fertig sind
+        if all_finished:
+            self._finalize_race()
+            if prof is not None:
+                prof.lap('finalize', t)
+                prof.end_tick()
+            return False
+        
+        if prof is not None:
+            prof.end_tick()
+        return True
+    
+    def _advance_horses(self, adjusted_delta: float) -> bool:
+        """
+        Bewegt alle noch laufenden Pferde um einen Zeitschritt weiter.
+        
+        Args:
+            adjusted_delta: Bereits mit dem Multiplikator skalierte Zeit
             
-            # Platzierungen berechnen
-            sorted_horses = sorted(active_horses, key=lambda h: h.position, reverse=True)
-            horse_ranks = {h.name: i + 1 for i, h in enumerate(sorted_horses)}
-        else:
-            leader_position = 0
-            average_position = 0
-            horse_ranks = {}
+        Returns:
+            True wenn zu Beginn des Schritts kein Pferd mehr lief
+        """
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+        
+        # Race Context für Spannungs-Mechanik aus der nachgeführten Rangfolge
+        leader = self.ranking.leader
+        leader_position = self.horses[leader].position if leader >= 0 else 0
+        horse_ranks = self.ranking.rank_list
+        positions = self._positions
+        finished_rows: List[int] = []
         
         all_finished = True
+        recording = self.telemetry_policy.enabled
+        moved_rows = []
+        finishers: List[Horse] = []
+        step_start = self.state.elapsed_time - adjusted_delta
+        if prof is not None:
+            t = prof.lap('ranking', t)
         
-        for horse in self.horses:
+        for row, (horse, profile, accumulators) in enumerate(
+                zip(self.horses, self._profiles, self._segment_accumulators)):
             if horse.finished:
                 continue
             
             all_finished = False
+            if recording:
+                moved_rows.append(row)
             
             # Aktuelle Position als Bruchteil der Strecke
             relative_position = horse.position / self.track.length
             
-            # Streckenmodifikatoren holen
-            modifiers = self.track.get_modifiers_at_position(relative_position)
-            
-            # Aktuelles Segment ermitteln
-            current_segment = self.track.get_segment_at_position(relative_position)
-            
-            # Race Context für dieses Pferd
-            race_context = {
-                'leader_position': leader_position,
-                'average_position': average_position,
-                'my_rank': horse_ranks.get(horse.name, 5)
-            }
+            # Segment, Modifikatoren und Verletzungschance in einer Abfrage
+            segment_info = self.track.get_segment_info(relative_position)
+            if segment_info:
+                current_segment = segment_info.segment
+                modifiers = segment_info.modifiers
+                injury_chance = segment_info.injury_chance
+            else:
+                current_segment = None
+                modifiers = self.track.get_modifiers_at_position(relative_position)
+                injury_chance = self.track.get_injury_chance_at_position(relative_position)
+            if prof is not None:
+                t = prof.lap('lookup', t)
             
             # Verletzungsprüfung
-            injury_chance = self.track.get_injury_chance_at_position(relative_position)
             was_injured_before = horse.is_injured
-            horse.check_injury(injury_chance * adjusted_delta * 10)
+            horse.check_injury(injury_chance * adjusted_delta * 10, self.rng)
             
             # Verletzung tracken
             if not was_injured_before and horse.is_injured:
                 self.injury_history[horse.name].append(self.state.elapsed_time)
+            if prof is not None:
+                t = prof.lap('injury', t)
             
-            # Geschwindigkeit berechnen (mit race_context für Spannungs-Mechanik)
-            speed = horse.get_effective_speed(
-                modifiers, 
-                horse.position, 
-                self.track.length,
-                race_context
-            )
+            # Geschwindigkeit berechnen (nur noch die dynamischen Anteile)
+            my_rank = horse_ranks[row]
+            if segment_info:
+                speed = horse.get_profiled_speed(
+                    profile,
+                    segment_info.index,
+                    self.track.length,
+                    leader_position,
+                    my_rank,
+                    self.rng
+                )
+            else:
+                race_context = {
+                    'leader_position': leader_position,
+                    'average_position': self._average_position(),
+                    'my_rank': my_rank
+                }
+                speed = horse.get_effective_speed(
+                    modifiers,
+                    horse.position,
+                    self.track.length,
+                    race_context,
+                    self.rng
+                )
+            if prof is not None:
+                t = prof.lap('speed', t)
             
-            # Segment-Performance tracken
-            if current_segment and current_segment.segment_type in self.segment_stats[horse.name]:
-                self.segment_stats[horse.name][current_segment.segment_type].append(speed)
+            # Segment-Performance tracken (O(1), ohne Werteliste)
+            self.speed_stats[horse.name].add(speed)
+            if segment_info:
+                accumulators[segment_info.index].add(speed)
+            if prof is not None:
+                t = prof.lap('stats', t)
             
             # Position aktualisieren
             distance_moved = speed * adjusted_delta * 10  # Skalierung für sichtbare Bewegung
             horse.position += distance_moved
             horse.current_speed = speed
             
-            # Statistiken speichern
-            if self.state.tick_count % 5 == 0:  # Alle 5 Ticks
-                self.speed_history[horse.name].append((self.state.elapsed_time, speed))
-                self.position_history[horse.name].append((self.state.elapsed_time, horse.position))
-            
-            # Ziellinie überprüfen
+            # Ziellinie überprüfen; Zielzeit innerhalb des Schritts linear
+            # interpolieren (Zielfoto statt Ende des Ticks)
             if horse.position >= self.track.length:
+                remaining = self.track.length - (horse.position - distance_moved)
+                fraction = remaining / distance_moved if distance_moved > 0 else 1.0
                 horse.position = self.track.length
                 horse.finished = True
-                horse.finish_time = self.state.elapsed_time
-                self.finish_order.append(horse)
+                horse.finish_time = step_start + fraction * adjusted_delta
+                finishers.append(horse)
+                finished_rows.append(row)
+            positions[row] = horse.position
+            if prof is not None:
+                t = prof.lap('movement', t)
         
-        # Callback für UI-Update
-        if self.on_update:
-            self.on_update(self)
+        # Pferde, die im selben Schritt ankommen, nach Zielzeit einreihen
+        if finishers:
+            finishers.sort(key=lambda h: h.finish_time)
+            self.finish_order.extend(finishers)
+        if prof is not None:
+            t = prof.lap('movement', t)
         
-        # Prüfen ob alle fertig sind
-        if all_finished:
-            self._finalize_race()
-            return False
+        # Rangfolge per Insertion-Durchlauf aus den eben geschriebenen Positionen
+        self.ranking.update_running(positions, finished_rows)
+        if prof is not None:
+            t = prof.lap('ranking', t)
         
-        return True
+        # Statistiken speichern (gemäß Sampling-Policy, nach der Rangfolge,
+        # damit z.B. EveryDistance das aktuelle Schlusslicht sieht)
+        if moved_rows and self.telemetry_policy.should_sample(self):
+            self.telemetry.record(
+                self.state.elapsed_time,
+                moved_rows,
+                speed=[self.horses[i].current_speed for i in moved_rows],
+                position=[self.horses[i].position for i in moved_rows]
+            )
+        if prof is not None:
+            prof.lap('telemetry', t)
+        return all_finished
+    
+    def _update_ranking(self, reset: bool = False):
+        """Führt die Rangfolge mit den aktuellen Positionen nach."""
+        self._positions = [h.position for h in self.horses]
+        count = len(self.horses)
+        positions = np.fromiter((h.position for h in self.horses), dtype=np.float64, count=count)
+        finished = np.fromiter((h.finished for h in self.horses), dtype=bool, count=count)
+        if reset:
+            self.ranking.reset(positions, finished)
+        else:
+            self.ranking.update(positions, finished)
+    
+    def _average_position(self) -> float:
+        """Durchschnittsposition der laufenden Pferde (nur für Strecken ohne Segment-Index)."""
+        positions = [h.position for h in self.horses if not h.finished]
+        return sum(positions) / len(positions) if positions else 0
     
     def _finalize_race(self):
         """Finalisiert das Rennen und erstellt die Ergebnisliste."""
@@ -218,24 +639,15 @@ class RaceSimulation:
         self.state.is_finished = True
         
         # Ergebnisse erstellen
+        rows = {id(horse): row for row, horse in enumerate(self.horses)}
         for i, horse in enumerate(self.finish_order):
-            speeds = self.speed_history[horse.name]
+            row = rows[id(horse)]
             
-            # Extrahiere nur die Geschwindigkeitswerte für avg/max
-            speed_values = [s[1] for s in speeds] if speeds else [0]
-            avg_speed = sum(speed_values) / len(speed_values) if speed_values else 0
-            max_speed = max(speed_values) if speed_values else 0
+            # Durchschnitt und Maximum über alle Ticks
+            avg_speed, max_speed = self._speed_summary(horse)
             
             # Segment-Performance berechnen
-            segment_performance = {}
-            for segment_type, speed_list in self.segment_stats[horse.name].items():
-                if speed_list:
-                    segment_performance[segment_type] = {
-                        'avg_speed': sum(speed_list) / len(speed_list),
-                        'max_speed': max(speed_list),
-                        'min_speed': min(speed_list),
-                        'samples': len(speed_list)
-                    }
+            segment_performance = self._segment_performance(horse)
             
             result = RaceResult(
                 horse=horse,
@@ -244,44 +656,199 @@ class RaceSimulation:
                 was_injured=horse.is_injured,
                 max_speed=max_speed,
                 avg_speed=avg_speed,
-                speed_over_time=self.speed_history[horse.name].copy(),
-                position_over_time=self.position_history[horse.name].copy(),
+                sample_times=self.telemetry.times(row),
+                speed_samples=self.telemetry.channel('speed', row),
+                position_samples=self.telemetry.channel('position', row),
                 injury_times=self.injury_history[horse.name].copy(),
                 segment_performance=segment_performance
             )
             self.results.append(result)
         
+        if self.recorder is not None:
+            self.recorder.finish(self)
+        
         # Callback für Rennende
         if self.on_finish:
             self.on_finish(self.results)
     
+    def _speed_summary(self, horse: Horse) -> Tuple[float, float]:
+        """Gibt (Durchschnitt, Maximum) der Geschwindigkeit eines Pferdes zurück."""
+        stats = self.speed_stats[horse.name]
+        if not stats.count:
+            return 0.0, 0.0
+        return stats.mean, stats.maximum
+    
+    def _segment_performance(self, horse: Horse) -> Dict[str, Dict]:
+        """Fasst die laufende Segment-Statistik eines Pferdes zusammen."""
+        return {
+            segment_type: speed_summary(stats.count, stats.mean, stats.minimum, stats.maximum, stats.std)
+            for segment_type, stats in self.segment_stats[horse.name].items()
+            if stats.count
+        }
+    
     def get_current_standings(self) -> List[tuple]:
         """
         Gibt die aktuelle Reihenfolge der Pferde zurück.
         
         Pferde die bereits im Ziel sind behalten ihre finale Platzierung.
-        Noch laufende Pferde werden nach Position sortiert.
+        Noch laufende Pferde folgen in der nachgeführten Rangfolge. Die Liste
+        wird nur neu gebaut, wenn sich die Reihenfolge geändert hat, und darf
+        vom Aufrufer nicht verändert werden.
         
         Returns:
             Liste von (Position, Horse) Tupeln
         """
-        standings = []
+        version = self.ranking.version
+        if self._standings_cache is not None and self._standings_cache[0] == version:
+            return self._standings_cache[1]
         
         # Zuerst: Pferde die bereits angekommen sind (in Zielreihenfolge)
-        for i, horse in enumerate(self.finish_order):
-            standings.append((i + 1, horse))
-        
-        # Dann: Noch laufende Pferde nach Position sortiert
-        running_horses = [h for h in self.horses if not h.finished]
-        running_horses_sorted = sorted(running_horses, key=lambda h: h.position, reverse=True)
+        standings = [(i + 1, horse) for i, horse in enumerate(self.finish_order)]
         
         # Platzierungen für laufende Pferde beginnen nach den Angekommenen
         start_pos = len(self.finish_order) + 1
-        for i, horse in enumerate(running_horses_sorted):
-            standings.append((start_pos + i, horse))
+        for i, row in enumerate(self.ranking.order.tolist()):
+            standings.append((start_pos + i, self.horses[row]))
         
+        self._standings_cache = (version, standings)
         return standings
     
+    def _remember_positions(self):
+        """Merkt sich die Positionen vor dem nächsten Schritt für die Interpolation."""
+        for horse in self.horses:
+            self._previous_positions[horse.name] = horse.position
+    
+    @property
+    def interpolation_alpha(self) -> float:
+        """Bereits angesammelter Anteil (0-1) des nächsten Simulationsschritts."""
+        return min(1.0, self._accumulator / self.time_step)
+    
+    def get_interpolated_progress(self) -> Dict[str, float]:
+        """
+        Gibt den Fortschritt aller Pferde zwischen den letzten beiden
+        Simulationsschritten interpoliert zurück (für flüssiges Zeichnen).
+        """
+        alpha = self.interpolation_alpha
+        progress = {}
+        for horse in self.horses:
+            previous = self._previous_positions[horse.name]
+            position = previous + (horse.position - previous) * alpha
+            progress[horse.name] = min(100, (position / self.track.length) * 100)
+        return progress
+    
+    def get_trailing_position(self) -> float:
+        """Position des letzten noch laufenden Pferdes (Streckenlänge, wenn alle im Ziel)."""
+        if not len(self.ranking):
+            return self.track.length
+        return self.horses[int(self.ranking.order[-1])].position
+    
+    def snapshot(self) -> RaceSnapshot:
+        """
+        Hält den kompletten Zustand des Rennens fest.
+        
+        Enthalten sind Pferdezustand, SimulationState, Zielreihenfolge,
+        Rangfolge, Zufallsgenerator, Telemetrie und Statistiken. Der Snapshot
+        teilt keine veränderlichen Daten mit der Simulation.
+        """
+        rows = {id(horse): row for row, horse in enumerate(self.horses)}
+        return RaceSnapshot(
+            state=replace(self.state),
+            horse_state=self._capture_horse_state(),
+            previous_positions=self._capture_previous_positions(),
+            finish_order=[rows[id(horse)] for horse in self.finish_order],
+            ranking=(self.ranking.order.copy(), self.ranking.ranks.copy()),
+            accumulator=self._accumulator,
+            rng_state=self.rng.get_state(),
+            telemetry=self.telemetry.copy(),
+            telemetry_policy=copy.deepcopy(self.telemetry_policy),
+            injury_history={name: list(times) for name, times in self.injury_history.items()},
+            statistics=self._capture_statistics(),
+            results=list(self.results)
+        )
+    
+    def restore(self, snapshot: RaceSnapshot, seed: Optional[int] = None):
+        """
+        Setzt die Simulation auf einen Snapshot zurück.
+        
+        Der Snapshot muss vom selben Starterfeld stammen und bleibt
+        unverändert, kann also mehrfach eingesetzt werden.
+        
+        Args:
+            snapshot: Mit snapshot() erstellter Zustand
+            seed: Wenn gesetzt, geht es ab dem Snapshot mit einem neuen
+                  Zufallsgenerator weiter statt mit dem gesicherten (für
+                  Verzweigungen "was passiert ab hier")
+        """
+        if len(snapshot.previous_positions) != len(self.horses):
+            raise ValueError("Snapshot passt nicht zum Starterfeld")
+        
+        self.state = replace(snapshot.state)
+        self._restore_horse_state(snapshot.horse_state)
+        self._restore_previous_positions(snapshot.previous_positions)
+        self.finish_order = [self.horses[row] for row in snapshot.finish_order]
+        self.ranking.restore(*snapshot.ranking)
+        self._positions = [h.position for h in self.horses]
+        self._standings_cache = None
+        self._accumulator = snapshot.accumulator
+        
+        if seed is None:
+            self.rng = RaceRandom(self.seed)
+            self.rng.set_state(snapshot.rng_state)
+        else:
+            self.rng = RaceRandom(seed)
+        
+        self.telemetry = snapshot.telemetry.copy()
+        self.telemetry_policy = copy.deepcopy(snapshot.telemetry_policy)
+        self.injury_history = {name: list(times) for name, times in snapshot.injury_history.items()}
+        self._restore_statistics(snapshot.statistics)
+        self.results = list(snapshot.results)
+    
+    def get_horse_columns(self, names: Tuple[str, ...]) -> List[np.ndarray]:
+        """Ausgewählte Zustandsfelder aller Pferde als Spalten (nach Zeilen)."""
+        return [np.array([getattr(horse, name) for horse in self.horses]) for name in names]
+    
+    def _capture_horse_state(self) -> Dict[str, np.ndarray]:
+        """Zustandsfelder aller Pferde als Spalten."""
+        return {
+            name: np.array([getattr(horse, name) for horse in self.horses])
+            for name in HORSE_STATE_FIELDS
+        }
+    
+    def _restore_horse_state(self, columns: Dict[str, np.ndarray]):
+        """Schreibt gesicherte Zustandsspalten in die Pferde zurück."""
+        for name in HORSE_STATE_FIELDS:
+            for horse, value in zip(self.horses, columns[name].tolist()):
+                setattr(horse, name, value)
+    
+    def _capture_previous_positions(self) -> np.ndarray:
+        return np.array([self._previous_positions[horse.name] for horse in self.horses])
+    
+    def _restore_previous_positions(self, positions: np.ndarray):
+        for horse, position in zip(self.horses, positions.tolist()):
+            self._previous_positions[horse.name] = position
+    
+    def _capture_statistics(self) -> Dict[str, Any]:
+        """Kopie der laufenden Statistik (Gesamttempo und pro Segment)."""
+        return {
+            'speed': {name: stats.copy() for name, stats in self.speed_stats.items()},
+            'segments': {
+                name: {segment_type: stats.copy() for segment_type, stats in per_type.items()}
+                for name, per_type in self.segment_stats.items()
+            },
+        }
+    
+    def _restore_statistics(self, statistics: Dict[str, Any]):
+        self.speed_stats = {name: stats.copy() for name, stats in statistics['speed'].items()}
+        self.segment_stats = {
+            name: {segment_type: stats.copy() for segment_type, stats in per_type.items()}
+            for name, per_type in statistics['segments'].items()
+        }
+        self._link_segment_accumulators()
+    
+    def get_race_progress(self) -> float:
+        """Rennfortschritt 0-1, gemessen am letzten noch laufenden Pferd."""
+        return min(1.0, self.get_trailing_position() / self.track.length)
+    
     def get_progress(self) -> Dict[str, float]:
         """
         Gibt den Fortschritt aller Pferde als Prozent zurück.
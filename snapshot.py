@@ -0,0 +1,55 @@
+"""
+Zwischenstand einer laufenden Simulation (Checkpoint).
+
+RaceSimulation.snapshot() hält den kompletten Zustand eines Rennens in
+einem RaceSnapshot fest, RaceSimulation.restore() setzt ihn wieder ein.
+Damit lässt sich ein Rennen zurückspulen oder ab einem Zwischenstand
+mehrfach mit anderem Zufall weiterrechnen ("was passiert ab hier").
+
+Ein Snapshot enthält nur Arrays, Zahlen und einfache Container; er ist
+kopier- und picklebar und wird beim Wiederherstellen nicht verändert, kann
+also beliebig oft eingesetzt werden.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Veränderliche Felder eines Pferdes während des Rennens (siehe Horse.reset)
+HORSE_STATE_FIELDS = (
+    'position', 'current_speed', 'is_injured', 'injury_slowdown',
+    'res_faktor_slowdown', 'finished', 'finish_time', 'fatigue', 'momentum',
+)
+
+
+@dataclass
+class RaceSnapshot:
+    """Vollständiger Zustand einer RaceSimulation zu einem Zeitpunkt."""
+    state: Any                                  # Kopie von SimulationState
+    horse_state: Dict[str, np.ndarray]          # Spalte je Feld aus HORSE_STATE_FIELDS
+    previous_positions: np.ndarray              # Positionen vor dem letzten Schritt (Interpolation)
+    finish_order: List[int]                     # Zeilenindizes in Zielreihenfolge
+    ranking: Tuple[np.ndarray, np.ndarray]      # (Reihenfolge, Platz je Zeile)
+    accumulator: float
+    rng_state: Tuple[Dict, List[float], List[float]]  # Generator-Zustand und vorab gezogene Zahlen
+    telemetry: Any                              # Kopie des TelemetryBuffer
+    telemetry_policy: Any                       # Kopie der Sampling-Policy (mit Zustand)
+    injury_history: Dict[str, List[float]]
+    statistics: Dict[str, Any]                  # Engine-spezifische Laufzeitstatistik
+    results: List[Any] = field(default_factory=list)
+
+    @property
+    def elapsed_time(self) -> float:
+        """Simulationszeit des Snapshots."""
+        return self.state.elapsed_time
+
+    @property
+    def tick_count(self) -> int:
+        """Anzahl Simulationsschritte bis zum Snapshot."""
+        return self.state.tick_count
+
+    def copy(self) -> 'RaceSnapshot':
+        """Unabhängige Kopie (z.B. zur Weitergabe an andere Prozesse)."""
+        return copy.deepcopy(self)
@@ -1,4 +1,6 @@
 # Strecken-Modul
+from typing import Optional
+
 from .base_track import Track
 from .waldstrecke.track import WaldstreckeTrack
 from .sandbahn.track import SandbahnTrack
@@ -23,3 +25,11 @@ def get_track(track_name: str) -> Track:
 def get_all_tracks() -> list:
     """Gibt alle verfügbaren Strecken zurück."""
     return [cls() for cls in AVAILABLE_TRACKS.values()]
+
+
+def get_track_id(track: Track) -> Optional[str]:
+    """Gibt den Schlüssel einer Strecke für get_track() zurück (None bei eigenen Strecken)."""
+    for track_id, cls in AVAILABLE_TRACKS.items():
+        if type(track) is cls:
+            return track_id
+    return None
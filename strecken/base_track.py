@@ -3,7 +3,9 @@ Basis-Klasse für alle Strecken.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -17,6 +19,15 @@ class TrackSegment:
     color: Tuple[int, int, int]  # Farbe für die Visualisierung
 
 
+@dataclass(frozen=True)
+class SegmentInfo:
+    """Vorberechnete Simulationsdaten eines Segments (aus Track.compile_segments)."""
+    index: int
+    segment: TrackSegment
+    modifiers: Mapping    # Schreibgeschützte Modifikatoren
+    injury_chance: float  # Verletzungschance im Segment
+
+
 class Track(ABC):
     """Abstrakte Basisklasse für Strecken."""
     
@@ -29,6 +40,10 @@ class Track(ABC):
         self.background_color: Tuple[int, int, int] = (34, 139, 34)
         self.track_color: Tuple[int, int, int] = (139, 119, 101)
         
+        # Segment-Index (wird bei der ersten Abfrage aufgebaut)
+        self._segment_starts: Optional[List[float]] = None
+        self._segment_infos: Optional[List[SegmentInfo]] = None
+        
     @abstractmethod
     def get_modifiers_at_position(self, position: float) -> Dict:
         """
@@ -44,12 +59,83 @@ class Track(ABC):
         """
         pass
     
+    def compile_segments(self):
+        """
+        Baut den Segment-Index der Strecke auf.
+        
+        Die Segmentanfänge werden für eine Binärsuche abgelegt und für jedes
+        Segment werden Modifikatoren und Verletzungschance einmalig über
+        get_modifiers_at_position / get_injury_chance_at_position bestimmt,
+        damit Sonderregeln der Unterklassen erhalten bleiben. Muss erneut
+        aufgerufen werden, wenn sich die Segmente nachträglich ändern.
+        """
+        self._segment_starts = [segment.start for segment in self.segments]
+        self._segment_infos = None
+        
+        infos = []
+        for i, segment in enumerate(self.segments):
+            midpoint = (segment.start + segment.end) / 2
+            infos.append(SegmentInfo(
+                index=i,
+                segment=segment,
+                modifiers=MappingProxyType(dict(self.get_modifiers_at_position(midpoint))),
+                injury_chance=self.get_injury_chance_at_position(midpoint)
+            ))
+        self._segment_infos = infos
+    
+    def __getstate__(self) -> Dict:
+        """
+        Zustand für pickle ohne den Segment-Index.
+        
+        Die schreibgeschützten Modifikatoren (MappingProxyType) lassen sich
+        nicht picklen; der Index wird nach dem Laden bei der ersten Abfrage
+        neu aufgebaut (z.B. in den Prozessen von monte_carlo).
+        """
+        state = self.__dict__.copy()
+        state['_segment_starts'] = None
+        state['_segment_infos'] = None
+        return state
+    
+    def _find_segment_index(self, position: float) -> int:
+        """Index des Segments an der Position (-1 ohne Segmente)."""
+        if self._segment_starts is None:
+            self.compile_segments()
+        
+        i = bisect_right(self._segment_starts, position) - 1
+        last = len(self.segments) - 1
+        if i >= last:
+            return last
+        if i >= 0 and position < self.segments[i].end:
+            return i
+        
+        # Lücken oder Überlappungen: wie bisher das erste passende Segment
+        for j, segment in enumerate(self.segments):
+            if segment.start <= position < segment.end:
+                return j
+        return last
+    
     def get_segment_at_position(self, position: float) -> TrackSegment:
         """Findet das Segment an einer bestimmten Position."""
-        for segment in self.segments:
-            if segment.start <= position < segment.end:
-                return segment
-        return self.segments[-1] if self.segments else None
+        i = self._find_segment_index(position)
+        return self.segments[i] if i >= 0 else None
+    
+    def get_segment_info(self, position: float) -> Optional[SegmentInfo]:
+        """
+        Liefert Segment, Modifikatoren und Verletzungschance an einer Position
+        mit einer einzigen Index-Abfrage (ohne Kopie der Modifikatoren).
+        """
+        i = self._find_segment_index(position)
+        if i < 0:
+            return None
+        if self._segment_infos is None:
+            self.compile_segments()
+        return self._segment_infos[i]
+    
+    def get_segment_infos(self) -> List[SegmentInfo]:
+        """Gibt die vorberechneten Daten aller Segmente zurück."""
+        if self._segment_infos is None:
+            self.compile_segments()
+        return self._segment_infos
     
     def get_display_info(self) -> Dict:
         """Gibt Anzeigeinformationen für die UI zurück."""
@@ -0,0 +1,182 @@
+"""
+Telemetrie-Speicher für die Renn-Simulation.
+
+Statt Listen von (Zeit, Wert)-Tupeln pro Pferd liegt jeder Kanal
+(z.B. Geschwindigkeit, Position) als 2-D-Array vor: Pferde als Zeilen,
+Samples als Spalten. Die Zeitachse ist für alle Pferde gemeinsam. Das Array
+wird vorab angelegt und bei Bedarf verdoppelt.
+
+Ein Pferd wird nur aufgezeichnet, solange es läuft. Da ein Pferd im Ziel
+nicht wieder startet, sind seine gültigen Samples immer die ersten
+`lengths[zeile]` Spalten; die Zugriffe liefern dafür Views ohne Kopie.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+
+import numpy as np
+
+DEFAULT_CHANNELS = ('speed', 'position')
+
+
+class SamplingPolicy(ABC):
+    """
+    Legt fest, nach welchen Simulationsschritten Telemetrie aufgezeichnet wird.
+
+    Unterklassen implementieren should_sample(); reset() wird beim Rennstart
+    aufgerufen. Die Simulation fragt erst nach der Aktualisierung der
+    Rangfolge, Positionen und Rangfolge entsprechen also dem neuen Schritt.
+    """
+
+    enabled = True
+
+    def reset(self):
+        """Setzt den internen Zustand für ein neues Rennen zurück."""
+
+    @abstractmethod
+    def should_sample(self, simulation) -> bool:
+        """Entscheidet nach einem Simulationsschritt, ob aufgezeichnet wird."""
+
+
+class EveryNTicks(SamplingPolicy):
+    """Zeichnet jeden n-ten Simulationsschritt auf."""
+
+    def __init__(self, ticks: int = 5):
+        if ticks < 1:
+            raise ValueError("ticks muss mindestens 1 sein")
+        self.ticks = ticks
+
+    def should_sample(self, simulation) -> bool:
+        return simulation.state.tick_count % self.ticks == 0
+
+
+class EveryInterval(SamplingPolicy):
+    """Zeichnet alle `seconds` Sekunden Simulationszeit auf (gleichmäßige Zeitachse)."""
+
+    def __init__(self, seconds: float = 0.1):
+        if seconds <= 0:
+            raise ValueError("seconds muss positiv sein")
+        self.seconds = seconds
+        self._next_time = 0.0
+
+    def reset(self):
+        self._next_time = self.seconds
+
+    def should_sample(self, simulation) -> bool:
+        # Kleine Toleranz gegen Rundungsfehler der aufsummierten Zeitschritte
+        elapsed = simulation.state.elapsed_time + 1e-9
+        if elapsed < self._next_time:
+            return False
+        self._next_time = (math.floor(elapsed / self.seconds) + 1) * self.seconds
+        return True
+
+
+class EveryDistance(SamplingPolicy):
+    """
+    Zeichnet alle `meters` Meter auf, gemessen am letzten noch laufenden
+    Pferd. Dessen Position steigt monoton, auch wenn Pferde ins Ziel kommen,
+    sodass bis zum Rennende gleichmäßig aufgezeichnet wird.
+    """
+
+    def __init__(self, meters: float = 10.0):
+        if meters <= 0:
+            raise ValueError("meters muss positiv sein")
+        self.meters = meters
+        self._next_mark = 0.0
+
+    def reset(self):
+        self._next_mark = self.meters
+
+    def should_sample(self, simulation) -> bool:
+        position = simulation.get_trailing_position()
+        if position < self._next_mark:
+            return False
+        self._next_mark = (math.floor(position / self.meters) + 1) * self.meters
+        return True
+
+
+class NoTelemetry(SamplingPolicy):
+    """Keine Telemetrie, z.B. für Monte-Carlo-Läufe, die nur die Zielreihenfolge brauchen."""
+
+    enabled = False
+
+    def should_sample(self, simulation) -> bool:
+        return False
+
+
+class TelemetryBuffer:
+    """Vorallokierter, wachsender Telemetrie-Speicher (Pferde x Samples je Kanal)."""
+
+    def __init__(self, rows: int, channels: Sequence[str] = DEFAULT_CHANNELS,
+                 capacity: int = 256, dtype=np.float32):
+        self.rows = rows
+        self.dtype = dtype
+        self.size = 0  # Anzahl belegter Spalten
+        self.lengths = np.zeros(rows, dtype=np.int64)  # Gültige Samples je Zeile
+        self._times = np.empty(capacity, dtype=np.float64)
+        self._channels: Dict[str, np.ndarray] = {
+            name: np.full((rows, capacity), np.nan, dtype=dtype) for name in channels
+        }
+
+    @property
+    def capacity(self) -> int:
+        """Anzahl Spalten, die ohne Vergrößerung Platz haben."""
+        return self._times.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Belegter Speicher in Bytes."""
+        return self._times.nbytes + sum(a.nbytes for a in self._channels.values())
+
+    def _grow(self):
+        """Verdoppelt die Kapazität."""
+        capacity = max(16, self.capacity * 2)
+        times = np.empty(capacity, dtype=np.float64)
+        times[:self.size] = self._times[:self.size]
+        self._times = times
+        for name, data in self._channels.items():
+            grown = np.full((self.rows, capacity), np.nan, dtype=self.dtype)
+            grown[:, :self.size] = data[:, :self.size]
+            self._channels[name] = grown
+
+    def copy(self) -> 'TelemetryBuffer':
+        """Kopie der belegten Samples (z.B. für Snapshots)."""
+        other = TelemetryBuffer(self.rows, tuple(self._channels), capacity=self.size, dtype=self.dtype)
+        other.size = self.size
+        other.lengths[:] = self.lengths
+        other._times[:] = self._times[:self.size]
+        for name, data in self._channels.items():
+            other._channels[name][:] = data[:, :self.size]
+        return other
+
+    def record(self, time: float, rows, **values):
+        """
+        Hängt ein Sample an.
+
+        Args:
+            time: Simulationszeit des Samples
+            rows: Indizes der aufgezeichneten (laufenden) Pferde
+            **values: Werte je Kanal, in derselben Reihenfolge wie `rows`
+        """
+        if self.size == self.capacity:
+            self._grow()
+        column = self.size
+        self._times[column] = time
+        for name, data in values.items():
+            self._channels[name][rows, column] = data
+        self.lengths[rows] += 1
+        self.size += 1
+
+    def times(self, row: int = None) -> np.ndarray:
+        """Zeitachse (View); mit `row` nur die gültigen Samples dieses Pferdes."""
+        end = self.size if row is None else int(self.lengths[row])
+        return self._times[:end]
+
+    def channel(self, name: str, row: int) -> np.ndarray:
+        """Gültige Samples eines Kanals für ein Pferd (View, keine Kopie)."""
+        return self._channels[name][row, :int(self.lengths[row])]
+
+    def array(self, name: str) -> np.ndarray:
+        """Kompletter Kanal als View (Pferde x belegte Spalten, ungültig = NaN)."""
+        return self._channels[name][:, :self.size]
@@ -0,0 +1,58 @@
+"""
+Vorberechnete Hintergründe für die Bildschirme.
+
+Ein vertikaler Farbverlauf wird einmal per NumPy in eine Surface geschrieben
+und danach nur noch geblittet. Der Cache ist nach (Größe, Farben) geschlüsselt;
+ändert sich die Auflösung, entsteht beim nächsten Aufruf automatisch eine neue
+Surface. Die zurückgegebenen Surfaces werden geteilt und dürfen nicht
+verändert werden.
+"""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+import pygame
+
+# Mehrere Bildschirme und Auflösungen gleichzeitig, aber nicht unbegrenzt
+MAX_ENTRIES = 8
+
+_cache: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
+
+
+def _build_gradient(size: Tuple[int, int], top: Tuple[int, int, int],
+                    bottom: Tuple[int, int, int]) -> pygame.Surface:
+    """Rendert einen vertikalen Verlauf von `top` (oben) nach `bottom` (unten)."""
+    width, height = size
+    ratio = np.arange(height, dtype=np.float64) / max(1, height)
+    start = np.asarray(top, dtype=np.float64)
+    rows = (start + (np.asarray(bottom, dtype=np.float64) - start) * ratio[:, None]).astype(np.uint8)
+
+    # surfarray erwartet (x, y, rgb); alle Spalten erhalten dieselbe Zeilenfarbe
+    pixels = np.repeat(rows[None, :, :], width, axis=0)
+    surface = pygame.Surface(size)
+    pygame.surfarray.blit_array(surface, pixels)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+def gradient_surface(size: Tuple[int, int], top: Tuple[int, int, int],
+                     bottom: Tuple[int, int, int]) -> pygame.Surface:
+    """Gecachter vertikaler Farbverlauf in der Größe `size`."""
+    key = (tuple(size), tuple(top), tuple(bottom))
+    surface = _cache.get(key)
+    if surface is not None:
+        _cache.move_to_end(key)
+        return surface
+
+    surface = _build_gradient(key[0], key[1], key[2])
+    _cache[key] = surface
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return surface
+
+
+def clear_background_cache():
+    """Verwirft alle gecachten Hintergründe (z. B. nach Wechsel des Display-Modus)."""
+    _cache.clear()
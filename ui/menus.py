@@ -7,11 +7,24 @@ import math
 import random
 from typing import List, Tuple, Optional
 from ui.race_ui import Button, Slider, COLORS
+from ui.text_cache import render_text, render_volatile
+from ui.backgrounds import gradient_surface
+from ui.particles import ParticleSystem
 
 
 class MainMenu:
     """Hauptmenü der Anwendung."""
     
+    # Farbverlauf des Hintergrunds (oben, unten)
+    BACKGROUND_GRADIENT = ((20, 60, 30), (50, 100, 80))
+    
+    # Hintergrundpartikel (laufende Punkte)
+    PARTICLE_COUNT = 200
+    PARTICLE_COLORS = [
+        (139, 69, 19), (101, 67, 33), (160, 82, 45),
+        (210, 180, 140), (85, 85, 85)
+    ]
+    
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.width = screen.get_width()
@@ -45,54 +58,47 @@ class MainMenu:
         
         # Animation
         self.animation_time = 0
-        self.horse_particles = []
+        self.particles = ParticleSystem(
+            (self.width, self.height), self.PARTICLE_COLORS,
+            radii=(3, 8), capacity=self.PARTICLE_COUNT, wrap=True
+        )
         self._init_particles()
     
     def _init_particles(self):
         """Initialisiert Partikel für Hintergrundanimation."""
-        for _ in range(20):
-            self.horse_particles.append({
-                'x': random.randint(0, self.width),
-                'y': random.randint(0, self.height),
-                'speed': random.uniform(1, 3),
-                'size': random.randint(3, 8),
-                'color': random.choice([
-                    (139, 69, 19), (101, 67, 33), (160, 82, 45),
-                    (210, 180, 140), (85, 85, 85)
-                ])
-            })
+        self.particles.spawn(
+            self.PARTICLE_COUNT,
+            x=(0, self.width), y=(0, self.height),
+            vx=(60, 180)  # Pixel pro Sekunde
+        )
     
     def draw(self, delta_time: float):
         """Zeichnet das Hauptmenü."""
         self.animation_time += delta_time
         
-        # Gradient-Hintergrund
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(20 + 30 * ratio)
-            g = int(60 + 40 * ratio)
-            b = int(30 + 50 * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        # Gradient-Hintergrund (gecacht, neu nur bei Auflösungswechsel)
+        background = gradient_surface(self.screen.get_size(), *self.BACKGROUND_GRADIENT)
+        self.screen.blit(background, (0, 0))
         
         # Partikel (laufende Punkte)
-        self._draw_particles()
+        self._draw_particles(delta_time)
         
         # Titel mit Schattierung
         title_text = "PFERDERENNEN"
         title_y = 80 + 5 * math.sin(self.animation_time * 2)
         
         # Schatten
-        shadow = self.font_title.render(title_text, True, (0, 0, 0))
+        shadow = render_text(self.font_title, title_text, (0, 0, 0))
         shadow_rect = shadow.get_rect(center=(self.width // 2 + 3, title_y + 3))
         self.screen.blit(shadow, shadow_rect)
         
         # Haupttitel
-        title = self.font_title.render(title_text, True, COLORS['gold'])
+        title = render_text(self.font_title, title_text, COLORS['gold'])
         title_rect = title.get_rect(center=(self.width // 2, title_y))
         self.screen.blit(title, title_rect)
         
         # Untertitel
-        subtitle = self.font_medium.render("Simulations-Projekt", True, COLORS['light_gray'])
+        subtitle = render_text(self.font_medium, "Simulations-Projekt", COLORS['light_gray'])
         subtitle_rect = subtitle.get_rect(center=(self.width // 2, 160))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -103,20 +109,15 @@ class MainMenu:
         
         # Footer
         footer_text = "BS Rostock - Simulationsprojekt 2026"
-        footer = self.font_small.render(footer_text, True, COLORS['gray'])
+        footer = render_text(self.font_small, footer_text, COLORS['gray'])
         footer_rect = footer.get_rect(center=(self.width // 2, self.height - 30))
         self.screen.blit(footer, footer_rect)
     
-    def _draw_particles(self):
-        """Zeichnet animierte Partikel."""
-        for p in self.horse_particles:
-            p['x'] += p['speed']
-            if p['x'] > self.width:
-                p['x'] = -10
-                p['y'] = random.randint(0, self.height)
-            
-            pygame.draw.circle(self.screen, p['color'], 
-                             (int(p['x']), int(p['y'])), p['size'])
+    def _draw_particles(self, delta_time: float):
+        """Bewegt und zeichnet die animierten Partikel."""
+        self.particles.resize(self.screen.get_size())
+        self.particles.update(delta_time)
+        self.particles.draw(self.screen)
     
     def handle_event(self, event: pygame.event.Event) -> str:
         """
@@ -186,7 +187,7 @@ class TrackSelectionMenu:
         self.screen.fill((30, 40, 50))
         
         # Titel
-        title = self.font_large.render("Strecke auswaehlen", True, COLORS['white'])
+        title = render_text(self.font_large, "Strecke auswaehlen", COLORS['white'])
         title_rect = title.get_rect(center=(self.width // 2, 50))
         self.screen.blit(title, title_rect)
         
@@ -215,7 +216,7 @@ class TrackSelectionMenu:
                            card_rect, 3, border_radius=10)
             
             # Streckenname
-            name = self.font_medium.render(track.name, True, COLORS['white'])
+            name = render_text(self.font_medium, track.name, COLORS['white'])
             name_rect = name.get_rect(center=(x + card_width // 2, y + 30))
             self.screen.blit(name, name_rect)
             
@@ -238,13 +239,13 @@ class TrackSelectionMenu:
             pygame.draw.circle(self.screen, sym_color, (x + card_width // 2, y + 80), 30)
             pygame.draw.circle(self.screen, COLORS['white'], (x + card_width // 2, y + 80), 30, 3)
             letter = symbol_letters.get(track.name, '?')
-            letter_surface = self.font_large.render(letter, True, COLORS['white'])
+            letter_surface = render_text(self.font_large, letter, COLORS['white'])
             letter_rect = letter_surface.get_rect(center=(x + card_width // 2, y + 80))
             self.screen.blit(letter_surface, letter_rect)
             
             # Länge
             length_text = f"{track.length:.0f}m"
-            length_surface = self.font_small.render(length_text, True, COLORS['light_gray'])
+            length_surface = render_text(self.font_small, length_text, COLORS['light_gray'])
             self.screen.blit(length_surface, (x + 10, y + 120))
             
             # Mini-Streckenvorschau
@@ -269,7 +270,7 @@ class TrackSelectionMenu:
         # Beschreibungstext
         desc_lines = self._wrap_text(selected_track.description, self.font_small, desc_rect.width - 20)
         for i, line in enumerate(desc_lines[:3]):
-            line_surface = self.font_small.render(line, True, COLORS['white'])
+            line_surface = render_text(self.font_small, line, COLORS['white'])
             self.screen.blit(line_surface, (desc_rect.x + 10, desc_rect.y + 10 + i * 25))
         
         # Buttons
@@ -278,7 +279,7 @@ class TrackSelectionMenu:
         
         # Steuerungshinweise
         controls = ""
-        controls_surface = self.font_small.render(controls, True, COLORS['gray'])
+        controls_surface = render_text(self.font_small, controls, COLORS['gray'])
         controls_rect = controls_surface.get_rect(center=(self.width // 2, self.height - 20))
         self.screen.blit(controls_surface, controls_rect)
     
@@ -437,12 +438,12 @@ class HorseCreatorMenu:
         self.screen.fill((35, 45, 55))
         
         # Titel
-        title = self.font_large.render("Pferd erstellen", True, COLORS['white'])
+        title = render_text(self.font_large, "Pferd erstellen", COLORS['white'])
         title_rect = title.get_rect(center=(self.width // 2, 40))
         self.screen.blit(title, title_rect)
         
         # Namenfeld
-        name_label = self.font_medium.render("Name:", True, COLORS['white'])
+        name_label = render_text(self.font_medium, "Name:", COLORS['white'])
         self.screen.blit(name_label, (80, 90))
         
         name_rect = pygame.Rect(160, 85, 200, 35)
@@ -450,11 +451,11 @@ class HorseCreatorMenu:
         pygame.draw.rect(self.screen, (50, 60, 70), name_rect, border_radius=5)
         pygame.draw.rect(self.screen, border_color, name_rect, 2, border_radius=5)
         
-        name_surface = self.font_medium.render(self.horse_name, True, COLORS['white'])
+        name_surface = render_volatile(self.font_medium, self.horse_name, COLORS['white'])
         self.screen.blit(name_surface, (name_rect.x + 10, name_rect.y + 5))
         
         # Farbauswahl
-        color_label = self.font_medium.render("Farbe:", True, COLORS['white'])
+        color_label = render_text(self.font_medium, "Farbe:", COLORS['white'])
         self.screen.blit(color_label, (400, 90))
         
         for i, (color, name) in enumerate(self.AVAILABLE_COLORS):
@@ -473,7 +474,7 @@ class HorseCreatorMenu:
         
         # Info über zufällige Parameter
         info_text = "* Die folgenden Werte werden zufaellig bestimmt:"
-        info_surface = self.font_small.render(info_text, True, COLORS['orange'])
+        info_surface = render_text(self.font_small, info_text, COLORS['orange'])
         self.screen.blit(info_surface, (self.width - 350, 200))
         
         random_params = [
@@ -482,7 +483,7 @@ class HorseCreatorMenu:
             "- Beschleunigung (Gleichverteilung)"
         ]
         for i, param in enumerate(random_params):
-            param_surface = self.font_small.render(param, True, COLORS['light_gray'])
+            param_surface = render_text(self.font_small, param, COLORS['light_gray'])
             self.screen.blit(param_surface, (self.width - 340, 225 + i * 22))
         
         # Sliders
@@ -496,7 +497,7 @@ class HorseCreatorMenu:
         
         # Hinweis
         hint = "Klicke auf die Slider, um Werte anzupassen | Klicke auf den Namen zum Bearbeiten"
-        hint_surface = self.font_small.render(hint, True, COLORS['gray'])
+        hint_surface = render_text(self.font_small, hint, COLORS['gray'])
         hint_rect = hint_surface.get_rect(center=(self.width // 2, self.height - 20))
         self.screen.blit(hint_surface, hint_rect)
     
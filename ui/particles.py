@@ -0,0 +1,155 @@
+"""
+Partikelsystem für Menü- und Siegeranimationen.
+
+Der Zustand aller Partikel liegt in NumPy-Arrays (Position, Geschwindigkeit,
+Größe, Farbindex, Restlebensdauer) und wird pro Frame in einem
+vektorisierten Schritt fortgeschrieben. Gezeichnet wird mit vorgerenderten
+Stempeln (eine Surface je Farbe und Größe) über einen einzigen
+Surface.blits-Aufruf, sodass auch mehrere tausend Partikel die Frame-Zeit
+kaum belasten.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pygame
+
+# Skalar oder Bereich (min, max), aus dem gleichverteilt gezogen wird
+Spread = Union[float, Tuple[float, float]]
+
+
+class ParticleSystem:
+    """Partikel mit konstanter Geschwindigkeit, optionaler Schwerkraft und Lebensdauer."""
+
+    def __init__(self, size: Tuple[int, int], palette: Sequence[Tuple[int, int, int]],
+                 radii: Tuple[int, int] = (3, 8), capacity: int = 1000,
+                 gravity: float = 0.0, wrap: bool = False, shape: str = 'circle',
+                 seed: Optional[int] = None):
+        """
+        Args:
+            size: Größe des Zeichenbereichs (Breite, Höhe)
+            palette: Farben, aus denen jedes Partikel eine erhält
+            radii: Kleinster und größter Radius in Pixeln
+            capacity: Maximale Anzahl gleichzeitig lebender Partikel
+            gravity: Beschleunigung nach unten in Pixel/s²
+            wrap: Partikel, die rechts hinauslaufen, links auf neuer Höhe wieder einsetzen
+                  statt sie zu entfernen
+            shape: 'circle' oder 'rect' (Konfetti-Streifen)
+            seed: Seed für reproduzierbare Animationen
+        """
+        self.width, self.height = size
+        self.gravity = gravity
+        self.wrap = wrap
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.radius = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.count = 0
+
+        self._min_radius, max_radius = radii
+        self._radius_count = max_radius - self._min_radius + 1
+        self._palette_size = len(palette)
+        self._stamps = self._build_stamps(palette, shape)
+
+    def _build_stamps(self, palette: Sequence[Tuple[int, int, int]], shape: str) -> List[pygame.Surface]:
+        """Eine Surface je (Farbe, Radius), Index = Farbe * Radienanzahl + Radius-Offset."""
+        stamps = []
+        for color in palette:
+            for radius in range(self._min_radius, self._min_radius + self._radius_count):
+                stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+                if shape == 'rect':
+                    pygame.draw.rect(stamp, color, (0, radius // 2, radius * 2 + 1, radius + 1))
+                else:
+                    pygame.draw.circle(stamp, color, (radius, radius), radius)
+                stamps.append(stamp)
+        return stamps
+
+    def __len__(self) -> int:
+        return self.count
+
+    def resize(self, size: Tuple[int, int]):
+        """Passt den Zeichenbereich an (z. B. nach Auflösungswechsel)."""
+        self.width, self.height = size
+
+    def clear(self):
+        """Entfernt alle Partikel."""
+        self.count = 0
+
+    def _sample(self, value: Spread, count: int) -> np.ndarray:
+        if isinstance(value, tuple):
+            return self.rng.uniform(value[0], value[1], count)
+        return np.full(count, value)
+
+    def spawn(self, count: int, x: Spread, y: Spread, vx: Spread = 0.0, vy: Spread = 0.0,
+              lifetime: Spread = np.inf) -> int:
+        """
+        Erzeugt neue Partikel (alle Werte als Skalar oder Bereich (min, max)).
+
+        Returns:
+            Anzahl tatsächlich erzeugter Partikel (begrenzt durch capacity)
+        """
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        new = slice(self.count, self.count + count)
+        self.x[new] = self._sample(x, count)
+        self.y[new] = self._sample(y, count)
+        self.vx[new] = self._sample(vx, count)
+        self.vy[new] = self._sample(vy, count)
+        self.life[new] = self._sample(lifetime, count)
+        self.radius[new] = self.rng.integers(0, self._radius_count, count)
+        self.color[new] = self.rng.integers(0, self._palette_size, count)
+        self.count += count
+        return count
+
+    def update(self, delta_time: float):
+        """Bewegt alle Partikel um einen Zeitschritt und entfernt abgelaufene."""
+        n = self.count
+        if n == 0:
+            return
+        x, y, vx, vy, life = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.life[:n]
+        if self.gravity:
+            vy += self.gravity * delta_time
+        x += vx * delta_time
+        y += vy * delta_time
+        life -= delta_time
+
+        margin = self._min_radius + self._radius_count
+        if self.wrap:
+            wrapped = x > self.width + margin
+            count = int(np.count_nonzero(wrapped))
+            if count:
+                x[wrapped] = -margin
+                y[wrapped] = self.rng.uniform(0, self.height, count)
+
+        alive = (life > 0) & (y < self.height + margin) & (x > -2 * margin)
+        if not self.wrap:
+            alive &= x < self.width + margin
+        if not alive.all():
+            self._compact(alive)
+
+    def _compact(self, alive: np.ndarray):
+        """Schiebt die lebenden Partikel an den Anfang der Arrays."""
+        keep = np.flatnonzero(alive)
+        for array in (self.x, self.y, self.vx, self.vy, self.life, self.radius, self.color):
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+
+    def draw(self, surface: pygame.Surface):
+        """Zeichnet alle Partikel mit einem einzigen blits-Aufruf."""
+        n = self.count
+        if n == 0:
+            return
+        radius = self.radius[:n] + self._min_radius
+        stamp_index = self.color[:n] * self._radius_count + self.radius[:n]
+        left = (self.x[:n] - radius).astype(np.int32).tolist()
+        top = (self.y[:n] - radius).astype(np.int32).tolist()
+        stamps = self._stamps
+        surface.blits([(stamps[i], (px, py)) for i, px, py in zip(stamp_index.tolist(), left, top)],
+                      doreturn=False)
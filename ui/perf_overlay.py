@@ -0,0 +1,195 @@
+"""
+Leistungsanzeige (HUD) für die laufende Anwendung.
+
+FrameTimer misst pro Frame, wie viel Zeit auf die einzelnen Abschnitte
+entfällt (Events, Simulation, Strecke, Pferde, Rangliste, Zusammensetzen
+im Dirty-Rect-Modus, Display-Flip, ...). PerformanceOverlay zeigt daraus
+FPS, p50/p95/p99 der Frame-Zeit, die Aufteilung nach Abschnitten und einen
+Verlaufsgraphen. Umschalten mit F3.
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from ui.race_ui import COLORS
+from ui.text_cache import render_volatile
+
+# Reihenfolge und Farben der Abschnitte in der Anzeige
+SECTIONS: List[Tuple[str, Tuple[int, int, int]]] = [
+    ('events', (120, 120, 255)),
+    ('simulation_advance', (255, 120, 60)),   # advance(): alle fälligen Schritte des Frames
+    ('draw_track', (80, 200, 120)),
+    ('draw_horses', (200, 200, 60)),
+    ('draw_standings', (200, 120, 220)),
+    ('draw_ui', (120, 200, 220)),
+    ('composite', (240, 150, 180)),   # Dirty-Rect-Modus: Bereiche zusammensetzen
+    ('draw', (160, 160, 160)),
+    ('overlay', (90, 90, 90)),
+    ('flip', (230, 80, 80)),
+]
+
+# Zielwert für die Frame-Zeit (60 FPS)
+TARGET_FRAME_MS = 1000 / 60
+
+
+class FrameTimer:
+    """Misst die Abschnitte jedes Frames und hält einen rollierenden Verlauf."""
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, history: int = 240):
+        self.intervals: Deque[float] = deque(maxlen=history)   # Abstand der Frames (ms)
+        self.work: Deque[float] = deque(maxlen=history)        # Rechenzeit je Frame (ms)
+        self.sections: Deque[Dict[str, float]] = deque(maxlen=history)
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._last = 0.0
+
+    def begin_frame(self):
+        """Beginnt einen neuen Frame."""
+        now = self.clock()
+        if self._frame_start is not None:
+            self.intervals.append((now - self._frame_start) * 1000)
+        self._frame_start = now
+        self._last = now
+        self._current = {}
+
+    def lap(self, section: str):
+        """Rechnet die Zeit seit der letzten Marke dem Abschnitt zu."""
+        now = self.clock()
+        self._current[section] = self._current.get(section, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        """Schließt den Frame ab (vor dem Warten auf die Bildrate aufrufen)."""
+        if self._frame_start is None:
+            return
+        self.work.append((self.clock() - self._frame_start) * 1000)
+        self.sections.append(self._current)
+
+    def percentiles(self, values=(50, 95, 99)) -> List[float]:
+        """Perzentile des Frame-Abstands in ms."""
+        if not self.intervals:
+            return [0.0 for _ in values]
+        return np.percentile(np.fromiter(self.intervals, dtype=np.float64), values).tolist()
+
+    def section_means(self) -> Dict[str, float]:
+        """Durchschnittliche Zeit je Abschnitt in ms über den Verlauf."""
+        if not self.sections:
+            return {}
+        totals: Dict[str, float] = {}
+        for frame in self.sections:
+            for name, ms in frame.items():
+                totals[name] = totals.get(name, 0.0) + ms
+        count = len(self.sections)
+        return {name: ms / count for name, ms in totals.items()}
+
+
+class PerformanceOverlay:
+    """HUD mit FPS, Frame-Zeit-Perzentilen, Abschnitts-Aufteilung und Verlauf."""
+
+    WIDTH = 300
+    GRAPH_HEIGHT = 60
+    REFRESH_INTERVAL = 0.25  # Sekunden zwischen zwei Neuaufbauten der Anzeige
+
+    def __init__(self, timer: FrameTimer):
+        self.timer = timer
+        self.visible = False
+        self.font = pygame.font.Font(None, 20)
+        self._surface: Optional[pygame.Surface] = None
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        """Blendet die Anzeige ein oder aus."""
+        self.visible = not self.visible
+        self._surface = None
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Verarbeitet F3; gibt True zurück, wenn das Event verbraucht wurde."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.toggle()
+            return True
+        return False
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Zeichnet die Anzeige oben rechts (nur alle REFRESH_INTERVAL neu aufgebaut).
+        
+        Returns:
+            Übermalter Bereich oder None, wenn die Anzeige ausgeblendet ist
+        """
+        if not self.visible:
+            return None
+        now = time.perf_counter()
+        if self._surface is None or now - self._last_refresh >= self.REFRESH_INTERVAL:
+            self._surface = self._build()
+            self._last_refresh = now
+        return screen.blit(self._surface, (screen.get_width() - self.WIDTH - 10, 10))
+
+    def _build(self) -> pygame.Surface:
+        """Baut die Anzeige aus den aktuellen Messwerten auf."""
+        timer = self.timer
+        p50, p95, p99 = timer.percentiles()
+        fps = 1000 / p50 if p50 > 0 else 0.0
+        means = timer.section_means()
+        work = float(np.mean(timer.work)) if timer.work else 0.0
+
+        sections = [(name, color) for name, color in SECTIONS if name in means]
+        line_height = 18
+        height = 10 + line_height * (3 + len(sections)) + self.GRAPH_HEIGHT + 20
+        surface = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+
+        y = 6
+        lines = [
+            (f"FPS: {fps:5.1f}   Rechenzeit: {work:5.2f} ms", COLORS['white']),
+            (f"Frame p50 {p50:5.1f}  p95 {p95:5.1f}  p99 {p99:5.1f} ms", COLORS['white']),
+        ]
+        for text, color in lines:
+            surface.blit(render_volatile(self.font, text, color), (8, y))
+            y += line_height
+
+        # Aufteilung als gestapelter Balken plus Legende
+        bar_width = self.WIDTH - 16
+        scale = bar_width / max(work, TARGET_FRAME_MS)
+        x = 8
+        for name, color in sections:
+            width = int(means[name] * scale)
+            if width > 0:
+                pygame.draw.rect(surface, color, (x, y + 2, width, 10))
+            x += width
+        y += line_height
+        for name, color in sections:
+            pygame.draw.rect(surface, color, (8, y + 4, 8, 8))
+            label = f"{name:<18} {means[name]:6.2f} ms"
+            surface.blit(render_volatile(self.font, label, COLORS['light_gray']), (22, y))
+            y += line_height
+
+        self._draw_graph(surface, pygame.Rect(8, y + 6, bar_width, self.GRAPH_HEIGHT))
+        return surface
+
+    def _draw_graph(self, surface: pygame.Surface, rect: pygame.Rect):
+        """Verlauf der Frame-Abstände (weiß) und Rechenzeit (orange)."""
+        pygame.draw.rect(surface, (30, 30, 30), rect)
+        limit = max(TARGET_FRAME_MS * 2, max(self.timer.intervals, default=0.0))
+
+        def to_points(values) -> List[Tuple[int, int]]:
+            values = list(values)
+            step = rect.width / max(1, self.timer.intervals.maxlen - 1)
+            return [
+                (rect.x + int(i * step), rect.bottom - int(min(value, limit) / limit * rect.height))
+                for i, value in enumerate(values)
+            ]
+
+        # Ziellinie 60 FPS
+        target_y = rect.bottom - int(TARGET_FRAME_MS / limit * rect.height)
+        pygame.draw.line(surface, COLORS['green'], (rect.x, target_y), (rect.right, target_y), 1)
+
+        for values, color in ((self.timer.intervals, COLORS['white']), (self.timer.work, COLORS['orange'])):
+            points = to_points(values)
+            if len(points) > 1:
+                pygame.draw.lines(surface, color, False, points, 1)
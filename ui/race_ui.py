@@ -18,8 +18,11 @@ import io
 import matplotlib
 matplotlib.use('Agg')  # Verwende Agg backend für pygame integration
 import matplotlib.pyplot as plt
-from typing import List, Optional, Tuple, Dict
-from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple, Dict
+from dataclasses import dataclass, field
+
+from ui.text_cache import render_text, render_volatile
+from ui.particles import ParticleSystem
 
 # Farbdefinitionen
 COLORS = {
@@ -49,16 +52,30 @@ class Button:
     hover_color: Tuple[int, int, int] = (100, 160, 210)
     text_color: Tuple[int, int, int] = (255, 255, 255)
     is_hovered: bool = False
+    _surface: Optional[pygame.Surface] = field(default=None, init=False, repr=False, compare=False)
+    _surface_key: tuple = field(default=(), init=False, repr=False, compare=False)
     
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
-        """Zeichnet den Button."""
+    def _render(self, font: pygame.font.Font) -> pygame.Surface:
+        """Rastert den Button im aktuellen Zustand."""
         color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=8)
-        pygame.draw.rect(screen, COLORS['white'], self.rect, 2, border_radius=8)
-        
-        text_surface = font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = surface.get_rect()
+        pygame.draw.rect(surface, color, local_rect, border_radius=8)
+        pygame.draw.rect(surface, COLORS['white'], local_rect, 2, border_radius=8)
+        
+        text_surface = render_text(font, self.text, self.text_color)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
+        return surface
+    
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+        """Zeichnet den Button (gerastert nur bei Änderung von Text, Hover oder Größe)."""
+        key = (font, self.text, self.is_hovered, self.rect.size, self.color,
+               self.hover_color, self.text_color)
+        if self._surface is None or key != self._surface_key:
+            self._surface = self._render(font)
+            self._surface_key = key
+        screen.blit(self._surface, self.rect)
     
     def check_hover(self, pos: Tuple[int, int]) -> bool:
         """Prüft ob die Maus über dem Button ist."""
@@ -82,7 +99,7 @@ class Slider:
     def draw(self, screen: pygame.Surface, font: pygame.font.Font):
         """Zeichnet den Slider."""
         # Label
-        label_surface = font.render(f"{self.label}: {self.value:.0f}", True, COLORS['white'])
+        label_surface = render_volatile(font, f"{self.label}: {self.value:.0f}", COLORS['white'])
         screen.blit(label_surface, (self.rect.x, self.rect.y - 25))
         
         # Slider-Hintergrund
@@ -114,15 +131,111 @@ class Slider:
         self.value = self.min_val + (relative_x / self.rect.width) * (self.max_val - self.min_val)
 
 
+@dataclass
+class DirtyElement:
+    """
+    Dynamisches Bildelement für den Dirty-Rect-Modus von RaceUI.
+
+    `key` beschreibt den sichtbaren Zustand; ändert er sich oder das Rechteck,
+    wird der alte und neue Bereich neu zusammengesetzt.
+    """
+    name: str
+    key: tuple
+    rect: pygame.Rect
+    draw: Callable[[], None]
+
+
+# Vorgerenderte Animationsphasen je Pferdefarbe. Eine volle Periode des
+# Schweifs (4π) entspricht zwei Schrittzyklen der Beine.
+ANIMATION_FRAMES = 16
+ANIMATION_PERIOD = 4 * math.pi
+
+
+class HorseSpriteAtlas:
+    """
+    Sprite-Atlas: alle Animationsphasen eines Pferdes je Farbe, einmal gerastert.
+
+    Jede Farbe erhält ANIMATION_FRAMES Laufphasen plus eine Standphase für
+    Pferde im Ziel. Zeichnen ist danach nur noch ein Blit pro Pferd.
+    """
+    
+    # Größe eines Einzelbilds und Lage des Pferde-Ankerpunkts darin
+    FRAME_SIZE = (68, 36)
+    ORIGIN = (32, 14)
+    INJURY_SIZE = (12, 12)
+    INJURY_ORIGIN = (6, 26)
+    
+    def __init__(self):
+        self._frames: Dict[Tuple[int, int, int], List[pygame.Surface]] = {}
+        self.injury_stamp = self._render_injury()
+    
+    @staticmethod
+    def _finish(surface: pygame.Surface) -> pygame.Surface:
+        """Passt die Surface an das Display-Format an, sofern schon eines existiert."""
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+    
+    def _render_frame(self, color: Tuple[int, int, int], leg_offset: float,
+                      tail_offset: float) -> pygame.Surface:
+        """Rastert ein Einzelbild mit dem Anker bei ORIGIN."""
+        surface = pygame.Surface(self.FRAME_SIZE, pygame.SRCALPHA)
+        x, y = self.ORIGIN
+        
+        # Körper (Ellipse) und Kopf
+        pygame.draw.ellipse(surface, color, pygame.Rect(x - 20, y - 8, 40, 16))
+        pygame.draw.circle(surface, color, (x + 25, y - 5), 8)
+        
+        # Beine
+        for i, lx in enumerate((x - 12, x - 5, x + 5, x + 12)):
+            offset = leg_offset if i % 2 == 0 else -leg_offset
+            pygame.draw.line(surface, color, (lx, y + 8), (lx + offset, y + 18), 3)
+        
+        # Schweif
+        pygame.draw.line(surface, color, (x - 20, y), (x - 30, y + tail_offset), 3)
+        return self._finish(surface)
+    
+    def _render_injury(self) -> pygame.Surface:
+        """Rastert den Verletzungsindikator (rotes Kreuz über dem Pferd)."""
+        surface = pygame.Surface(self.INJURY_SIZE, pygame.SRCALPHA)
+        x, y = self.INJURY_ORIGIN
+        pygame.draw.circle(surface, COLORS['red'], (x, y - 20), 5)
+        pygame.draw.line(surface, COLORS['red'], (x - 3, y - 23), (x + 3, y - 17), 2)
+        pygame.draw.line(surface, COLORS['red'], (x + 3, y - 23), (x - 3, y - 17), 2)
+        return self._finish(surface)
+    
+    def frames(self, color: Tuple[int, int, int]) -> List[pygame.Surface]:
+        """Alle Phasen einer Farbe (werden beim ersten Zugriff gerastert)."""
+        color = tuple(color)
+        frames = self._frames.get(color)
+        if frames is None:
+            frames = []
+            for k in range(ANIMATION_FRAMES):
+                phase = k * ANIMATION_PERIOD / ANIMATION_FRAMES
+                frames.append(self._render_frame(color, math.sin(phase) * 5, math.sin(phase * 0.5) * 3))
+            # Standphase für Pferde im Ziel
+            frames.append(self._render_frame(color, 0, 0))
+            self._frames[color] = frames
+        return frames
+    
+    def prepare(self, horses):
+        """Rastert die Phasen aller Farben des Starterfelds vorab (beim Rennstart)."""
+        for horse in horses:
+            self.frames(horse.color)
+
+
 class HorseSprite:
     """Animiertes Pferde-Sprite."""
     
-    def __init__(self, horse, lane: int, track_rect: pygame.Rect):
+    def __init__(self, horse, lane: int, track_rect: pygame.Rect,
+                 atlas: Optional[HorseSpriteAtlas] = None):
         self.horse = horse
         self.lane = lane
         self.track_rect = track_rect
         self.animation_frame = 0
         self.animation_speed = 0.2
+        self.atlas = atlas if atlas is not None else HorseSpriteAtlas()
+        self._frames = self.atlas.frames(horse.color)
         
         # Position auf dem Bildschirm
         lane_height = track_rect.height // 12
@@ -140,54 +253,47 @@ class HorseSprite:
             speed_factor = self.horse.current_speed / 5 if self.horse.current_speed > 0 else 0.5
             self.animation_frame += self.animation_speed * speed_factor
     
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
-        """Zeichnet das Pferd."""
-        # Pferdekörper (stilisiert)
-        color = self.horse.color
-        
-        # Körper (Ellipse)
-        body_rect = pygame.Rect(self.x - 20, self.y - 8, 40, 16)
-        pygame.draw.ellipse(screen, color, body_rect)
-        
-        # Kopf
-        head_x = self.x + 25
-        head_y = self.y - 5
-        pygame.draw.circle(screen, color, (head_x, head_y), 8)
-        
-        # Beine (animiert)
-        leg_offset = math.sin(self.animation_frame) * 5 if not self.horse.finished else 0
-        leg_positions = [
-            (self.x - 12, self.y + 8),
-            (self.x - 5, self.y + 8),
-            (self.x + 5, self.y + 8),
-            (self.x + 12, self.y + 8),
-        ]
-        for i, (lx, ly) in enumerate(leg_positions):
-            offset = leg_offset if i % 2 == 0 else -leg_offset
-            pygame.draw.line(screen, color, (lx, ly), (lx + offset, ly + 10), 3)
+    def blit_items(self, font: pygame.font.Font) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(Surface, Position)-Paare für Surface.blits: Pferd, Verletzung, Name."""
+        if self.horse.finished:
+            frame = self._frames[ANIMATION_FRAMES]
+        else:
+            phase = self.animation_frame % ANIMATION_PERIOD
+            frame = self._frames[int(round(phase / ANIMATION_PERIOD * ANIMATION_FRAMES)) % ANIMATION_FRAMES]
         
-        # Schweif
-        tail_offset = math.sin(self.animation_frame * 0.5) * 3
-        pygame.draw.line(screen, color, (self.x - 20, self.y), 
-                        (self.x - 30, self.y + tail_offset), 3)
+        origin_x, origin_y = HorseSpriteAtlas.ORIGIN
+        items = [(frame, (self.x - origin_x, self.y - origin_y))]
         
         # Verletzungsindikator
         if self.horse.is_injured:
-            pygame.draw.circle(screen, COLORS['red'], (self.x, self.y - 20), 5)
-            pygame.draw.line(screen, COLORS['red'], 
-                           (self.x - 3, self.y - 23), (self.x + 3, self.y - 17), 2)
-            pygame.draw.line(screen, COLORS['red'], 
-                           (self.x + 3, self.y - 23), (self.x - 3, self.y - 17), 2)
+            injury_x, injury_y = HorseSpriteAtlas.INJURY_ORIGIN
+            items.append((self.atlas.injury_stamp, (self.x - injury_x, self.y - injury_y)))
         
         # Name
-        name_surface = font.render(self.horse.name[:10], True, COLORS['white'])
-        screen.blit(name_surface, (self.x - 40, self.y - 30))
+        name_surface = render_text(font, self.horse.name[:10], COLORS['white'])
+        items.append((name_surface, (self.x - 40, self.y - 30)))
+        return items
+    
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+        """Zeichnet das Pferd."""
+        screen.blits(self.blit_items(font), doreturn=False)
 
 
 class RaceUI:
     """Hauptklasse für die Rennanzeige."""
     
-    def __init__(self, screen: pygame.Surface, simulation, track):
+    # Sichtbare Zeilen der Rangliste; größere Felder werden gescrollt
+    STANDINGS_ROWS = 10
+    
+    def __init__(self, screen: pygame.Surface, simulation, track, dirty_rects: bool = False):
+        """
+        Args:
+            screen: Ziel-Surface (Display)
+            simulation: Laufende Simulation
+            track: Strecke
+            dirty_rects: Nur geänderte Bereiche neu zeichnen; die geänderten
+                         Rechtecke liefert take_dirty_rects() für pygame.display.update
+        """
         self.screen = screen
         self.simulation = simulation
         self.track = track
@@ -202,9 +308,11 @@ class RaceUI:
         # Track-Bereich (schmaler, um Platz für Rangliste zu lassen)
         self.track_rect = pygame.Rect(50, 150, self.width - 300, self.height - 300)
         
-        # Pferde-Sprites erstellen
+        # Pferde-Sprites erstellen (Animationsphasen einmal je Farbe gerastert)
+        self.sprite_atlas = HorseSpriteAtlas()
+        self.sprite_atlas.prepare(simulation.horses)
         self.horse_sprites = [
-            HorseSprite(horse, i, self.track_rect)
+            HorseSprite(horse, i, self.track_rect, self.sprite_atlas)
             for i, horse in enumerate(simulation.horses)
         ]
         
@@ -236,15 +344,71 @@ class RaceUI:
         
         # Flag für Sofort-Beenden
         self.skip_to_end = False
+        
+        # Rangliste: erste sichtbare Zeile und gecachtes Panel (Schlüssel, Surface)
+        self.standings_scroll = 0
+        self._standings_cache: Optional[Tuple[tuple, pygame.Surface]] = None
+        
+        # Optionale Frame-Zeitmessung (ui.perf_overlay.FrameTimer)
+        self.frame_timer = None
+        
+        # Statische Streckenebene, einmal vorgerendert
+        self._background: Optional[pygame.Surface] = None
+        self._background = self._render_background()
+        
+        # Dirty-Rect-Modus: Elemente des letzten Frames, vorgemerkte Bereiche
+        # und die im letzten update geänderten Rechtecke (None = ganzer Bildschirm)
+        self.dirty_rects = dirty_rects
+        self._elements: Dict[str, DirtyElement] = {}
+        self._marked: List[pygame.Rect] = []
+        self._changed: Optional[List[pygame.Rect]] = None
+        self._full_redraw = True
     
-    def draw_track(self):
-        """Zeichnet die Strecke."""
+    def _update_layout(self):
+        """Passt Streckenbereich, Sprites und Buttons an eine neue Fenstergröße an."""
+        self.width = self.screen.get_width()
+        self.height = self.screen.get_height()
+        self.track_rect.update(50, 150, self.width - 300, self.height - 300)
+        
+        lane_height = self.track_rect.height // 12
+        for sprite in self.horse_sprites:
+            sprite.y = self.track_rect.y + 20 + sprite.lane * lane_height
+        
+        button_y = self.height - 100
+        for button in (self.pause_button, self.speed_up_button, self.speed_down_button,
+                       self.skip_button, self.abort_button):
+            button.rect.y = button_y
+    
+    def invalidate_background(self):
+        """Verwirft die vorgerenderte Streckenebene (z.B. nach Größenänderung)."""
+        self._background = None
+        self._full_redraw = True
+    
+    def mark_dirty(self, rect: pygame.Rect):
+        """Merkt einen fremd übermalten Bereich vor, der im nächsten Frame wiederhergestellt wird."""
+        self._marked.append(pygame.Rect(rect))
+    
+    def take_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Im letzten update geänderte Rechtecke für pygame.display.update.
+        
+        Returns:
+            Liste der Rechtecke oder None, wenn der ganze Bildschirm
+            aktualisiert werden muss (Dirty-Rect-Modus aus oder Vollbild-Neuaufbau)
+        """
+        changed, self._changed = self._changed, None
+        return changed
+    
+    def _render_background(self) -> pygame.Surface:
+        """Rendert alle während des Rennens konstanten Teile der Strecke."""
+        surface = pygame.Surface(self.screen.get_size()).convert()
+        
         # Hintergrund
-        self.screen.fill(self.track.background_color)
+        surface.fill(self.track.background_color)
         
         # Strecken-Header
-        title = self.font_large.render(self.track.name, True, COLORS['white'])
-        self.screen.blit(title, (50, 20))
+        title = render_text(self.font_large, self.track.name, COLORS['white'])
+        surface.blit(title, (50, 20))
         
         # Streckensegmente zeichnen
         segment_width = self.track_rect.width / len(self.track.segments)
@@ -255,100 +419,179 @@ class RaceUI:
                 segment_width + 1,
                 self.track_rect.height
             )
-            pygame.draw.rect(self.screen, segment.color, seg_rect)
+            pygame.draw.rect(surface, segment.color, seg_rect)
         
         # Streckenrand
-        pygame.draw.rect(self.screen, COLORS['white'], self.track_rect, 3)
+        pygame.draw.rect(surface, COLORS['white'], self.track_rect, 3)
         
         # Start- und Ziellinie
-        pygame.draw.line(self.screen, COLORS['white'],
+        pygame.draw.line(surface, COLORS['white'],
                         (self.track_rect.x + 50, self.track_rect.y),
                         (self.track_rect.x + 50, self.track_rect.bottom), 3)
-        pygame.draw.line(self.screen, COLORS['gold'],
+        pygame.draw.line(surface, COLORS['gold'],
                         (self.track_rect.right - 50, self.track_rect.y),
                         (self.track_rect.right - 50, self.track_rect.bottom), 5)
         
         # Labels
-        start_label = self.font_small.render("START", True, COLORS['white'])
-        self.screen.blit(start_label, (self.track_rect.x + 30, self.track_rect.y - 25))
+        start_label = render_text(self.font_small, "START", COLORS['white'])
+        surface.blit(start_label, (self.track_rect.x + 30, self.track_rect.y - 25))
         
-        finish_label = self.font_small.render("ZIEL", True, COLORS['gold'])
-        self.screen.blit(finish_label, (self.track_rect.right - 70, self.track_rect.y - 25))
+        finish_label = render_text(self.font_small, "ZIEL", COLORS['gold'])
+        surface.blit(finish_label, (self.track_rect.right - 70, self.track_rect.y - 25))
         
         # Bahnen-Linien
         lane_height = self.track_rect.height // 12
         for i in range(1, 11):
             y = self.track_rect.y + 20 + i * lane_height
-            pygame.draw.line(self.screen, (*self.track.track_color, 100),
+            pygame.draw.line(surface, (*self.track.track_color, 100),
                            (self.track_rect.x, y),
                            (self.track_rect.right, y), 1)
+        
+        return surface
+    
+    def _ensure_background(self):
+        """Baut die Streckenebene neu auf, falls sie fehlt oder die Fenstergröße sich geändert hat."""
+        if self._background is None or self._background.get_size() != self.screen.get_size():
+            self._update_layout()
+            self._background = self._render_background()
+            self._full_redraw = True
+    
+    def draw_track(self):
+        """Zeichnet die Strecke (vorgerenderte Ebene, bei Größenänderung neu aufgebaut)."""
+        self._ensure_background()
+        self.screen.blit(self._background, (0, 0))
     
     def draw_horses(self, delta_time: float):
         """Zeichnet alle Pferde."""
-        progress = self.simulation.get_progress()
+        # Zwischen den letzten beiden Simulationsschritten interpolieren
+        progress = self.simulation.get_interpolated_progress()
         
+        # Das ganze Feld mit einem einzigen blits-Aufruf
+        items = []
         for sprite in self.horse_sprites:
             horse_progress = progress.get(sprite.horse.name, 0)
             sprite.update(horse_progress, delta_time)
-            sprite.draw(self.screen, self.font_small)
+            items.extend(sprite.blit_items(self.font_small))
+        self.screen.blits(items, doreturn=False)
     
-    def draw_ui(self):
-        """Zeichnet UI-Elemente."""
+    def _horse_elements(self, delta_time: float) -> List[DirtyElement]:
+        """Bewegt alle Sprites und liefert sie als Bildelemente (Pferd, Verletzung, Name)."""
+        progress = self.simulation.get_interpolated_progress()
+        screen = self.screen
+        elements = []
+        for sprite in self.horse_sprites:
+            sprite.update(progress.get(sprite.horse.name, 0), delta_time)
+            items = sprite.blit_items(self.font_small)
+            rects = [surface.get_rect(topleft=pos) for surface, pos in items]
+            elements.append(DirtyElement(
+                f"horse:{sprite.lane}", tuple((id(surface), pos) for surface, pos in items),
+                rects[0].unionall(rects[1:]),
+                lambda items=items: screen.blits(items, doreturn=False)
+            ))
+        return elements
+    
+    def _widget_elements(self) -> List[DirtyElement]:
+        """Info-Texte, Pause-Hinweis, Buttons und Steuerungshinweise als Bildelemente."""
+        screen = self.screen
+        elements = []
+        
+        def text_element(name: str, surface: pygame.Surface, rect: pygame.Rect) -> DirtyElement:
+            return DirtyElement(name, (id(surface), tuple(rect)), rect,
+                                lambda: screen.blit(surface, rect))
+        
         # Info-Panel
         info_y = 70
         time_text = f"Zeit: {self.simulation.state.elapsed_time:.1f}s"
         speed_text = f"Geschwindigkeit: {self.simulation.state.speed_multiplier:.1f}x"
         
-        time_surface = self.font_medium.render(time_text, True, COLORS['white'])
-        speed_surface = self.font_medium.render(speed_text, True, COLORS['white'])
+        time_surface = render_volatile(self.font_medium, time_text, COLORS['white'])
+        speed_surface = render_text(self.font_medium, speed_text, COLORS['white'])
         
-        self.screen.blit(time_surface, (50, info_y))
-        self.screen.blit(speed_surface, (250, info_y))
+        elements.append(text_element('time', time_surface, time_surface.get_rect(topleft=(50, info_y))))
+        elements.append(text_element('speed', speed_surface, speed_surface.get_rect(topleft=(250, info_y))))
         
         # Pause-Status
         if self.simulation.state.is_paused:
-            pause_text = self.font_large.render("PAUSIERT", True, COLORS['orange'])
+            pause_text = render_text(self.font_large, "PAUSIERT", COLORS['orange'])
             text_rect = pause_text.get_rect(center=(self.width // 2, info_y + 10))
-            self.screen.blit(pause_text, text_rect)
+            elements.append(text_element('pause', pause_text, text_rect))
         
         # Buttons
         self.pause_button.text = "Fortsetzen" if self.simulation.state.is_paused else "Pause"
-        self.pause_button.draw(self.screen, self.font_medium)
-        self.speed_up_button.draw(self.screen, self.font_medium)
-        self.speed_down_button.draw(self.screen, self.font_medium)
-        self.skip_button.draw(self.screen, self.font_medium)
-        self.abort_button.draw(self.screen, self.font_medium)
-        
-        # Rangliste
-        self.draw_standings()
+        for name, button in (('pause_button', self.pause_button), ('speed_up', self.speed_up_button),
+                             ('speed_down', self.speed_down_button), ('skip', self.skip_button),
+                             ('abort', self.abort_button)):
+            elements.append(DirtyElement(
+                name, (button.text, button.is_hovered, tuple(button.rect)), pygame.Rect(button.rect),
+                lambda button=button: button.draw(screen, self.font_medium)
+            ))
         
         # Steuerungshinweise
         controls = ""
-        controls_surface = self.font_small.render(controls, True, COLORS['light_gray'])
-        self.screen.blit(controls_surface, (50, self.height - 40))
+        controls_surface = render_text(self.font_small, controls, COLORS['light_gray'])
+        elements.append(text_element('controls', controls_surface,
+                                     controls_surface.get_rect(topleft=(50, self.height - 40))))
+        return elements
     
-    def draw_standings(self):
-        """Zeichnet die aktuelle Rangliste."""
-        standings = self.simulation.get_current_standings()
+    def draw_ui(self):
+        """Zeichnet UI-Elemente (mit frame_timer aufgeteilt in 'draw_ui' und 'draw_standings')."""
+        for element in self._widget_elements():
+            element.draw()
+        
+        # Rangliste
+        if self.frame_timer:
+            self.frame_timer.lap('draw_ui')
+        self.draw_standings()
+        if self.frame_timer:
+            self.frame_timer.lap('draw_standings')
+    
+    def _standings_rect(self) -> pygame.Rect:
+        """Bereich des Ranglisten-Panels (höchstens STANDINGS_ROWS Zeilen hoch)."""
+        rows = min(len(self.horse_sprites), self.STANDINGS_ROWS)
+        return pygame.Rect(self.track_rect.right + 20, self.track_rect.y, 200, 30 * rows + 40)
+    
+    def scroll_standings(self, rows: int):
+        """Verschiebt den sichtbaren Ausschnitt der Rangliste um `rows` Zeilen."""
+        max_scroll = max(0, len(self.horse_sprites) - self.STANDINGS_ROWS)
+        self.standings_scroll = max(0, min(max_scroll, self.standings_scroll + rows))
+    
+    def _standings_surface(self) -> pygame.Surface:
+        """
+        Ranglisten-Panel als gecachte Surface.
         
-        # Rangliste rechts neben der Strecke
-        panel_x = self.track_rect.right + 20
-        panel_y = self.track_rect.y
-        panel_width = 200
-        panel_height = 30 * len(standings) + 40
+        Gerastert werden nur die sichtbaren Zeilen; neu aufgebaut wird nur,
+        wenn sich die angezeigten Pferde, der Ausschnitt oder die Panelgröße
+        ändern. Im Ziel angekommene Pferde verschieben sich dabei in den
+        festen Zielblock am Anfang der Liste und lösen so ebenfalls einen
+        Neuaufbau aus, sobald sie sichtbar die Reihenfolge ändern.
+        """
+        self._ensure_background()
+        standings = self.simulation.get_current_standings()
+        panel_rect = self._standings_rect()
+        offset = self.standings_scroll
+        visible = standings[offset:offset + self.STANDINGS_ROWS]
+        key = (offset, len(standings), tuple(panel_rect), id(self._background),
+               tuple(id(horse) for _, horse in visible))
+        if self._standings_cache is not None and self._standings_cache[0] == key:
+            return self._standings_cache[1]
+        
+        # Deckend, mit der Streckenebene als Untergrund der runden Ecken:
+        # das Blitten ist dann eine reine Kopie ohne Alpha-Mischung
+        surface = pygame.Surface(panel_rect.size)
+        surface.blit(self._background, (0, 0), panel_rect)
+        local_rect = surface.get_rect()
         
         # Panel-Hintergrund
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, COLORS['dark_gray'], panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, COLORS['white'], panel_rect, 2, border_radius=10)
+        pygame.draw.rect(surface, COLORS['dark_gray'], local_rect, border_radius=10)
+        pygame.draw.rect(surface, COLORS['white'], local_rect, 2, border_radius=10)
         
         # Titel
-        title = self.font_medium.render("Rangliste", True, COLORS['white'])
-        self.screen.blit(title, (panel_x + 50, panel_y + 5))
+        title = render_text(self.font_medium, "Rangliste", COLORS['white'])
+        surface.blit(title, (50, 5))
         
-        # Platzierungen
-        for i, (pos, horse) in enumerate(standings[:10]):
-            y = panel_y + 35 + i * 28
+        # Platzierungen (nur sichtbarer Ausschnitt)
+        for i, (pos, horse) in enumerate(visible):
+            y = 35 + i * 28
             
             # Medaillenfarbe für Top 3
             if pos == 1:
@@ -362,16 +605,74 @@ class RaceUI:
             
             # Position
             pos_text = f"{pos}."
-            pos_surface = self.font_small.render(pos_text, True, pos_color)
-            self.screen.blit(pos_surface, (panel_x + 10, y))
+            pos_surface = render_text(self.font_small, pos_text, pos_color)
+            surface.blit(pos_surface, (10, y))
             
             # Farbindikator
-            pygame.draw.circle(self.screen, horse.color, (panel_x + 45, y + 8), 6)
+            pygame.draw.circle(surface, horse.color, (45, y + 8), 6)
             
             # Name
             name_text = horse.name[:12]
-            name_surface = self.font_small.render(name_text, True, COLORS['white'])
-            self.screen.blit(name_surface, (panel_x + 60, y))
+            name_surface = render_text(self.font_small, name_text, COLORS['white'])
+            surface.blit(name_surface, (60, y))
+        
+        # Scrollbar, wenn nicht alle Pferde in das Panel passen
+        if len(standings) > self.STANDINGS_ROWS:
+            bar_height = self.STANDINGS_ROWS * 28
+            pygame.draw.rect(surface, COLORS['gray'], (local_rect.right - 12, 35, 6, bar_height), border_radius=3)
+            thumb_height = max(20, bar_height * self.STANDINGS_ROWS // len(standings))
+            scroll_ratio = offset / (len(standings) - self.STANDINGS_ROWS)
+            thumb_y = 35 + int(scroll_ratio * (bar_height - thumb_height))
+            pygame.draw.rect(surface, COLORS['gold'], (local_rect.right - 12, thumb_y, 6, thumb_height), border_radius=3)
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self._standings_cache = (key, surface)
+        return surface
+    
+    def _standings_element(self) -> DirtyElement:
+        """Rangliste als Bildelement; ändert sich nur mit dem gecachten Panel."""
+        surface = self._standings_surface()
+        rect = self._standings_rect()
+        return DirtyElement('standings', (id(surface), tuple(rect)), rect,
+                            lambda: self.screen.blit(surface, rect))
+    
+    def draw_standings(self):
+        """Zeichnet die aktuelle Rangliste rechts neben der Strecke."""
+        self.screen.blit(self._standings_surface(), self._standings_rect())
+    
+    def draw_fast_forward(self, progress: float):
+        """
+        Zeichnet die Fortschrittsanzeige beim Vorspulen.
+        
+        Greift nicht auf die Simulation zu, da diese währenddessen im
+        Hintergrund-Thread weiterläuft.
+        """
+        self.draw_track()
+        self._full_redraw = True
+        
+        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        self.screen.blit(overlay, (0, 0))
+        
+        title = render_text(self.font_large, "Rennen wird beendet...", COLORS['white'])
+        self.screen.blit(title, title.get_rect(center=(self.width // 2, self.height // 2 - 50)))
+        
+        # Fortschrittsbalken
+        bar_rect = pygame.Rect(0, 0, 400, 30)
+        bar_rect.center = (self.width // 2, self.height // 2 + 10)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(self.screen, COLORS['dark_gray'], bar_rect, border_radius=8)
+        if fill_rect.width > 0:
+            pygame.draw.rect(self.screen, COLORS['orange'], fill_rect, border_radius=8)
+        pygame.draw.rect(self.screen, COLORS['white'], bar_rect, 2, border_radius=8)
+        
+        percent = render_volatile(self.font_medium, f"{progress * 100:.0f}%", COLORS['white'])
+        self.screen.blit(percent, percent.get_rect(center=(self.width // 2, bar_rect.bottom + 30)))
+        
+        hint = render_text(self.font_small, "ESC - Abbrechen", COLORS['light_gray'])
+        self.screen.blit(hint, hint.get_rect(center=(self.width // 2, bar_rect.bottom + 65)))
     
     def handle_event(self, event: pygame.event.Event) -> str:
         """
@@ -383,6 +684,11 @@ class RaceUI:
         if event.type == pygame.QUIT:
             return 'quit'
         
+        if event.type == pygame.VIDEORESIZE:
+            self.invalidate_background()
+        elif event.type == pygame.VIDEOEXPOSE:
+            self._full_redraw = True
+        
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return 'abort'  # Zurück zum Hauptmenü
@@ -394,6 +700,17 @@ class RaceUI:
                 self.simulation.decrease_speed()
             elif event.key == pygame.K_s:  # S für Skip/Sofort beenden
                 self.skip_to_end = True
+            # Rangliste blättern
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_standings(-self.STANDINGS_ROWS)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_standings(self.STANDINGS_ROWS)
+            elif event.key == pygame.K_HOME:
+                self.standings_scroll = 0
+        
+        # Mausrad über der Rangliste
+        if event.type == pygame.MOUSEWHEEL and self._standings_rect().collidepoint(pygame.mouse.get_pos()):
+            self.scroll_standings(-event.y)
         
         if event.type == pygame.MOUSEMOTION:
             self.pause_button.check_hover(event.pos)
@@ -416,16 +733,89 @@ class RaceUI:
         
         return 'continue'
     
+    def _collect_dirty(self, elements: List[DirtyElement]) -> List[pygame.Rect]:
+        """Alte und neue Bereiche aller Elemente, deren Zustand sich geändert hat."""
+        dirty, self._marked = self._marked, []
+        previous = self._elements
+        for element in elements:
+            old = previous.pop(element.name, None)
+            if old is None:
+                dirty.append(element.rect)
+            elif old.key != element.key or old.rect != element.rect:
+                if old.rect.colliderect(element.rect):
+                    dirty.append(old.rect.union(element.rect))
+                else:
+                    dirty.extend((old.rect, element.rect))
+        # Verschwundene Elemente (z.B. Pause-Hinweis)
+        dirty.extend(element.rect for element in previous.values())
+        return dirty
+    
+    def _update_dirty(self, delta_time: float):
+        """Dirty-Rect-Modus: setzt nur geänderte Bereiche aus Streckenebene und Elementen neu zusammen."""
+        timer = self.frame_timer
+        self._ensure_background()
+        if timer:
+            timer.lap('draw_track')
+        
+        elements = self._horse_elements(delta_time)
+        if timer:
+            timer.lap('draw_horses')
+        elements.extend(self._widget_elements())
+        if timer:
+            timer.lap('draw_ui')
+        elements.append(self._standings_element())
+        if timer:
+            timer.lap('draw_standings')
+        
+        screen = self.screen
+        if self._full_redraw:
+            screen.blit(self._background, (0, 0))
+            for element in elements:
+                element.draw()
+            self._marked = []
+            self._changed = None
+            self._full_redraw = False
+        else:
+            dirty = self._collect_dirty(elements)
+            rects = [element.rect for element in elements]
+            for rect in dirty:
+                # Bereich aus der Streckenebene wiederherstellen und alle
+                # überlappenden Elemente in Zeichenreihenfolge darüberlegen
+                screen.set_clip(rect)
+                screen.blit(self._background, rect, rect)
+                for index in rect.collidelistall(rects):
+                    elements[index].draw()
+            screen.set_clip(None)
+            self._changed = dirty
+        self._elements = {element.name: element for element in elements}
+        if timer:
+            # Wiederherstellen der Bereiche und Übermalen mit den Elementen
+            timer.lap('composite')
+    
     def update(self, delta_time: float):
         """Aktualisiert die Anzeige."""
+        if self.dirty_rects:
+            self._update_dirty(delta_time)
+            return
+        
+        timer = self.frame_timer
         self.draw_track()
+        if timer:
+            timer.lap('draw_track')
         self.draw_horses(delta_time)
+        if timer:
+            timer.lap('draw_horses')
+        # draw_ui misst 'draw_ui' und 'draw_standings' selbst
         self.draw_ui()
 
 
 class ResultsScreen:
     """Ergebnisbildschirm nach dem Rennen."""
     
+    # Konfetti: Dauer des Nachschubs in Sekunden und Partikel pro Sekunde
+    CONFETTI_DURATION = 4.0
+    CONFETTI_RATE = 400
+    
     def __init__(self, screen: pygame.Surface, results, track):
         self.screen = screen
         self.results = results
@@ -462,6 +852,29 @@ class ResultsScreen:
         
         # Animation
         self.animation_time = 0
+        
+        # Konfetti über dem Podium (Podiumsfarben plus Farbe des Siegers)
+        palette = [COLORS['gold'], COLORS['silver'], COLORS['bronze'], COLORS['red'], COLORS['blue']]
+        if results:
+            palette.append(results[0].horse.color)
+        self.confetti = ParticleSystem(
+            (self.width, self.height), palette,
+            radii=(2, 5), capacity=3000, gravity=90.0, shape='rect'
+        )
+        self._confetti_budget = 0.0
+    
+    def _update_confetti(self, delta_time: float):
+        """Erzeugt in den ersten Sekunden neues Konfetti und bewegt das vorhandene."""
+        if self.animation_time < self.CONFETTI_DURATION:
+            self._confetti_budget += self.CONFETTI_RATE * delta_time
+            count = int(self._confetti_budget)
+            self._confetti_budget -= count
+            self.confetti.spawn(
+                count,
+                x=(self.width // 2 - 250, self.width // 2 + 250), y=(-20.0, 0.0),
+                vx=(-40.0, 40.0), vy=(20.0, 120.0), lifetime=(3.0, 6.0)
+            )
+        self.confetti.update(delta_time)
     
     def draw(self, delta_time: float):
         """Zeichnet den Ergebnisbildschirm."""
@@ -470,14 +883,18 @@ class ResultsScreen:
         # Hintergrund
         self.screen.fill((20, 30, 50))
         
+        # Konfetti hinter Titel, Podium und Ergebnisliste
+        self._update_confetti(delta_time)
+        self.confetti.draw(self.screen)
+        
         # Titel mit Animation
-        title = self.font_xlarge.render("*** RENNERGEBNISSE ***", True, COLORS['gold'])
+        title = render_text(self.font_xlarge, "*** RENNERGEBNISSE ***", COLORS['gold'])
         title_rect = title.get_rect(center=(self.width // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Streckenname (mehr Abstand nach unten)
         track_text = f"Strecke: {self.track.name} ({self.track.length:.0f}m)"
-        track_surface = self.font_medium.render(track_text, True, COLORS['light_gray'])
+        track_surface = render_text(self.font_medium, track_text, COLORS['light_gray'])
         track_rect = track_surface.get_rect(center=(self.width // 2, 95))
         self.screen.blit(track_surface, track_rect)
         
@@ -510,7 +927,7 @@ class ResultsScreen:
                 pygame.draw.rect(self.screen, COLORS['white'], podium_rect, 2, border_radius=5)
                 
                 # Position
-                pos_text = self.font_xlarge.render(str(pos), True, COLORS['dark_gray'])
+                pos_text = render_text(self.font_xlarge, str(pos), COLORS['dark_gray'])
                 pos_rect = pos_text.get_rect(center=(x, podium_y + 130 - height // 2))
                 self.screen.blit(pos_text, pos_rect)
                 
@@ -520,13 +937,13 @@ class ResultsScreen:
                 
                 # Name
                 name = result.horse.name[:12]
-                name_surface = self.font_medium.render(name, True, COLORS['white'])
+                name_surface = render_text(self.font_medium, name, COLORS['white'])
                 name_rect = name_surface.get_rect(center=(x, podium_y + 130 - height - 70))
                 self.screen.blit(name_surface, name_rect)
                 
                 # Zeit
                 time_text = f"{result.finish_time:.2f}s"
-                time_surface = self.font_small.render(time_text, True, COLORS['light_gray'])
+                time_surface = render_text(self.font_small, time_text, COLORS['light_gray'])
                 time_rect = time_surface.get_rect(center=(x, podium_y + 145))
                 self.screen.blit(time_surface, time_rect)
     
@@ -548,7 +965,7 @@ class ResultsScreen:
         
         x = table_x
         for header, width in zip(headers, header_widths):
-            header_surface = self.font_small.render(header, True, COLORS['gold'])
+            header_surface = render_text(self.font_small, header, COLORS['gold'])
             self.screen.blit(header_surface, (x, table_y))
             x += width
         
@@ -592,7 +1009,7 @@ class ResultsScreen:
                      COLORS['red'] if result.was_injured else COLORS['green']]
             
             for (text, width, color) in zip(data, header_widths, colors):
-                text_surface = self.font_small.render(text, True, color)
+                text_surface = render_text(self.font_small, text, color)
                 self.screen.blit(text_surface, (x, y))
                 x += width
         
@@ -616,7 +1033,7 @@ class ResultsScreen:
             
             # Scroll-Hinweis (unter dem Container)
             hint = "Pfeiltasten oder Mausrad zum Scrollen"
-            hint_surface = self.font_small.render(hint, True, COLORS['gray'])
+            hint_surface = render_text(self.font_small, hint, COLORS['gray'])
             hint_rect = hint_surface.get_rect(center=(table_x + sum(header_widths) // 2, table_y + visible_height + 25))
             self.screen.blit(hint_surface, hint_rect)
     
@@ -745,9 +1162,9 @@ class DetailedAnalysisScreen:
         fig_speed, ax_speed = plt.subplots(figsize=(9, 2.5), facecolor='#1a1a2e')
         ax_speed.set_facecolor('#16213e')
         
-        if result.speed_over_time:
-            times = [t for t, s in result.speed_over_time]
-            speeds = [s for t, s in result.speed_over_time]
+        if len(result.sample_times):
+            times = result.sample_times
+            speeds = result.speed_samples
             
             ax_speed.plot(times, speeds, color='#00d4ff', linewidth=2, label='Geschwindigkeit')
             ax_speed.fill_between(times, speeds, alpha=0.3, color='#00d4ff')
@@ -784,9 +1201,9 @@ class DetailedAnalysisScreen:
         fig_pos, ax_pos = plt.subplots(figsize=(9, 2.5), facecolor='#1a1a2e')
         ax_pos.set_facecolor('#16213e')
         
-        if result.position_over_time:
-            times = [t for t, p in result.position_over_time]
-            positions = [p for t, p in result.position_over_time]
+        if len(result.sample_times):
+            times = result.sample_times
+            positions = result.position_samples
             
             ax_pos.plot(times, positions, color='#00ff88', linewidth=2, label='Position')
             ax_pos.fill_between(times, positions, alpha=0.3, color='#00ff88')
@@ -799,7 +1216,7 @@ class DetailedAnalysisScreen:
             for injury_time in result.injury_times:
                 # Finde Position bei Verletzung
                 injury_pos = None
-                for t, p in result.position_over_time:
+                for t, p in zip(times, positions):
                     if t >= injury_time:
                         injury_pos = p
                         break
@@ -909,7 +1326,7 @@ class DetailedAnalysisScreen:
         self.screen.fill((20, 30, 50))
         
         # Titel (fixiert oben)
-        title = self.font_large.render("Detaillierte Rennanalyse", True, COLORS['gold'])
+        title = render_text(self.font_large, "Detaillierte Rennanalyse", COLORS['gold'])
         title_rect = title.get_rect(center=(self.width // 2, 40))
         self.screen.blit(title, title_rect)
         
@@ -968,7 +1385,7 @@ class DetailedAnalysisScreen:
         
         # Platzierung
         pos_text = f"#{result.position}"
-        pos_surface = self.font_large.render(pos_text, True, COLORS['gold'])
+        pos_surface = render_text(self.font_large, pos_text, COLORS['gold'])
         self.screen.blit(pos_surface, (120, 115))
         
         # Pferd-Farbe
@@ -976,12 +1393,12 @@ class DetailedAnalysisScreen:
         pygame.draw.circle(self.screen, COLORS['white'], (220, 140), 25, 2)
         
         # Pferdename
-        name_surface = self.font_large.render(result.horse.name, True, COLORS['white'])
+        name_surface = render_text(self.font_large, result.horse.name, COLORS['white'])
         self.screen.blit(name_surface, (270, 115))
         
         # Pferdeauswahl-Hinweis
         hint = f"Pferd {self.selected_horse_index + 1} von {len(self.results)}"
-        hint_surface = self.font_small.render(hint, True, COLORS['light_gray'])
+        hint_surface = render_text(self.font_small, hint, COLORS['light_gray'])
         hint_rect = hint_surface.get_rect(center=(self.width // 2, 165))
         self.screen.blit(hint_surface, hint_rect)
     
@@ -1008,7 +1425,7 @@ class DetailedAnalysisScreen:
         # Scroll-Hinweis
         if self.scroll_offset == 0:
             hint = "↓ Scrollen mit Mausrad"
-            hint_surface = self.font_small.render(hint, True, COLORS['gray'])
+            hint_surface = render_text(self.font_small, hint, COLORS['gray'])
             self.screen.blit(hint_surface, (self.width - 200, self.height - 100))
     
     def _draw_stats_panel(self):
@@ -1028,7 +1445,7 @@ class DetailedAnalysisScreen:
         
         for i, stat in enumerate(stats):
             color = COLORS['red'] if 'Verletzungen' in stat and len(result.injury_times) > 0 else COLORS['white']
-            stat_surface = self.font_small.render(stat, True, color)
+            stat_surface = render_text(self.font_small, stat, color)
             self.screen.blit(stat_surface, (stats_x, stats_y + i * 25))
     
     def handle_event(self, event: pygame.event.Event) -> str:
@@ -0,0 +1,81 @@
+"""
+Gemeinsamer Cache für gerenderte Texte.
+
+font.render rastert die Glyphen bei jedem Aufruf neu. Die Oberfläche
+zeichnet aber Frame für Frame dieselben Texte (Pferdenamen, Platzierungen,
+Buttons, "START", "ZIEL", ...). render_text liefert für gleiche
+(Schrift, Text, Farbe, Antialiasing) die bereits gerenderte Surface aus
+einem größenbegrenzten LRU-Cache.
+
+Texte, die sich laufend ändern (Rennzeit, Messwerte der Leistungsanzeige,
+Fortschritt, Eingabefelder), laufen über render_volatile mit einem eigenen,
+kleinen Cache. Sonst legt jeder Frame einen neuen Eintrag an und verdrängt
+die stabilen Beschriftungen aus dem großen Cache.
+
+Die zurückgegebenen Surfaces werden geteilt und dürfen nicht verändert
+werden (kein fill, set_alpha o. ä.); bei Bedarf vorher .copy() aufrufen.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+
+# Maximale Anzahl gecachter Texte (reicht für Rangliste großer Felder plus Menüs)
+MAX_ENTRIES = 1024
+
+# Laufend wechselnde Texte: gehalten werden nur die zuletzt gezeichneten
+# (mehrfaches Zeichnen im selben Frame, kurzes Hin und Her eines Werts)
+VOLATILE_ENTRIES = 32
+
+_cache: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
+_volatile: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...],
+                antialias: bool = True) -> pygame.Surface:
+    """Wie font.render(text, antialias, color), aber mit Cache (für wiederkehrende Texte)."""
+    key = (font, text, tuple(color), antialias)
+    surface = _cache.get(key)
+    if surface is not None:
+        _cache.move_to_end(key)
+        _stats['hits'] += 1
+        return surface
+
+    _stats['misses'] += 1
+    surface = font.render(text, antialias, color)
+    _cache[key] = surface
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return surface
+
+
+def render_volatile(font: pygame.font.Font, text: str, color: Tuple[int, ...],
+                    antialias: bool = True) -> pygame.Surface:
+    """Wie render_text, aber für laufend wechselnde Texte (eigener kleiner Cache)."""
+    key = (font, text, tuple(color), antialias)
+    surface = _volatile.get(key)
+    if surface is not None:
+        _volatile.move_to_end(key)
+        return surface
+
+    surface = font.render(text, antialias, color)
+    _volatile[key] = surface
+    if len(_volatile) > VOLATILE_ENTRIES:
+        _volatile.popitem(last=False)
+    return surface
+
+
+def clear_text_cache():
+    """Leert den Cache (z. B. nach pygame.quit oder Schriftwechsel)."""
+    _cache.clear()
+    _volatile.clear()
+    _stats['hits'] = 0
+    _stats['misses'] = 0
+
+
+def text_cache_stats() -> Dict[str, int]:
+    """Treffer, Fehlschläge und aktuelle Größe des Caches für wiederkehrende Texte."""
+    return {'hits': _stats['hits'], 'misses': _stats['misses'], 'size': len(_cache),
+            'volatile_size': len(_volatile)}
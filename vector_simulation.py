@@ -0,0 +1,450 @@
+"""
+Vektorisierte Simulations-Engine für große Starterfelder.
+
+Alle Pferdeparameter und der komplette Rennzustand liegen als NumPy-Spalten
+vor (Struct-of-Arrays). Ein Tick rechnet das ganze Feld in einem Schritt,
+statt für jedes Pferd einzeln Horse.get_effective_speed aufzurufen.
+
+Das Modell bildet dieselben Formeln wie Horse.get_effective_speed und
+Horse.check_injury nach, zieht die Zufallszahlen aber gebündelt pro Tick in
+anderer Reihenfolge aus dem Generator des Rennens. Bei gleichem Seed laufen
+die Rennen daher anders als in der Pferd-für-Pferd-Simulation; die Engines
+stimmen nur statistisch überein (Verteilung von Zielzeiten, Tempo und
+Platzierungen), nicht Lauf für Lauf. headless.engine_agreement() prüft das.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pferde.horse import Horse
+from strecken.base_track import Track
+from simulation import RaceSimulation, FIXED_TIME_STEP, speed_summary
+from telemetry import SamplingPolicy
+from snapshot import HORSE_STATE_FIELDS
+
+
+# Streckenfaktoren mit (Sockel, Gewichtung, Pferdeparameter)
+# Entspricht den Modifikator-Blöcken in Horse.get_effective_speed
+TRACK_FACTORS: Dict[str, Tuple[float, float, str]] = {
+    'kurven_faktor': (0.7, 0.3, 'wendigkeit'),
+    'wald_faktor': (0.6, 0.4, 'wald_affinitaet'),
+    'sand_faktor': (0.6, 0.4, 'sand_tauglichkeit'),
+    'sprint_faktor': (0.7, 0.3, 'sprint_faehigkeit'),
+    'urban_faktor': (0.6, 0.4, 'nervenstaerke'),
+}
+
+
+class HorseArrays:
+    """Struct-of-Arrays-Abbild eines Starterfelds."""
+
+    PARAMETERS = (
+        'ausdauer', 'resilienz', 'beschleunigung',
+        'grundgeschwindigkeit', 'wendigkeit', 'wald_affinitaet',
+        'sand_tauglichkeit', 'sprint_faehigkeit', 'bergsteiger',
+        'nervenstaerke', 'gewicht', 'erfahrung', 'motivation',
+    )
+
+    STATE = HORSE_STATE_FIELDS
+
+    def __init__(self, horses: List[Horse]):
+        self.size = len(horses)
+        self.load_parameters(horses)
+
+        # Zustands-Spalten
+        self.position = np.zeros(self.size)
+        self.current_speed = np.zeros(self.size)
+        self.is_injured = np.zeros(self.size, dtype=bool)
+        self.injury_slowdown = np.zeros(self.size)
+        self.res_faktor_slowdown = np.ones(self.size)
+        self.finished = np.zeros(self.size, dtype=bool)
+        self.finish_time = np.zeros(self.size)
+        self.fatigue = np.zeros(self.size)
+        self.momentum = np.zeros(self.size)
+
+    def load_parameters(self, horses: List[Horse]):
+        """Übernimmt die Parameter der Pferde (konstant während eines Rennens)."""
+        for name in self.PARAMETERS:
+            setattr(self, name, np.array([getattr(h, name) for h in horses], dtype=np.float64))
+        self._precompute()
+
+    def _precompute(self):
+        """Berechnet die rennkonstanten Terme aus Horse.get_effective_speed vor."""
+        g = self.grundgeschwindigkeit
+        self.base_speed = g / 10 * (1.0 - (g / 100) ** 1.5 * 0.15)
+        self.fatigue_step = np.maximum(0.01, (g / 100) * 0.3 - (self.ausdauer / 100) * 0.2) * 0.5
+        self.acceleration_term = 0.8 + 0.4 * (self.beschleunigung / 100) * (1 - self.gewicht / 150)
+        self.endurance_loss = (1.0 - self.ausdauer / 100) * 0.3
+        self.sprint_boost = 1.0 + (self.motivation / 100) * 0.2
+        self.motivation_recovery = (self.motivation / 100) * 0.1
+        self.variability = (1.0 - self.erfahrung / 100) * 0.1
+        self.injury_resistance = 1.0 - self.resilienz / 150
+
+    def load_state(self, horses: List[Horse]):
+        """Übernimmt den Simulationszustand aus den Horse-Objekten."""
+        for name in self.STATE:
+            getattr(self, name)[:] = [getattr(h, name) for h in horses]
+
+    def store_state(self, horses: List[Horse]):
+        """Schreibt den Simulationszustand in die Horse-Objekte zurück."""
+        columns = [getattr(self, name).tolist() for name in self.STATE]
+        for i, horse in enumerate(horses):
+            for name, column in zip(self.STATE, columns):
+                setattr(horse, name, column[i])
+
+
+class TrackTables:
+    """Segmentgrenzen, Modifikatoren und Verletzungschancen einer Strecke als Arrays."""
+
+    def __init__(self, track: Track):
+        self.length = track.length
+        infos = track.get_segment_infos()
+
+        self.starts = np.array([info.segment.start for info in infos], dtype=np.float64)
+
+        # Segmenttypen durchnummerieren (für die Segment-Statistik)
+        self.segment_types: List[str] = []
+        type_index = []
+        for info in infos:
+            if info.segment.segment_type not in self.segment_types:
+                self.segment_types.append(info.segment.segment_type)
+            type_index.append(self.segment_types.index(info.segment.segment_type))
+        self.type_index = np.array(type_index, dtype=np.intp)
+
+        # Modifikatoren und Verletzungschance aus dem Segment-Index der Strecke
+        self.modifiers = [info.modifiers for info in infos]
+        self.injury_chance = np.array([info.injury_chance for info in infos], dtype=np.float64)
+
+    def segment_indices(self, relative_positions: np.ndarray) -> np.ndarray:
+        """Ermittelt das Segment für jede relative Position (wie get_segment_at_position)."""
+        indices = np.searchsorted(self.starts, relative_positions, side='right') - 1
+        return np.clip(indices, 0, len(self.starts) - 1)
+
+    def segment_factors(self, field: HorseArrays) -> np.ndarray:
+        """
+        Berechnet den statischen Streckenfaktor je Pferd und Segment.
+
+        Returns:
+            Matrix der Form (Pferde, Segmente)
+        """
+        factors = np.ones((field.size, len(self.modifiers)))
+        for j, modifiers in enumerate(self.modifiers):
+            column = factors[:, j]
+            for key, (offset, weight, parameter) in TRACK_FACTORS.items():
+                if key in modifiers:
+                    column *= (offset + weight * (getattr(field, parameter) / 100)) * modifiers[key]
+            if 'berg_faktor' in modifiers:
+                berg_bonus = (field.bergsteiger / 100) * 0.5 + (field.beschleunigung / 100) * 0.3
+                column *= (0.5 + 0.5 * berg_bonus) * modifiers['berg_faktor']
+        return factors
+
+
+class RunningStatsArray:
+    """
+    Laufende Statistik (Anzahl, Min, Max, Welford-Varianz) für ein ganzes
+    Array von Zählern; Gegenstück zu simulation.RunningStats.
+    """
+
+    def __init__(self, shape):
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+        self.minimum = np.full(shape, np.inf)
+        self.maximum = np.full(shape, -np.inf)
+
+    def add(self, index, values: np.ndarray):
+        """Rechnet Werte ein; `index` darf jeden Zähler höchstens einmal enthalten."""
+        count = self.count[index] + 1
+        mean = self.mean[index]
+        delta = values - mean
+        mean = mean + delta / count
+        self.count[index] = count
+        self.mean[index] = mean
+        self.m2[index] += delta * (values - mean)
+        self.minimum[index] = np.minimum(self.minimum[index], values)
+        self.maximum[index] = np.maximum(self.maximum[index], values)
+
+    def copy(self) -> 'RunningStatsArray':
+        """Unabhängige Kopie aller Zähler."""
+        other = RunningStatsArray(self.count.shape)
+        for name in ('count', 'mean', 'm2', 'minimum', 'maximum'):
+            getattr(other, name)[...] = getattr(self, name)
+        return other
+
+    def std(self, index) -> np.ndarray:
+        """Standardabweichung (Stichprobe) der gewählten Zähler."""
+        count = self.count[index]
+        return np.sqrt(np.where(count > 1, self.m2[index] / np.maximum(count - 1, 1), 0.0))
+
+
+class VectorizedRaceSimulation(RaceSimulation):
+    """
+    RaceSimulation mit vektorisierter NumPy-Engine.
+
+    Die Horse-Objekte werden nur bei Bedarf (Fortschrittsabfrage, Rennende)
+    mit den Arrays synchronisiert, damit große Felder ohne Overhead pro
+    Objekt laufen.
+    """
+
+    def __init__(self, horses: List[Horse], track: Track, seed: Optional[int] = None,
+                 time_step: float = FIXED_TIME_STEP, telemetry_policy: Optional[SamplingPolicy] = None):
+        super().__init__(horses, track, seed, time_step, telemetry_policy)
+        self.field = HorseArrays(horses)
+        self._previous_position_array = np.zeros(self.field.size)
+        self.tables = TrackTables(track)
+        self.segment_factor = self.tables.segment_factors(self.field)
+        self._horse_index = {id(h): i for i, h in enumerate(horses)}
+        self._reset_segment_accumulators()
+        self._horses_synced = True
+
+    def _reset_segment_accumulators(self):
+        """Legt die laufende Statistik als Arrays (Pferde x Segmenttypen) an."""
+        self._segment_stats = RunningStatsArray((self.field.size, len(self.tables.segment_types)))
+        self._speed_stats = RunningStatsArray(self.field.size)
+
+    def _prepare_engine(self):
+        """
+        Lädt Parameter und zurückgesetzten Rennzustand in die Arrays (keine
+        Objekte je Pferd). Wie build_race_profile in der Python-Engine wird
+        bei jedem Start neu gelesen, falls sich Pferdewerte geändert haben.
+        """
+        self.field.load_parameters(self.horses)
+        self.tables = TrackTables(self.track)
+        self.segment_factor = self.tables.segment_factors(self.field)
+        self.field.load_state(self.horses)
+        self._previous_position_array[:] = self.field.position
+        self._reset_segment_accumulators()
+        self._horses_synced = True
+
+    def _advance_horses(self, adjusted_delta: float) -> bool:
+        """Bewegt das gesamte Feld in einem vektorisierten Schritt."""
+        f = self.field
+        length = self.tables.length
+        rng = self.rng.generator
+        prof = self.profiler
+        if prof is not None:
+            t = prof.clock()
+
+        idx = np.flatnonzero(~f.finished)
+        n = idx.size
+        if n == 0:
+            return True
+
+        self._horses_synced = False
+        pos = f.position[idx]
+
+        # Platzierungen aus der nachgeführten Rangfolge (idx ist aufsteigend
+        # sortiert, daher findet searchsorted den Führenden in idx)
+        ranks = self.ranking.ranks[idx]
+        leader_row = self.ranking.leader
+        leader_position = f.position[leader_row]
+        leader = np.searchsorted(idx, leader_row)
+        if prof is not None:
+            t = prof.lap('ranking', t)
+
+        segment = self.tables.segment_indices(pos / length)
+        if prof is not None:
+            t = prof.lap('lookup', t)
+
+        # Verletzungsprüfung
+        healthy = ~f.is_injured[idx]
+        chance = self.tables.injury_chance[segment] * adjusted_delta * 10 * f.injury_resistance[idx]
+        new_injuries = healthy & (rng.random(n) < chance)
+        if new_injuries.any():
+            injured = idx[new_injuries]
+            weakness = 1.0 - f.resilienz[injured] / 100
+            f.is_injured[injured] = True
+            f.injury_slowdown[injured] = 0.1 + weakness * 0.2
+            f.res_faktor_slowdown[injured] = 1 + weakness * 2 + rng.uniform(-0.2, 0.2, injured.size)
+            for i in injured:
+                self.injury_history[self.horses[i].name].append(self.state.elapsed_time)
+        if prof is not None:
+            t = prof.lap('injury', t)
+
+        # Ermüdung
+        fatigue = f.fatigue[idx]
+        speed = f.base_speed[idx] * (1.0 - (fatigue / 100) * 0.4)
+        fatigue = np.minimum(100, fatigue + f.fatigue_step[idx])
+
+        # Windschatten für Verfolger
+        behind = (ranks > 1) & (leader_position > pos)
+        slipstream = np.minimum(0.15, (leader_position - pos) / length * 0.5)
+        speed = np.where(behind, speed * (1.0 + slipstream), speed)
+        fatigue = np.where(behind, np.maximum(0, fatigue - 0.1), fatigue)
+
+        # Führendes Pferd: mehr Druck, aber Momentum
+        momentum = f.momentum[idx]
+        fatigue[leader] = min(100, fatigue[leader] + 0.15)
+        momentum[leader] = min(20, momentum[leader] + 0.1)
+        speed *= 1.0 + momentum / 100
+
+        # Zufällige Leistungsschwankungen
+        speed *= np.clip(rng.normal(1.0, 0.08, n), 0.8, 1.2)
+
+        # Beschleunigungsphase (erste 10% der Strecke)
+        start_phase = pos < length * 0.1
+        if start_phase.any():
+            ramp = (0.5 + 0.5 * (pos / (length * 0.1))) * f.acceleration_term[idx]
+            speed = np.where(start_phase, speed * ramp, speed)
+
+        # Ausdauer-Effekt
+        speed *= 1.0 - f.endurance_loss[idx] * (pos / length)
+
+        # Endspurt (letzte 20%)
+        final_phase = pos > length * 0.8
+        if final_phase.any():
+            speed = np.where(final_phase, speed * f.sprint_boost[idx], speed)
+            fatigue = np.where(final_phase, np.maximum(0, fatigue - f.motivation_recovery[idx]), fatigue)
+
+        # Streckenspezifische Modifikatoren
+        speed *= self.segment_factor[idx, segment]
+
+        # Erfahrung reduziert Variabilität
+        speed *= 1.0 + f.variability[idx] * rng.uniform(-1.0, 1.0, n)
+
+        # Verletzungseffekt
+        injured_now = f.is_injured[idx]
+        if injured_now.any():
+            speed = np.where(
+                injured_now,
+                speed * (1.0 - f.injury_slowdown[idx] * f.res_faktor_slowdown[idx]),
+                speed
+            )
+
+        speed = np.maximum(0.1, speed)
+        f.fatigue[idx] = fatigue
+        f.momentum[idx] = momentum
+        if prof is not None:
+            t = prof.lap('speed', t)
+
+        # Segment-Performance tracken
+        seg_type = self.tables.type_index[segment]
+        self._segment_stats.add((idx, seg_type), speed)
+        self._speed_stats.add(idx, speed)
+        if prof is not None:
+            t = prof.lap('stats', t)
+
+        # Position aktualisieren
+        new_pos = pos + speed * adjusted_delta * 10
+        f.position[idx] = new_pos
+        f.current_speed[idx] = speed
+
+        # Ziellinie überprüfen; Zielzeit innerhalb des Schritts linear
+        # interpolieren und gleichzeitige Ankünfte danach ordnen (Zielfoto)
+        crossed = new_pos >= length
+        if crossed.any():
+            fraction = (length - pos[crossed]) / (new_pos[crossed] - pos[crossed])
+            times = self.state.elapsed_time - adjusted_delta + fraction * adjusted_delta
+            order = np.argsort(times, kind='stable')
+            finishers = idx[crossed][order]
+            f.position[finishers] = length
+            f.finished[finishers] = True
+            f.finish_time[finishers] = times[order]
+            self.finish_order.extend(self.horses[i] for i in finishers)
+        if prof is not None:
+            t = prof.lap('movement', t)
+
+        self._update_ranking()
+        if prof is not None:
+            t = prof.lap('ranking', t)
+
+        # Statistiken speichern (direkt aus den Spalten, nach der Rangfolge)
+        if self.telemetry_policy.enabled and self.telemetry_policy.should_sample(self):
+            self.telemetry.record(self.state.elapsed_time, idx, speed=speed, position=f.position[idx])
+        if prof is not None:
+            prof.lap('telemetry', t)
+        return False
+
+    def _update_ranking(self, reset: bool = False):
+        """Führt die Rangfolge direkt aus den Spalten nach."""
+        if reset:
+            self.ranking.reset(self.field.position, self.field.finished)
+        else:
+            self.ranking.update(self.field.position, self.field.finished)
+
+    def _sync_horses(self):
+        """Überträgt den Array-Zustand auf die Horse-Objekte."""
+        if not self._horses_synced:
+            self.field.store_state(self.horses)
+            self._horses_synced = True
+
+    def _finalize_race(self):
+        """Finalisiert das Rennen und erstellt die Ergebnisliste."""
+        self._sync_horses()
+        super()._finalize_race()
+
+    def get_horse_columns(self, names: Tuple[str, ...]) -> List[np.ndarray]:
+        """Zustandsspalten direkt aus den Arrays (Views, nicht verändern)."""
+        return [getattr(self.field, name) for name in names]
+
+    def _capture_horse_state(self) -> Dict[str, np.ndarray]:
+        """Zustandsspalten direkt aus den Arrays."""
+        return {name: getattr(self.field, name).copy() for name in HorseArrays.STATE}
+
+    def _restore_horse_state(self, columns: Dict[str, np.ndarray]):
+        for name in HorseArrays.STATE:
+            getattr(self.field, name)[:] = columns[name]
+        self.field.store_state(self.horses)
+        self._horses_synced = True
+
+    def _capture_previous_positions(self) -> np.ndarray:
+        return self._previous_position_array.copy()
+
+    def _restore_previous_positions(self, positions: np.ndarray):
+        self._previous_position_array[:] = positions
+
+    def _capture_statistics(self) -> Dict[str, RunningStatsArray]:
+        return {'speed': self._speed_stats.copy(), 'segments': self._segment_stats.copy()}
+
+    def _restore_statistics(self, statistics: Dict[str, RunningStatsArray]):
+        self._speed_stats = statistics['speed'].copy()
+        self._segment_stats = statistics['segments'].copy()
+
+    def _speed_summary(self, horse: Horse) -> Tuple[float, float]:
+        """Gibt (Durchschnitt, Maximum) der Geschwindigkeit eines Pferdes zurück."""
+        i = self._horse_index[id(horse)]
+        if not self._speed_stats.count[i]:
+            return 0.0, 0.0
+        return float(self._speed_stats.mean[i]), float(self._speed_stats.maximum[i])
+
+    def _segment_performance(self, horse: Horse) -> Dict[str, Dict]:
+        """Fasst die Segment-Statistik eines Pferdes aus den Arrays zusammen."""
+        i = self._horse_index[id(horse)]
+        stats = self._segment_stats
+        std = stats.std(i)
+        return {
+            segment_type: speed_summary(
+                int(stats.count[i, j]), float(stats.mean[i, j]),
+                float(stats.minimum[i, j]), float(stats.maximum[i, j]), float(std[j])
+            )
+            for j, segment_type in enumerate(self.tables.segment_types)
+            if stats.count[i, j]
+        }
+
+    def get_current_standings(self) -> List[tuple]:
+        """Gibt die aktuelle Reihenfolge der Pferde zurück."""
+        self._sync_horses()
+        return super().get_current_standings()
+
+    def get_progress(self) -> Dict[str, float]:
+        """Gibt den Fortschritt aller Pferde als Prozent zurück."""
+        self._sync_horses()
+        return super().get_progress()
+
+    def get_trailing_position(self) -> float:
+        """Position des letzten noch laufenden Pferdes (Streckenlänge, wenn alle im Ziel)."""
+        if not len(self.ranking):
+            return self.tables.length
+        return float(self.field.position[self.ranking.order[-1]])
+
+    def _remember_positions(self):
+        """Merkt sich die Positionen vor dem nächsten Schritt für die Interpolation."""
+        self._previous_position_array[:] = self.field.position
+
+    def get_interpolated_progress(self) -> Dict[str, float]:
+        """Gibt den zwischen den letzten beiden Schritten interpolierten Fortschritt zurück."""
+        self._sync_horses()
+        previous = self._previous_position_array
+        positions = previous + (self.field.position - previous) * self.interpolation_alpha
+        percent = np.minimum(100, positions / self.tables.length * 100).tolist()
+        return {horse.name: p for horse, p in zip(self.horses, percent)}